@@ -0,0 +1,194 @@
+"""
+Measures compute client throughput against a local stand-in Computer.
+
+Run from the repository root:
+
+    python benchmarks/bench_client_throughput.py
+    python benchmarks/bench_client_throughput.py --results 5000 --latency 0.01
+    python benchmarks/bench_client_throughput.py --setup-phases 2 --drain-every 10
+
+The stand-in (``stub_computer.py``) runs in a child process, so the CPU time
+of this process is the client's own. For ``runSolver``,
+``waitForProblemReady`` and ``runSolverBatch`` it reports calls per second,
+p50/p99 call latency and client CPU per call; the batch row also reports
+solves per second, and ``errors`` counts solves that ran out of drain
+retries. Track these numbers across changes to catch overhead
+regressions in the client.
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from stub_computer import (  # noqa: E402
+    StubComputer,
+    add_config_arguments,
+    config_from_arguments,
+)
+
+from solverai.SolverAiComputeInput import OBJECTIVE  # noqa: E402
+from solverai import (  # noqa: E402
+    SolverAiClientCompute,
+    SolverAiComputeInput,
+    SolverAiDrainingException,
+    SolverAiFixedPolling,
+    SolverAiResultsParserPool,
+    SolverAiSetupWaitStrategy,
+    SolverAiTransport,
+)
+
+SCENARIOS = ('runSolver', 'waitForProblemReady', 'runSolverBatch')
+
+
+def _serve(config, urls):
+    stub = StubComputer(config)
+    urls.put(stub.url)
+    stub.serveForever()
+
+
+def start_stub_process(config):
+    context = multiprocessing.get_context('spawn')
+    urls = context.Queue()
+    process = context.Process(target=_serve, args=(config, urls), daemon=True)
+    process.start()
+    return process, urls.get(timeout=30)
+
+
+def build_input(n_inputs):
+    compute_input = SolverAiComputeInput('problem-1')
+    for index in range(n_inputs):
+        compute_input.addInput(f'x{index}', 0.0, 1.0 + index)
+    compute_input.addObjective('y0', OBJECTIVE.MINIMIZE)
+    return compute_input
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(call, calls, warmup):
+    """Times ``calls`` calls of ``call``, which returns its error count."""
+    for _ in range(warmup):
+        call()
+    latencies = []
+    errors = 0
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for _ in range(calls):
+        call_started = time.perf_counter()
+        errors += call()
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    latencies.sort()
+    return {
+        'calls': calls,
+        'per_second': calls / elapsed,
+        'p50': percentile(latencies, 0.50),
+        'p99': percentile(latencies, 0.99),
+        'cpu_per_call': cpu / calls,
+        'errors': errors,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    add_config_arguments(parser)
+    parser.add_argument('--calls', type=int, default=200,
+                        help='timed calls per scenario')
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--parser-workers', type=int, default=0,
+                        help='parse results in this many worker processes')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS,
+                        default=list(SCENARIOS))
+    args = parser.parse_args(argv)
+
+    config = config_from_arguments(args)
+    process, url = start_stub_process(config)
+    results_parser = None
+    if args.parser_workers:
+        results_parser = SolverAiResultsParserPool(
+            max_workers=args.parser_workers,
+            min_body_bytes=0,
+        )
+    client = SolverAiClientCompute(
+        url,
+        'token',
+        'problem-1',
+        drain_max_retries=3,
+        drain_retry_default_seconds=0,
+        transport=SolverAiTransport(pool_maxsize=args.concurrency),
+        setup_wait_strategy=SolverAiSetupWaitStrategy(SolverAiFixedPolling(0)),
+        results_parser=results_parser,
+    )
+    compute_input = build_input(args.inputs)
+    batch = [compute_input] * args.batch_size
+
+    def counting_errors(function):
+        # Drains beyond the retry budget are the client working as designed
+        def call():
+            try:
+                function()
+            except SolverAiDrainingException:
+                return 1
+            return 0
+        return call
+
+    def run_batch():
+        results = client.runSolverBatch(batch, args.concurrency)
+        errors = [item for item in results if isinstance(item, Exception)]
+        for error in errors:
+            if not isinstance(error, SolverAiDrainingException):
+                raise error
+        return len(errors)
+
+    calls = {
+        'runSolver': counting_errors(lambda: client.runSolver(compute_input)),
+        'waitForProblemReady': counting_errors(lambda: client.waitForProblemReady(
+            polling_strategy=SolverAiFixedPolling(0),
+        )),
+        'runSolverBatch': run_batch,
+    }
+
+    print(
+        f'{args.results} results x {args.inputs} inputs / {args.outputs} outputs, '
+        f'latency {args.latency * 1000:.1f} ms, setup phases {args.setup_phases}, '
+        f'drain every {args.drain_every or "-"}'
+    )
+    print(f'{"scenario":<22}{"calls":>7}{"calls/s":>10}{"solves/s":>10}'
+          f'{"p50 ms":>9}{"p99 ms":>9}{"CPU ms/call":>13}{"errors":>8}')
+    try:
+        for scenario in args.scenarios:
+            calls_per_run = args.calls
+            if scenario == 'runSolverBatch':
+                calls_per_run = max(1, args.calls // args.batch_size)
+            stats = measure(calls[scenario], calls_per_run, min(args.warmup, calls_per_run))
+            solves = {
+                'runSolver': stats['per_second'],
+                'waitForProblemReady': None,
+                'runSolverBatch': stats['per_second'] * args.batch_size,
+            }[scenario]
+            print(
+                f'{scenario:<22}{stats["calls"]:>7}{stats["per_second"]:>10.1f}'
+                f'{"-" if solves is None else f"{solves:.1f}":>10}'
+                f'{stats["p50"] * 1000:>9.2f}{stats["p99"] * 1000:>9.2f}'
+                f'{stats["cpu_per_call"] * 1000:>13.3f}{stats["errors"]:>8}'
+            )
+    finally:
+        client.close()
+        if results_parser is not None:
+            results_parser.close()
+        process.terminate()
+        process.join()
+
+
+if __name__ == '__main__':
+    main()
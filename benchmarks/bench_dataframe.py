@@ -0,0 +1,104 @@
+"""
+Compares building a results DataFrame against the previous list path.
+
+Run from the repository root:
+
+    python benchmarks/bench_dataframe.py
+    python benchmarks/bench_dataframe.py --results 100000 --inputs 20 --shared 2
+
+Times ``getDataFrame()`` on decoded results: the previous path (rows
+filtered and concatenated as lists, dtypes inferred by pandas), the default
+single-copy build and ``copy=False`` views, next to one bare
+``np.concatenate`` of the two blocks. ``--shared`` names that many inputs
+like outputs, so they are dropped from the frame.
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from stub_computer import build_results  # noqa: E402
+
+from solverai.SolverAiComputeResults import SolverAiComputeResults  # noqa: E402
+from solverai.SolverAiNumericParser import np  # noqa: E402
+
+import pandas as pd  # noqa: E402
+
+
+def legacy_dataframe(results):
+    inputVariableNames = results.getInputVariableNames()
+    outputVariableNames = results.getOutputVariableNames()
+    X = results.getX()
+    keep_idx = \
+        [i for i, variable in enumerate(inputVariableNames) if variable not in outputVariableNames]
+    if len(keep_idx) != len(inputVariableNames):
+        inputVariableNames = [inputVariableNames[i] for i in keep_idx]
+        X = [[row[i] for i in keep_idx] for row in X]
+    all_data = [x + y for x, y in zip(X, results.getY())]
+    return pd.DataFrame(all_data, columns=inputVariableNames + outputVariableNames)
+
+
+def build_results_object(args):
+    payload = build_results(args.results, args.inputs, args.outputs)
+    inputs = [f'x{i}' for i in range(args.inputs)]
+    inputs[:args.shared] = [f'y{i}' for i in range(args.shared)]
+    payload['Input Variable Names'] = str(inputs)
+    return SolverAiComputeResults(payload).compact()
+
+
+def best_seconds(function, setup, repeat):
+    """Best of ``repeat`` runs of ``function(setup())``, timing only the call."""
+    times = []
+    for _ in range(repeat):
+        argument = setup()
+        times.append(timeit.timeit(lambda: function(argument), number=1))
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--results', type=int, default=100000)
+    parser.add_argument('--inputs', type=int, default=10)
+    parser.add_argument('--outputs', type=int, default=3)
+    parser.add_argument('--shared', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error('numpy is required for this benchmark')
+
+    template = build_results_object(args)
+    X, Y = template.getXArray(), template.getYArray()
+
+    def fresh():
+        # A new object around the same blocks, so no layout is cached yet
+        return SolverAiComputeResults._fromParsed(
+            {
+                'Number Of Results': args.results,
+                'Objective Variable Names': str(template.getObjectiveVariableNames()),
+                'Constraint Variable Names': '[]',
+                'Input Variable Names': str(template.getInputVariableNames()),
+                'Output Variable Names': str(template.getOutputVariableNames()),
+            },
+            X,
+            Y,
+        )
+
+    paths = [
+        ('np.concatenate (baseline)', lambda _: np.concatenate((X, Y), axis=1), fresh),
+        ('previous list path', legacy_dataframe, fresh),
+        ('getDataFrame()', lambda results: results.getDataFrame(), fresh),
+        ('getDataFrame(copy=False)', lambda results: results.getDataFrame(copy=False), fresh),
+    ]
+
+    print(f'{args.results} results x {args.inputs} inputs / {args.outputs} outputs, '
+          f'{args.shared} shared ({X.nbytes + Y.nbytes:,} bytes of blocks)')
+    print(f'{"path":<28}{"ms":>10}')
+    for name, function, setup in paths:
+        seconds = best_seconds(function, setup, args.repeat)
+        print(f'{name:<28}{seconds * 1000:>10.2f}')
+
+
+if __name__ == '__main__':
+    main()
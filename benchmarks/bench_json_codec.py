@@ -0,0 +1,106 @@
+"""
+Compares the installed JSON codecs on representative solve payloads.
+
+Run from the repository root:
+
+    python benchmarks/bench_json_codec.py
+    python benchmarks/bench_json_codec.py --results 20000 --inputs 200
+
+For every codec it times encoding a ``solvejson/`` request and decoding a
+``solvejson/`` response, and reports throughput and speed-up over the
+standard library codec.
+"""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from solverai.SolverAiJsonCodec import (  # noqa: E402
+    available_json_codecs,
+    new_json_codec,
+)
+
+
+def build_solve_request(n_inputs):
+    rng = random.Random(0)
+    inputs = {}
+    for index in range(n_inputs):
+        low = rng.uniform(-100, 100)
+        inputs[f'x{index}'] = {'Min': low, 'Max': low + rng.uniform(1, 50)}
+    return {
+        'id': 'problem-1',
+        'solverSetup': {'maxTime': 60, 'populationSize': 100},
+        'inputs': inputs,
+        'constraints': {
+            f'c{index}': {'Operation': 'smaller than', 'Value1': rng.random()}
+            for index in range(n_inputs // 4)
+        },
+        'objectives': {'y0': {'Operation': 'minimize'}},
+        'isDebug': False,
+    }
+
+
+def build_solve_response(n_results, n_inputs, n_outputs):
+    rng = random.Random(1)
+    results = {
+        'Number Of Results': n_results,
+        'Objective Variable Names': "['y0']",
+        'Constraint Variable Names': '[]',
+        'Input Variable Names': str([f'x{i}' for i in range(n_inputs)]),
+        'Output Variable Names': str([f'y{i}' for i in range(n_outputs)]),
+    }
+    for index in range(n_results):
+        results[f'X{index}'] = str([rng.uniform(-100, 100) for _ in range(n_inputs)])
+        results[f'Y{index}'] = str([rng.uniform(-100, 100) for _ in range(n_outputs)])
+    return {'results': results}
+
+
+def best_seconds(function, repeat, number):
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--results', type=int, default=5000)
+    parser.add_argument('--inputs', type=int, default=50)
+    parser.add_argument('--outputs', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    request = build_solve_request(args.inputs)
+    response_bytes = new_json_codec('json').dumps(
+        build_solve_response(args.results, args.inputs, args.outputs)
+    )
+    request_size = len(new_json_codec('json').dumps(request))
+
+    print(
+        f'request: {request_size / 1024:.1f} KiB, '
+        f'response: {len(response_bytes) / 1024 / 1024:.2f} MiB'
+    )
+    print(f'{"codec":<10}{"encode ms":>12}{"decode ms":>12}'
+          f'{"decode MiB/s":>15}{"speed-up":>10}')
+
+    baseline = None
+    for name in reversed(available_json_codecs()):
+        codec = new_json_codec(name)
+        encode = best_seconds(
+            lambda: codec.dumps(request), args.repeat, args.number * 20
+        )
+        decode = best_seconds(
+            lambda: codec.loads(response_bytes), args.repeat, args.number
+        )
+        if baseline is None:
+            baseline = encode + decode
+        throughput = len(response_bytes) / decode / 1024 / 1024
+        print(
+            f'{name:<10}{encode * 1000:>12.3f}{decode * 1000:>12.3f}'
+            f'{throughput:>15.1f}{baseline / (encode + decode):>9.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Times the Pareto analytics on random objective values.
+
+Run from the repository root:
+
+    python benchmarks/bench_pareto.py
+    python benchmarks/bench_pareto.py --points 10000 100000 --objectives 2 3 4
+
+For every size and objective count it times non-dominated ranking,
+crowding distances and (for 2 and 3 objectives) the hypervolume, and prints
+the number of fronts found. A pure Python non-dominated sort, comparing
+every pair of points front by front, is timed once on ``--baseline-points``
+points; it grows quadratically, so it is not run on the full sizes.
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from solverai.SolverAiNumericParser import np  # noqa: E402
+from solverai.SolverAiPareto import (  # noqa: E402
+    crowding_distances,
+    hypervolume,
+    non_dominated_ranks,
+)
+
+
+def python_ranks(points):
+    ranks = [0] * len(points)
+    remaining = list(range(len(points)))
+    rank = 0
+    while remaining:
+        front = [
+            i for i in remaining
+            if not any(
+                all(a <= b for a, b in zip(points[j], points[i])) and points[j] != points[i]
+                for j in remaining
+            )
+        ]
+        for i in front:
+            ranks[i] = rank
+        chosen = set(front)
+        remaining = [i for i in remaining if i not in chosen]
+        rank += 1
+    return ranks
+
+
+def best_seconds(function, repeat):
+    return min(timeit.repeat(function, repeat=repeat, number=1))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--points', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--objectives', type=int, nargs='+', default=[2, 3])
+    parser.add_argument('--baseline-points', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error('numpy is required for this benchmark')
+    rng = np.random.default_rng(args.seed)
+
+    print(f'{"points":>8}{"objectives":>12}{"fronts":>8}{"rank ms":>10}'
+          f'{"crowding ms":>13}{"hypervolume ms":>16}')
+    for count in args.points:
+        for objectives in args.objectives:
+            F = rng.random((count, objectives))
+            ranks = non_dominated_ranks(F)
+            rank_seconds = best_seconds(lambda: non_dominated_ranks(F), args.repeat)
+            crowding_seconds = best_seconds(
+                lambda: crowding_distances(F, ranks),
+                args.repeat,
+            )
+            if objectives in (2, 3):
+                reference = np.ones(objectives)
+                volume = best_seconds(lambda: hypervolume(F, reference), args.repeat)
+                volume = f'{volume * 1000:>16.1f}'
+            else:
+                volume = f'{"-":>16}'
+            print(f'{count:>8}{objectives:>12}{ranks.max() + 1:>8}'
+                  f'{rank_seconds * 1000:>10.1f}{crowding_seconds * 1000:>13.1f}{volume}')
+
+    if args.baseline_points:
+        for objectives in args.objectives:
+            F = rng.random((args.baseline_points, objectives))
+            points = F.tolist()
+            python = best_seconds(lambda: python_ranks(points), 1)
+            vectorized = best_seconds(lambda: non_dominated_ranks(F), args.repeat)
+            print(f'{args.baseline_points} points, {objectives} objectives: '
+                  f'pure Python sort {python * 1000:.1f} ms, '
+                  f'non_dominated_ranks {vectorized * 1000:.1f} ms '
+                  f'({python / vectorized:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Compares solve result parsing against the previous literal_eval path.
+
+Run from the repository root:
+
+    python benchmarks/bench_results_parsing.py
+    python benchmarks/bench_results_parsing.py --results 5000 --inputs 200
+
+Times parsing the ``X{i}``/``Y{i}`` strings of one solve response with one
+``literal_eval`` per row (the previous ``SolverAiComputeResults`` path),
+with ``parse_rows`` into lists, and with ``parse_numeric_array`` into
+float64 NumPy arrays, for every installed JSON codec.
+"""
+import argparse
+import sys
+import timeit
+from ast import literal_eval
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_json_codec import build_solve_response  # noqa: E402
+
+from solverai.SolverAiJsonCodec import (  # noqa: E402
+    available_json_codecs,
+    set_json_codec,
+)
+from solverai.SolverAiNumericParser import (  # noqa: E402
+    np,
+    parse_numeric_array,
+    parse_rows,
+)
+
+
+def best_seconds(function, repeat):
+    return min(timeit.repeat(function, repeat=repeat, number=1))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--results', type=int, default=5000)
+    parser.add_argument('--inputs', type=int, default=200)
+    parser.add_argument('--outputs', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = build_solve_response(args.results, args.inputs, args.outputs)['results']
+    blocks = [
+        [results[f'{prefix}{index}'] for index in range(args.results)]
+        for prefix in ('X', 'Y')
+    ]
+    values = args.results * (args.inputs + args.outputs)
+
+    legacy = best_seconds(
+        lambda: [[list(literal_eval(row)) for row in rows] for rows in blocks],
+        args.repeat,
+    )
+    print(f'{args.results} results x {args.inputs} inputs / '
+          f'{args.outputs} outputs ({values / 1e6:.2f}M values)')
+    print(f'{"path":<28}{"ms":>10}{"Mvalues/s":>12}{"speed-up":>10}')
+    print(f'{"literal_eval per row":<28}{legacy * 1000:>10.1f}'
+          f'{values / legacy / 1e6:>12.2f}{1:>9.2f}x')
+
+    paths = [('parse_rows', parse_rows)]
+    if np is not None:
+        paths.append(('parse_numeric_array', parse_numeric_array))
+    try:
+        for codec in available_json_codecs():
+            set_json_codec(codec)
+            for name, function in paths:
+                seconds = best_seconds(
+                    lambda: [function(rows) for rows in blocks],
+                    args.repeat,
+                )
+                label = f'{name} ({codec})'
+                print(f'{label:<28}{seconds * 1000:>10.1f}'
+                      f'{values / seconds / 1e6:>12.2f}{legacy / seconds:>9.2f}x')
+    finally:
+        set_json_codec()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+"""
+Local stand-in for the Computer, for benchmarks and manual testing.
+
+Run from the repository root:
+
+    python benchmarks/stub_computer.py --port 8001 --latency 0.005
+    python benchmarks/stub_computer.py --results 5000 --setup-phases 2
+
+Serves ``solvejson/``, ``check_problem_status/<id>`` and
+``problem_setup/<id>`` for any problem id and token over keep-alive
+HTTP/1.1. Response bodies are built once up front, so the server spends as
+little CPU per request as possible and client overhead dominates what a
+benchmark measures.
+
+Behaviour is set by ``StubComputerConfig``:
+
+- ``latency_seconds`` (plus up to ``latency_jitter_seconds``) is slept
+  before every response
+- ``results`` x ``inputs`` / ``outputs`` sizes the solve response
+- ``setup_phases``: of every ``setup_phases + 1`` requests to an endpoint,
+  the first ``setup_phases`` answer ``202`` setup in execution (the status
+  endpoint answers ``"Setup in execution"``), so a sequential
+  ``waitForProblemReady`` sees that many polls before READY
+- ``drain_every``: every n-th solve or problem setup request answers
+  ``503`` ``Draining``, with a ``Retry-After`` of ``retry_after_seconds``
+  when that is set
+- ``gzip``: compress solve responses for clients accepting gzip
+"""
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from typing import Optional
+
+# Status polls have no drain handling in the client; a draining Computer
+# still answers them
+DRAINING_ENDPOINTS = ('solvejson', 'problem_setup')
+
+
+@dataclass(frozen=True)
+class StubComputerConfig:
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    results: int = 100
+    inputs: int = 10
+    outputs: int = 3
+    setup_phases: int = 0
+    drain_every: int = 0
+    retry_after_seconds: Optional[float] = 0.0
+    gzip: bool = False
+
+
+def build_results(n_results, n_inputs, n_outputs, seed=1):
+    rng = random.Random(seed)
+    results = {
+        'Number Of Results': n_results,
+        'Objective Variable Names': "['y0']",
+        'Constraint Variable Names': '[]',
+        'Input Variable Names': str([f'x{i}' for i in range(n_inputs)]),
+        'Output Variable Names': str([f'y{i}' for i in range(n_outputs)]),
+    }
+    for index in range(n_results):
+        results[f'X{index}'] = str([rng.uniform(-100, 100) for _ in range(n_inputs)])
+        results[f'Y{index}'] = str([rng.uniform(-100, 100) for _ in range(n_outputs)])
+    return results
+
+
+def _json_bytes(data) -> bytes:
+    return json.dumps(data).encode('utf-8')
+
+
+class _StubComputerHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.__handle()
+
+    def do_POST(self):
+        self.__handle()
+
+    def __handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        stub = self.server.stub
+        path = self.path.split('?', 1)[0].strip('/')
+        endpoint = path.split('/', 1)[0]
+        if endpoint not in stub.bodies:
+            return self.__send(404, _json_bytes('Not found'))
+
+        stub.sleepLatency()
+        number = next(stub.counters[endpoint])
+        config = stub.config
+        drains = config.drain_every and endpoint in DRAINING_ENDPOINTS
+        if drains and next(stub.request_numbers) % config.drain_every == 0:
+            headers = {}
+            if config.retry_after_seconds is not None:
+                headers['Retry-After'] = f'{config.retry_after_seconds:g}'
+            return self.__send(503, stub.draining_body, headers)
+        if config.setup_phases and number % (config.setup_phases + 1) < config.setup_phases:
+            return self.__send(202, stub.setup_body)
+
+        body = stub.bodies[endpoint]
+        headers = {}
+        if endpoint == 'solvejson' and stub.gzip_solve_body is not None:
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = stub.gzip_solve_body
+                headers['Content-Encoding'] = 'gzip'
+        self.__send(200, body, headers)
+
+    def __send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubComputer:
+    """
+    A ``StubComputerConfig`` served on ``host:port`` (port 0 picks a free
+    one) from a background thread; ``url`` is the ``computerUrl`` to give
+    the compute clients.
+    """
+
+    def __init__(
+        self,
+        config: Optional[StubComputerConfig] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+    ) -> None:
+        if config is None:
+            config = StubComputerConfig()
+        self.config = config
+        self.bodies = {
+            'solvejson': _json_bytes({
+                'results': build_results(config.results, config.inputs, config.outputs),
+            }),
+            'check_problem_status': _json_bytes('Ready'),
+            'problem_setup': _json_bytes({
+                'inputs': {f'x{i}': {} for i in range(config.inputs)},
+                'outputs': {f'y{i}': {} for i in range(config.outputs)},
+            }),
+        }
+        self.gzip_solve_body = None
+        if config.gzip:
+            self.gzip_solve_body = gzip.compress(self.bodies['solvejson'])
+        self.setup_body = _json_bytes('Setup in execution')
+        self.draining_body = _json_bytes({'detail': 'Draining'})
+        self.counters = {endpoint: count() for endpoint in self.bodies}
+        self.request_numbers = count(1)
+        self.__random = random.Random()
+
+        self.__server = ThreadingHTTPServer((host, port), _StubComputerHandler)
+        self.__server.daemon_threads = True
+        self.__server.stub = self
+        self.__thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def solve_body_bytes(self) -> int:
+        return len(self.bodies['solvejson'])
+
+    def sleepLatency(self) -> None:
+        latency = self.config.latency_seconds
+        if self.config.latency_jitter_seconds:
+            latency += self.__random.uniform(0, self.config.latency_jitter_seconds)
+        if latency > 0:
+            time.sleep(latency)
+
+    def start(self) -> 'StubComputer':
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever,
+            name='stub-computer',
+            daemon=True,
+        )
+        self.__thread.start()
+        return self
+
+    def serveForever(self) -> None:
+        self.__server.serve_forever()
+
+    def close(self) -> None:
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+        self.__server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def add_config_arguments(parser):
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds slept before every response')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='extra random latency, up to this many seconds')
+    parser.add_argument('--results', type=int, default=100)
+    parser.add_argument('--inputs', type=int, default=10)
+    parser.add_argument('--outputs', type=int, default=3)
+    parser.add_argument('--setup-phases', type=int, default=0,
+                        help='202 responses before each 200, per endpoint')
+    parser.add_argument('--drain-every', type=int, default=0,
+                        help='answer every n-th request with 503 Draining')
+    parser.add_argument('--retry-after', type=float, default=0.0,
+                        help='Retry-After seconds sent with 503 Draining')
+    parser.add_argument('--gzip', action='store_true',
+                        help='gzip solve responses')
+
+
+def config_from_arguments(args) -> StubComputerConfig:
+    return StubComputerConfig(
+        latency_seconds=args.latency,
+        latency_jitter_seconds=args.jitter,
+        results=args.results,
+        inputs=args.inputs,
+        outputs=args.outputs,
+        setup_phases=args.setup_phases,
+        drain_every=args.drain_every,
+        retry_after_seconds=args.retry_after,
+        gzip=args.gzip,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    add_config_arguments(parser)
+    args = parser.parse_args(argv)
+
+    stub = StubComputer(config_from_arguments(args), args.host, args.port)
+    print(f'stand-in Computer on {stub.url} '
+          f'(solve response {stub.solve_body_bytes / 1024:.1f} KiB)')
+    try:
+        stub.serveForever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.close()
+
+
+if __name__ == '__main__':
+    main()
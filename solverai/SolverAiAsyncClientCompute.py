@@ -0,0 +1,432 @@
+import asyncio
+from asyncio import sleep
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import replace
+from functools import partial
+from time import monotonic, perf_counter
+from typing import Optional
+
+from .SolverAiCircuitBreaker import SolverAiCircuitBreaker
+from .SolverAiClientCompute import (
+    SolverAiClientCompute,
+    SolverAiProblemStatusInfo,
+)
+from .SolverAiComputeInput import SolverAiComputeInput
+from .SolverAiComputeResults import SolverAiComputeResults
+from .SolverAiClientExceptions import (
+    SetupInExecutionException,
+    SolverAiDrainingException,
+    SolverAiWaitTimeoutError,
+)
+from .SolverAiDeadline import SolverAiTimeouts, check_deadline, check_wait
+from .SolverAiDrainCoordinator import SolverAiDrainCoordinator
+from .SolverAiHedging import SolverAiHedgingPolicy
+from .SolverAiInputsOutputsCache import SolverAiInputsOutputsCache
+from .SolverAiInstrumentation import SolverAiInstrumentation, active_recorder
+from .SolverAiPollingStrategy import (
+    SolverAiPollingStrategy,
+    SolverAiSetupWaitStrategy,
+)
+from .SolverAiRateLimiter import SolverAiRateLimiter
+from .SolverAiResultCache import SolverAiResultCache
+from .SolverAiResultsParser import SolverAiResultsParserPool
+from .SolverAiSingleFlight import SolverAiSingleFlight
+from .SolverAiTransport import SolverAiTransport
+
+
+class SolverAiAsyncClientCompute:
+    """
+    asyncio counterpart to ``SolverAiClientCompute``.
+
+    Request building, response handling and the drain retry policy are shared
+    with the synchronous client, so both surfaces behave identically. Every
+    wait (drain retry, ``Retry-After``, 202 setup retry, readiness polling)
+    is an ``asyncio.sleep`` and costs a coroutine rather than a thread.
+
+    The blocking HTTP exchange itself runs on a private executor sized to the
+    transport's ``pool_maxsize`` by default, so the number of I/O threads
+    tracks the number of pooled connections, not the number of solves in
+    flight.
+    """
+
+    def __init__(
+        self,
+        computerUrl: str,
+        token: str,
+        problemId: str,
+        drain_max_retries: int = 1,
+        drain_retry_default_seconds: float = 60,
+        honor_retry_after: bool = True,
+        drain_max_wait_seconds: Optional[float] = None,
+        transport: Optional[SolverAiTransport] = None,
+        result_cache: Optional[SolverAiResultCache] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        max_workers: Optional[int] = None,
+        stream_results: bool = False,
+        instrumentation: Optional[SolverAiInstrumentation] = None,
+        drain_coordinator: Optional[SolverAiDrainCoordinator] = None,
+        inputs_outputs_cache: Optional[SolverAiInputsOutputsCache] = None,
+        rate_limiter: Optional[SolverAiRateLimiter] = None,
+        circuit_breaker: Optional[SolverAiCircuitBreaker] = None,
+        hedging_policy: Optional[SolverAiHedgingPolicy] = None,
+        timeouts: Optional[SolverAiTimeouts] = None,
+        single_flight: Optional[SolverAiSingleFlight] = None,
+        results_parser: Optional[SolverAiResultsParserPool] = None,
+    ) -> None:
+        self.__client = SolverAiClientCompute(
+            computerUrl,
+            token,
+            problemId,
+            drain_max_retries=drain_max_retries,
+            drain_retry_default_seconds=drain_retry_default_seconds,
+            honor_retry_after=honor_retry_after,
+            drain_max_wait_seconds=drain_max_wait_seconds,
+            transport=transport,
+            result_cache=result_cache,
+            polling_strategy=polling_strategy,
+            setup_wait_strategy=setup_wait_strategy,
+            stream_results=stream_results,
+            instrumentation=instrumentation,
+            drain_coordinator=drain_coordinator,
+            inputs_outputs_cache=inputs_outputs_cache,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            timeouts=timeouts,
+            single_flight=single_flight,
+            results_parser=results_parser,
+        )
+        if max_workers is None:
+            max_workers = self.__client.transport.pool_maxsize
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='solverai-io',
+        )
+
+    @property
+    def transport(self) -> SolverAiTransport:
+        return self.__client.transport
+
+    def getResultCacheStats(self):
+        return self.__client.getResultCacheStats()
+
+    def getInputsOutputsCacheStats(self):
+        return self.__client.getInputsOutputsCacheStats()
+
+    def getHedgingStats(self):
+        return self.__client.getHedgingStats()
+
+    def getSingleFlightStats(self):
+        return self.__client.getSingleFlightStats()
+
+    @staticmethod
+    def getLastTransferStats():
+        return SolverAiClientCompute.getLastTransferStats()
+
+    async def close(self) -> None:
+        self.__executor.shutdown(wait=False)
+        self.__client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def __runInExecutor(self, function, *args):
+        # Run in a copy of the caller's context so the I/O thread reports to
+        # the same instrumented call as the awaiting task
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor,
+            copy_context().run,
+            function,
+            *args,
+        )
+
+    async def __send(self, request):
+        hedging_policy = self.__client.hedging_policy
+        if hedging_policy is not None:
+            # The policy's own threads race the attempts; this I/O thread
+            # only waits for the winner
+            return await self.__runInExecutor(
+                hedging_policy.run,
+                partial(self.__client._sendRead, request),
+            )
+
+        method, url, kwargs = request
+        kwargs = self.__client._requestKwargs(kwargs, 'status')
+        admission = self.__client._admitRequest('status')
+        try:
+            response = await self.__runInExecutor(
+                partial(self.__client.transport.request, method, url, **kwargs),
+            )
+        except Exception as error:
+            self.__client._recordOutcome(admission)
+            self.__client._raiseIfDeadlineExceeded(error)
+            raise
+        except BaseException:
+            # A cancelled call is not a Computer failure, but must still
+            # release a half-open probe
+            self.__client._releaseAdmission(admission)
+            raise
+        self.__client._recordOutcome(admission, response)
+        return response
+
+    async def __fetchSolve(self, request, cache_key=None):
+        return await self.__runInExecutor(
+            self.__client._fetchSolve,
+            request,
+            cache_key,
+        )
+
+    async def __waitOutDrain(self, waiter=None):
+        coordinator = self.__client.drain_coordinator
+        while True:
+            delay_seconds, waiter = coordinator.schedule(waiter)
+            if delay_seconds <= 0:
+                return waiter
+            await sleep(check_wait(delay_seconds))
+
+    async def __runWithDrainRetry(self, operation, budget=None):
+        if budget is None:
+            budget = self.__client._newDrainRetryBudget()
+        drain_round = 0
+        waiter = None
+
+        while True:
+            # Wait out a drain published by this or any other call first
+            waiter = await self.__waitOutDrain(waiter)
+            with self.__client._drainWaiterContext(waiter):
+                try:
+                    return await operation()
+                except SolverAiDrainingException as error:
+                    reservation = budget.reserve(error, drain_round)
+                    if reservation is None:
+                        self.__client._noteDrain(error, waiter=waiter)
+                        raise
+
+                    wait_seconds, drain_round = reservation
+                    waiter = self.__client._noteDrain(
+                        error,
+                        wait_seconds,
+                        waiter,
+                    )
+                    recorder = active_recorder()
+                    if recorder is not None:
+                        recorder.drain_retries += 1
+                    check_wait(wait_seconds)
+            await sleep(wait_seconds)
+
+    async def getProblemStatusInfo(
+        self,
+        require_not_updating: bool = False,
+    ) -> SolverAiProblemStatusInfo:
+        with self.__client._instrumentedCall('getProblemStatusInfo'):
+            response = await self.__send(
+                self.__client._problemStatusInfoRequest(require_not_updating)
+            )
+            return self.__client._problemStatusInfoFromResponse(
+                response,
+                require_not_updating,
+            )
+
+    async def waitForProblemReady(
+        self,
+        require_not_updating: bool = False,
+        poll_interval_seconds: float = 1.0,
+        max_wait_seconds: Optional[float] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiProblemStatusInfo:
+        with self.__client._boundedCall(
+            'waitForProblemReady',
+            deadline_seconds,
+        ):
+            return await self.__waitForProblemReady(
+                require_not_updating,
+                poll_interval_seconds,
+                max_wait_seconds,
+                polling_strategy,
+            )
+
+    async def __waitForProblemReady(
+        self,
+        require_not_updating: bool = False,
+        poll_interval_seconds: float = 1.0,
+        max_wait_seconds: Optional[float] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+    ) -> SolverAiProblemStatusInfo:
+        polling_strategy = self.__client._resolvePollingStrategy(
+            polling_strategy,
+            poll_interval_seconds,
+        )
+        deadline = None
+        if max_wait_seconds is not None:
+            deadline = monotonic() + max_wait_seconds
+
+        poll_count = 0
+        waited_seconds = 0.0
+        while True:
+            if poll_count and deadline is not None and monotonic() >= deadline:
+                raise SolverAiWaitTimeoutError(poll_count, waited_seconds)
+
+            status_info = await self.getProblemStatusInfo(
+                require_not_updating=require_not_updating,
+            )
+            poll_count += 1
+            recorder = active_recorder()
+            if recorder is not None:
+                recorder.status_polls += 1
+
+            if self.__client._isReadyToStopWaiting(
+                status_info,
+                require_not_updating,
+            ):
+                return replace(
+                    status_info,
+                    poll_count=poll_count,
+                    waited_seconds=waited_seconds,
+                )
+
+            wait_seconds = polling_strategy.interval(poll_count)
+            if deadline is not None:
+                remaining_seconds = deadline - monotonic()
+                if remaining_seconds <= 0:
+                    raise SolverAiWaitTimeoutError(poll_count, waited_seconds)
+                wait_seconds = min(wait_seconds, remaining_seconds)
+
+            await sleep(check_wait(wait_seconds))
+            waited_seconds += wait_seconds
+
+    async def __getInputsOutputsOnce(self):
+        response = await self.__send(self.__client._inputsOutputsRequest())
+        return self.__client._inputsOutputsFromResponse(response)
+
+    async def getInputsOutputs(self, deadline_seconds: Optional[float] = None):
+        with self.__client._boundedCall('getInputsOutputs', deadline_seconds):
+            cached = self.__client._freshInputsOutputs()
+            if cached is not None:
+                return cached
+            return await self.__runWithDrainRetry(self.__getInputsOutputsOnce)
+
+    async def getProblemSetup(self):
+        return await self.getInputsOutputs()
+
+    async def _runSolver(
+        self,
+        input: SolverAiComputeInput,
+        cache_key: Optional[str] = None,
+    ) -> SolverAiComputeResults:
+        return await self.__submitSolve(
+            self.__client._solveRequest(input),
+            cache_key,
+        )
+
+    async def __submitSolve(self, request, cache_key=None):
+        response, results = await self.__fetchSolve(request, cache_key)
+        parse = None
+        if results is None:
+            parse = self.__client._submitResultsParse(response, cache_key)
+        if parse is not None:
+            # Awaited here, so no I/O thread is held while the workers parse
+            results = self.__client._resultsFromParsed(
+                await self.__awaitParse(parse),
+                cache_key,
+            )
+        return self.__client._resultsFromSolveResponse(
+            response,
+            cache_key,
+            results,
+        )
+
+    @staticmethod
+    async def __awaitParse(parse):
+        recorder = active_recorder()
+        started = perf_counter()
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(parse),
+                check_deadline(),
+            )
+        except asyncio.TimeoutError:
+            check_deadline()
+            raise
+        finally:
+            if recorder is not None:
+                recorder.addPhase('parse', perf_counter() - started)
+
+    async def runSolver(
+        self,
+        input: SolverAiComputeInput,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiComputeResults:
+        with self.__client._boundedCall('runSolver', deadline_seconds):
+            single_flight = self.__client.single_flight
+            if single_flight is None:
+                return await self.__runSolver(input, setup_wait_strategy)
+            return await single_flight.runAsync(
+                self.__client._singleFlightKey(input),
+                partial(self.__runSolver, input, setup_wait_strategy),
+            )
+
+    async def __runSolver(
+        self,
+        input: SolverAiComputeInput,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+    ) -> SolverAiComputeResults:
+        cache_key = self.__client._cacheKey(input)
+        cached = self.__client._cachedResults(cache_key)
+        if cached is not None:
+            return cached
+
+        setup_wait_strategy = self.__client._resolveSetupWaitStrategy(
+            setup_wait_strategy
+        )
+        # Serialized once and reused for every resubmission
+        request = self.__client._solveRequest(input)
+
+        async def run_until_setup_complete():
+            deadline = self.__client._setupWaitDeadline(setup_wait_strategy)
+            attempts = 0
+            waited_seconds = 0.0
+            while True:
+                try:
+                    return await self.__submitSolve(request, cache_key)
+                except SetupInExecutionException:
+                    attempts += 1
+                    recorder = active_recorder()
+                    if recorder is not None:
+                        recorder.setup_retries += 1
+
+                remaining_seconds = self.__client._setupWaitRemaining(
+                    deadline,
+                    attempts,
+                    waited_seconds,
+                )
+                if setup_wait_strategy.poll_status:
+                    status_info = await self.waitForProblemReady(
+                        require_not_updating=(
+                            setup_wait_strategy.require_not_updating
+                        ),
+                        max_wait_seconds=remaining_seconds,
+                        polling_strategy=setup_wait_strategy.polling_strategy,
+                    )
+                    waited_seconds += status_info.waited_seconds
+                    if status_info.poll_count > 1:
+                        continue
+                    # Status was already READY; back off before resubmitting
+                    # so a lagging solve endpoint cannot cause a hot loop
+
+                wait_seconds = setup_wait_strategy.polling_strategy.interval(
+                    attempts
+                )
+                if remaining_seconds is not None:
+                    wait_seconds = min(wait_seconds, remaining_seconds)
+                await sleep(check_wait(wait_seconds))
+                waited_seconds += wait_seconds
+
+        return await self.__runWithDrainRetry(run_until_setup_complete)
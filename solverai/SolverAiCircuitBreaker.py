@@ -0,0 +1,165 @@
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from .SolverAiClientExceptions import SolverAiCircuitOpenError
+
+
+class SolverAiCircuitBreaker:
+    """
+    Circuit breaker for Computer requests.
+
+    failure_threshold: failures within ``window_seconds`` that open the
+        circuit; a failure is a transport error or a ``5xx`` response other
+        than a controlled ``503 Draining``
+    recovery_seconds: how long the circuit stays open before letting probes
+        through
+    half_open_max_calls: probes allowed in flight while half-open
+
+    While open every request fails at once with ``SolverAiCircuitOpenError``.
+    After ``recovery_seconds`` the circuit is half-open: up to
+    ``half_open_max_calls`` probe requests are sent, a successful probe
+    closes the circuit and a failed one opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        window_seconds: float = 30.0,
+        recovery_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError('failure_threshold must be at least 1.')
+        if half_open_max_calls < 1:
+            raise ValueError('half_open_max_calls must be at least 1.')
+
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.recovery_seconds = recovery_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.__lock = Lock()
+        self.__state = self.CLOSED
+        self.__failures = deque()
+        self.__opened_at = 0.0
+        self.__probes_in_flight = 0
+        self.__rejected = 0
+        self.__times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self.__lock:
+            self.__refreshState(monotonic())
+            return self.__state
+
+    def before(self) -> bool:
+        """
+        Admits one request or raises ``SolverAiCircuitOpenError``. Returns
+        True when the request is a half-open probe; pass that flag back to
+        ``recordSuccess`` / ``recordFailure``.
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__refreshState(now)
+            if self.__state == self.CLOSED:
+                return False
+            if (
+                self.__state == self.HALF_OPEN
+                and self.__probes_in_flight < self.half_open_max_calls
+            ):
+                self.__probes_in_flight += 1
+                return True
+
+            self.__rejected += 1
+            retry_after_seconds = None
+            if self.__state == self.OPEN:
+                retry_after_seconds = (
+                    self.__opened_at + self.recovery_seconds - now
+                )
+            raise SolverAiCircuitOpenError(retry_after_seconds)
+
+    def recordSuccess(self, probe: bool = False) -> None:
+        with self.__lock:
+            if probe:
+                self.__probes_in_flight = max(self.__probes_in_flight - 1, 0)
+                if self.__state == self.HALF_OPEN:
+                    self.__state = self.CLOSED
+                    self.__failures.clear()
+
+    def recordFailure(self, probe: bool = False) -> None:
+        with self.__lock:
+            now = monotonic()
+            if probe:
+                self.__probes_in_flight = max(self.__probes_in_flight - 1, 0)
+                if self.__state == self.HALF_OPEN:
+                    self.__open(now)
+                return
+            if self.__state != self.CLOSED:
+                return
+
+            self.__failures.append(now)
+            while self.__failures and now - self.__failures[0] > self.window_seconds:
+                self.__failures.popleft()
+            if len(self.__failures) >= self.failure_threshold:
+                self.__open(now)
+
+    def release(self, probe: bool = False) -> None:
+        """Frees the slot of a request that ended without an outcome, such
+        as a cancelled call, recording neither success nor failure."""
+        with self.__lock:
+            if probe:
+                self.__probes_in_flight = max(self.__probes_in_flight - 1, 0)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__state = self.CLOSED
+            self.__failures.clear()
+            self.__probes_in_flight = 0
+
+    def getStats(self) -> dict:
+        with self.__lock:
+            self.__refreshState(monotonic())
+            return {
+                'state': self.__state,
+                'recent_failures': len(self.__failures),
+                'rejected': self.__rejected,
+                'times_opened': self.__times_opened,
+            }
+
+    def __open(self, now: float) -> None:
+        self.__state = self.OPEN
+        self.__opened_at = now
+        self.__failures.clear()
+        self.__times_opened += 1
+
+    def __refreshState(self, now: float) -> None:
+        if (
+            self.__state == self.OPEN
+            and now - self.__opened_at >= self.recovery_seconds
+        ):
+            self.__state = self.HALF_OPEN
+            self.__probes_in_flight = 0
+
+
+_default_circuit_breaker: Optional[SolverAiCircuitBreaker] = None
+
+
+def get_circuit_breaker() -> Optional[SolverAiCircuitBreaker]:
+    return _default_circuit_breaker
+
+
+def set_circuit_breaker(
+    circuit_breaker: Optional[SolverAiCircuitBreaker],
+) -> Optional[SolverAiCircuitBreaker]:
+    """
+    Sets the circuit breaker used by every compute client built without its
+    own ``circuit_breaker``; None disables the process-wide breaker.
+    """
+    global _default_circuit_breaker
+    _default_circuit_breaker = circuit_breaker
+    return circuit_breaker
@@ -1,19 +1,64 @@
-import requests
-import json
+import copy
+import hashlib
 import math
 import random
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from time import monotonic, sleep
-from typing import Optional
+from json import JSONDecodeError
+from threading import Lock
+from time import monotonic, perf_counter, sleep
+from typing import Iterable, Optional, Union
 
+from .SolverAiCircuitBreaker import (
+    SolverAiCircuitBreaker,
+    get_circuit_breaker,
+)
 from .SolverAiComputeInput import SolverAiComputeInput
-from .SolverAiComputeResults import SolverAiComputeResults
+from .SolverAiComputeResults import (
+    SolverAiComputeResults,
+    SolverAiComputeResultsBuilder,
+)
 from .SolverAiClientExceptions import (
     SetupInExecutionException,
     SolverAiDrainingException,
+    SolverAiWaitTimeoutError,
+)
+from .SolverAiDeadline import (
+    SolverAiTimeouts,
+    check_deadline,
+    check_wait,
+    deadline_exceeded_error,
+    deadline_scope,
+    iter_within_deadline,
+)
+from .SolverAiDrainCoordinator import SolverAiDrainCoordinator
+from .SolverAiHedging import SolverAiHedgingPolicy
+from .SolverAiPollingStrategy import (
+    SolverAiFixedPolling,
+    SolverAiPollingStrategy,
+    SolverAiSetupWaitStrategy,
 )
+from .SolverAiInstrumentation import (
+    SolverAiInstrumentation,
+    active_recorder,
+    instrumented_call,
+)
+from .SolverAiInputsOutputsCache import SolverAiInputsOutputsCache
+from .SolverAiJsonCodec import get_json_codec, loads_response, response_body
+from .SolverAiJsonStream import iter_json_members
+from .SolverAiRateLimiter import SolverAiRateLimiter, get_rate_limiter
+from .SolverAiResultCache import SolverAiResultCache, result_cache_key
+from .SolverAiResultsParser import (
+    SolverAiResultsParserPool,
+    results_from_payload,
+)
+from .SolverAiSingleFlight import SolverAiSingleFlight
+from .SolverAiTransport import SolverAiTransferStats, SolverAiTransport
 
 
 @dataclass(frozen=True)
@@ -28,6 +73,62 @@ class SolverAiProblemStatusInfo:
     require_not_updating: bool = False
     raw_status_text: str = ''
     error_origin: Optional[str] = None
+    poll_count: int = 0
+    waited_seconds: float = 0.0
+
+
+_last_transfer_stats: ContextVar[Optional[SolverAiTransferStats]] = ContextVar(
+    'solverai_last_transfer_stats',
+    default=None,
+)
+# Drain waiter of the call in progress, so responses can end a drain probe
+_active_drain_waiter: ContextVar = ContextVar(
+    'solverai_active_drain_waiter',
+    default=None,
+)
+
+
+class _SolverAiDrainRetryBudget:
+    """
+    Drain retry budget shared by every call that runs against it.
+
+    Each drain retry opens a "round" with a resume time. Callers that hit a
+    drain while a newer round is still pending join that round and wait for
+    its resume time without consuming budget, so concurrent callers that
+    see the same drain share one retry.
+    """
+
+    def __init__(self, client: 'SolverAiClientCompute') -> None:
+        self.__client = client
+        self.__lock = Lock()
+        self.__retries_used = 0
+        self.__wait_used = 0.0
+        self.__round = 0
+        self.__resume_at = 0.0
+
+    def reserve(self, error, caller_round: int):
+        """
+        Returns ``(wait_seconds, round)`` for the retry ``error`` should wait
+        on, or None when the budget is exhausted.
+        """
+        with self.__lock:
+            now = monotonic()
+            if caller_round < self.__round and now < self.__resume_at:
+                return self.__resume_at - now, self.__round
+
+            wait_seconds = self.__client._drainRetryWaitSeconds(
+                error,
+                self.__retries_used,
+                self.__wait_used,
+            )
+            if wait_seconds is None:
+                return None
+
+            self.__retries_used += 1
+            self.__wait_used += wait_seconds
+            self.__round += 1
+            self.__resume_at = now + wait_seconds
+            return wait_seconds, self.__round
 
 
 class SolverAiClientCompute:
@@ -41,16 +142,172 @@ class SolverAiClientCompute:
         drain_retry_default_seconds: float = 60,
         honor_retry_after: bool = True,
         drain_max_wait_seconds: Optional[float] = None,
+        transport: Optional[SolverAiTransport] = None,
+        result_cache: Optional[SolverAiResultCache] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        stream_results: bool = False,
+        instrumentation: Optional[SolverAiInstrumentation] = None,
+        drain_coordinator: Optional[SolverAiDrainCoordinator] = None,
+        inputs_outputs_cache: Optional[SolverAiInputsOutputsCache] = None,
+        rate_limiter: Optional[SolverAiRateLimiter] = None,
+        circuit_breaker: Optional[SolverAiCircuitBreaker] = None,
+        hedging_policy: Optional[SolverAiHedgingPolicy] = None,
+        timeouts: Optional[SolverAiTimeouts] = None,
+        single_flight: Optional[SolverAiSingleFlight] = None,
+        results_parser: Optional[SolverAiResultsParserPool] = None,
     ) -> None:
         self.__base_url_Computer = computerUrl + "/"
         self.__problemId = problemId
         self.__headers = {
             "Authorization": f"Token {token}"
         }
+        self.__credential = hashlib.sha256(token.encode()).hexdigest()
         self.__drain_max_retries = drain_max_retries
         self.__drain_retry_default_seconds = drain_retry_default_seconds
         self.__honor_retry_after = honor_retry_after
         self.__drain_max_wait_seconds = drain_max_wait_seconds
+        self.__owns_transport = transport is None
+        if transport is None:
+            transport = SolverAiTransport()
+        self.__transport = transport
+        self.__result_cache = result_cache
+        self.__polling_strategy = polling_strategy
+        if setup_wait_strategy is None:
+            setup_wait_strategy = SolverAiSetupWaitStrategy()
+        self.__setup_wait_strategy = setup_wait_strategy
+        self.__stream_results = stream_results
+        self.__instrumentation = instrumentation
+        if drain_coordinator is None:
+            drain_coordinator = SolverAiDrainCoordinator()
+        self.__drain_coordinator = drain_coordinator
+        self.__inputs_outputs_cache = inputs_outputs_cache
+        self.__rate_limiter = rate_limiter
+        self.__circuit_breaker = circuit_breaker
+        self.__hedging_policy = hedging_policy
+        if timeouts is None:
+            timeouts = SolverAiTimeouts()
+        self.__timeouts = timeouts
+        self.__single_flight = single_flight
+        self.__results_parser = results_parser
+
+    @property
+    def transport(self) -> SolverAiTransport:
+        return self.__transport
+
+    @property
+    def result_cache(self) -> Optional[SolverAiResultCache]:
+        return self.__result_cache
+
+    @property
+    def instrumentation(self) -> Optional[SolverAiInstrumentation]:
+        return self.__instrumentation
+
+    @property
+    def inputs_outputs_cache(self) -> Optional[SolverAiInputsOutputsCache]:
+        return self.__inputs_outputs_cache
+
+    @property
+    def rate_limiter(self) -> Optional[SolverAiRateLimiter]:
+        """This client's rate limiter, else the process-wide one."""
+        if self.__rate_limiter is not None:
+            return self.__rate_limiter
+        return get_rate_limiter()
+
+    @property
+    def circuit_breaker(self) -> Optional[SolverAiCircuitBreaker]:
+        """This client's circuit breaker, else the process-wide one."""
+        if self.__circuit_breaker is not None:
+            return self.__circuit_breaker
+        return get_circuit_breaker()
+
+    @property
+    def hedging_policy(self) -> Optional[SolverAiHedgingPolicy]:
+        return self.__hedging_policy
+
+    @property
+    def timeouts(self) -> SolverAiTimeouts:
+        return self.__timeouts
+
+    @property
+    def single_flight(self) -> Optional[SolverAiSingleFlight]:
+        return self.__single_flight
+
+    @property
+    def results_parser(self) -> Optional[SolverAiResultsParserPool]:
+        return self.__results_parser
+
+    @property
+    def drain_coordinator(self) -> SolverAiDrainCoordinator:
+        return self.__drain_coordinator
+
+    @property
+    def problemId(self) -> str:
+        return self.__problemId
+
+    def _withProblem(self, problemId: str) -> 'SolverAiClientCompute':
+        """
+        Returns a client for ``problemId`` that shares every collaborator of
+        this one (transport, headers, cache, strategies, instrumentation and
+        drain coordinator) and never closes the transport.
+        """
+        client = copy.copy(self)
+        client.__problemId = problemId
+        client.__owns_transport = False
+        return client
+
+    def _instrumentedCall(self, operation: str):
+        return instrumented_call(self.__instrumentation, 'compute', operation)
+
+    @contextmanager
+    def _boundedCall(self, operation: str, deadline_seconds=None):
+        """``_instrumentedCall`` bounded by ``deadline_seconds`` when given."""
+        with self._instrumentedCall(operation), deadline_scope(deadline_seconds):
+            yield
+
+    def getResultCacheStats(self):
+        if self.__result_cache is None:
+            return None
+        return self.__result_cache.getStats()
+
+    def getInputsOutputsCacheStats(self):
+        if self.__inputs_outputs_cache is None:
+            return None
+        return self.__inputs_outputs_cache.getStats()
+
+    def getHedgingStats(self):
+        if self.__hedging_policy is None:
+            return None
+        return self.__hedging_policy.getStats()
+
+    def getSingleFlightStats(self):
+        if self.__single_flight is None:
+            return None
+        return self.__single_flight.getStats()
+
+    @staticmethod
+    def getLastTransferStats() -> Optional[SolverAiTransferStats]:
+        """
+        Byte counts of the most recent ``solvejson/`` exchange made from the
+        calling thread or asyncio task, or None before the first one.
+        """
+        return _last_transfer_stats.get()
+
+    def _invalidateCachedResults(self) -> None:
+        if self.__result_cache is not None:
+            self.__result_cache.invalidateProblem(self.__problemId)
+        if self.__inputs_outputs_cache is not None:
+            self.__inputs_outputs_cache.expire(self.__problemId)
+
+    def close(self) -> None:
+        if self.__owns_transport:
+            self.__transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @staticmethod
     def __isStatusCodeOk(response):
@@ -63,26 +320,29 @@ class SolverAiClientCompute:
         return statusCode == 202
 
     def getProblemStatus(self):
-        headers = self.__headers.copy()
-        headers["Content-Type"] = "application/json"
         url = (f'{self.__base_url_Computer}'
                f'check_problem_status/{self.__problemId}')
-        response = requests.get(url, headers=headers)
+        response = self.__send(('GET', url, {'headers': self._jsonHeaders()}))
         if self.__isStatusCodeOk(response):
             try:
-                data = json.loads(response.text)
+                data = loads_response(response)
                 return data['inputs'], data['outputs']
             except Exception:
                 raise Exception('Failed retrieving data.')
         else:
-            raise Exception(f'Failed with code: {json.loads(response.text)}.')
+            raise Exception(f'Failed with code: {loads_response(response)}.')
 
     @staticmethod
     def __parseJsonResponse(response):
+        recorder = active_recorder()
+        started = perf_counter() if recorder is not None else None
         try:
-            return json.loads(response.text)
+            return loads_response(response)
         except Exception:
             raise Exception('Failed retrieving data.')
+        finally:
+            if recorder is not None:
+                recorder.addPhase('decode', perf_counter() - started)
 
     @staticmethod
     def __parseRetryAfterSeconds(retry_after_value):
@@ -122,7 +382,7 @@ class SolverAiClientCompute:
             return False
 
         try:
-            data = json.loads(response.text)
+            data = loads_response(response)
         except Exception:
             return False
 
@@ -156,15 +416,24 @@ class SolverAiClientCompute:
             return 'ERROR'
         raise Exception(f'Failed with code: {raw_status_text}.')
 
-    def getProblemStatusInfo(self, require_not_updating: bool = False):
+    def _jsonHeaders(self):
         headers = self.__headers.copy()
         headers["Content-Type"] = "application/json"
+        return headers
+
+    def _problemStatusInfoRequest(self, require_not_updating: bool = False):
         url = (f'{self.__base_url_Computer}'
                f'check_problem_status/{self.__problemId}')
         params = None
         if require_not_updating:
             params = {"require_not_updating": "true"}
-        response = requests.get(url, headers=headers, params=params)
+        return 'GET', url, {'headers': self._jsonHeaders(), 'params': params}
+
+    def _problemStatusInfoFromResponse(
+        self,
+        response,
+        require_not_updating: bool = False,
+    ) -> SolverAiProblemStatusInfo:
         if response.status_code not in {200, 202, 400}:
             raise Exception(
                 f'Failed with code: {self.__parseJsonResponse(response)}.'
@@ -178,6 +447,11 @@ class SolverAiClientCompute:
             response.status_code,
             raw_status_text,
         )
+        if state in ('PROCESSING', 'UPDATING'):
+            # The problem is being (re)built, so earlier solves are stale
+            self._invalidateCachedResults()
+        if self.__inputs_outputs_cache is not None:
+            self.__inputs_outputs_cache.observeState(self.__problemId, state)
 
         return SolverAiProblemStatusInfo(
             http_status_code=response.status_code,
@@ -192,141 +466,725 @@ class SolverAiClientCompute:
             error_origin='unknown' if state == 'ERROR' else None,
         )
 
+    def _requestKwargs(self, kwargs: dict, kind: str) -> dict:
+        """
+        ``kwargs`` of a request of ``kind`` ('solve' or 'status') with its
+        socket timeouts, lowered to the active deadline; raises once that
+        deadline has passed.
+        """
+        timeout = self.__timeouts.forRequest(kind, check_deadline())
+        if timeout is None:
+            return kwargs
+        return {**kwargs, 'timeout': timeout}
+
+    def getProblemStatusInfo(self, require_not_updating: bool = False):
+        with self._instrumentedCall('getProblemStatusInfo'):
+            response = self.__send(
+                self._problemStatusInfoRequest(require_not_updating)
+            )
+            return self._problemStatusInfoFromResponse(
+                response,
+                require_not_updating,
+            )
+
+    def _resolvePollingStrategy(
+        self,
+        polling_strategy: Optional[SolverAiPollingStrategy],
+        poll_interval_seconds: float,
+    ) -> SolverAiPollingStrategy:
+        if polling_strategy is not None:
+            return polling_strategy
+        if self.__polling_strategy is not None:
+            return self.__polling_strategy
+        return SolverAiFixedPolling(poll_interval_seconds)
+
+    def _resolveSetupWaitStrategy(
+        self,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy],
+    ) -> SolverAiSetupWaitStrategy:
+        if setup_wait_strategy is not None:
+            return setup_wait_strategy
+        return self.__setup_wait_strategy
+
+    @staticmethod
+    def _isReadyToStopWaiting(status_info, require_not_updating):
+        """
+        Returns True once ``status_info`` is READY and False while it is in a
+        transient state worth waiting through; raises on any other state.
+        """
+        if status_info.is_ready:
+            return True
+
+        if status_info.is_error:
+            raise RuntimeError(
+                f'Problem entered terminal state: '
+                f'{status_info.state} ({status_info.detail}).'
+            )
+
+        if status_info.state == 'NOT_READY':
+            raise RuntimeError(
+                f'Problem is not ready to wait on: '
+                f'{status_info.detail}.'
+            )
+
+        is_transient_processing = status_info.is_processing
+        is_transient_updating = (
+            require_not_updating and status_info.is_updating
+        )
+        if not (is_transient_processing or is_transient_updating):
+            raise RuntimeError(
+                f'Unexpected wait state: '
+                f'{status_info.state} ({status_info.detail}).'
+            )
+        return False
+
     def waitForProblemReady(
         self,
         require_not_updating: bool = False,
         poll_interval_seconds: float = 1.0,
         max_wait_seconds: Optional[float] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiProblemStatusInfo:
+        """
+        Polls the problem status until it is READY.
+
+        ``max_wait_seconds`` is checked between polls; ``deadline_seconds``
+        bounds the whole call, status requests included, and raises
+        ``SolverAiDeadlineExceededError`` once it cannot be met.
+        """
+        with self._boundedCall('waitForProblemReady', deadline_seconds):
+            return self.__waitForProblemReady(
+                require_not_updating,
+                poll_interval_seconds,
+                max_wait_seconds,
+                polling_strategy,
+            )
+
+    def __waitForProblemReady(
+        self,
+        require_not_updating: bool = False,
+        poll_interval_seconds: float = 1.0,
+        max_wait_seconds: Optional[float] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
     ) -> SolverAiProblemStatusInfo:
+        polling_strategy = self._resolvePollingStrategy(
+            polling_strategy,
+            poll_interval_seconds,
+        )
         deadline = None
         if max_wait_seconds is not None:
             deadline = monotonic() + max_wait_seconds
 
-        has_polled = False
+        poll_count = 0
+        waited_seconds = 0.0
         while True:
-            if has_polled and deadline is not None and monotonic() >= deadline:
-                raise TimeoutError(
-                    'Timed out waiting for the problem to become ready.'
-                )
+            if poll_count and deadline is not None and monotonic() >= deadline:
+                raise SolverAiWaitTimeoutError(poll_count, waited_seconds)
 
             status_info = self.getProblemStatusInfo(
                 require_not_updating=require_not_updating,
             )
-            has_polled = True
-
-            if status_info.is_ready:
-                return status_info
+            poll_count += 1
+            recorder = active_recorder()
+            if recorder is not None:
+                recorder.status_polls += 1
 
-            if status_info.is_error:
-                raise RuntimeError(
-                    f'Problem entered terminal state: '
-                    f'{status_info.state} ({status_info.detail}).'
+            if self._isReadyToStopWaiting(
+                status_info,
+                require_not_updating,
+            ):
+                return replace(
+                    status_info,
+                    poll_count=poll_count,
+                    waited_seconds=waited_seconds,
                 )
 
-            if status_info.state == 'NOT_READY':
-                raise RuntimeError(
-                    f'Problem is not ready to wait on: '
-                    f'{status_info.detail}.'
-                )
+            wait_seconds = polling_strategy.interval(poll_count)
+            if deadline is not None:
+                remaining_seconds = deadline - monotonic()
+                if remaining_seconds <= 0:
+                    raise SolverAiWaitTimeoutError(poll_count, waited_seconds)
+                wait_seconds = min(wait_seconds, remaining_seconds)
 
-            is_transient_processing = status_info.is_processing
-            is_transient_updating = (
-                require_not_updating and status_info.is_updating
+            sleep(check_wait(wait_seconds))
+            waited_seconds += wait_seconds
+
+    def _drainRetryWaitSeconds(
+        self,
+        error: SolverAiDrainingException,
+        drain_retries_used: int,
+        drain_wait_used: float,
+    ) -> Optional[float]:
+        """
+        Returns how long to wait before retrying after ``error``, or None when
+        the drain retry budget is exhausted and the error should propagate.
+        """
+        if drain_retries_used >= self.__drain_max_retries:
+            return None
+
+        wait_seconds = None
+        if (
+            self.__honor_retry_after
+            and error.retry_after_seconds is not None
+        ):
+            wait_seconds = error.retry_after_seconds
+        else:
+            wait_seconds = (
+                self.__drain_retry_default_seconds + random.random()
             )
-            if not (is_transient_processing or is_transient_updating):
-                raise RuntimeError(
-                    f'Unexpected wait state: '
-                    f'{status_info.state} ({status_info.detail}).'
-                )
 
-            if deadline is None:
-                sleep(poll_interval_seconds)
-                continue
+        if (
+            self.__drain_max_wait_seconds is not None
+            and drain_wait_used + wait_seconds >
+            self.__drain_max_wait_seconds
+        ):
+            return None
+        return wait_seconds
 
-            remaining_seconds = deadline - monotonic()
-            if remaining_seconds <= 0:
-                raise TimeoutError(
-                    'Timed out waiting for the problem to become ready.'
-                )
+    def _newDrainRetryBudget(self) -> _SolverAiDrainRetryBudget:
+        return _SolverAiDrainRetryBudget(self)
 
-            sleep(min(poll_interval_seconds, remaining_seconds))
+    @contextmanager
+    def _drainWaiterContext(self, waiter):
+        """
+        Marks ``waiter`` as the drain waiter of the call in progress. A probe
+        that ends without any response hands the probe role on.
+        """
+        token = _active_drain_waiter.set(waiter)
+        try:
+            yield
+        finally:
+            _active_drain_waiter.reset(token)
+            self.__drain_coordinator.abandon(waiter)
+
+    def _noteDrain(self, error, wait_seconds=None, waiter=None):
+        """
+        Publishes the drain behind ``error`` to the drain coordinator. Without
+        ``wait_seconds`` (no retry left) the announced or default wait is
+        published so other callers still hold back.
+        """
+        if wait_seconds is None:
+            if (
+                self.__honor_retry_after
+                and error.retry_after_seconds is not None
+            ):
+                wait_seconds = error.retry_after_seconds
+            else:
+                wait_seconds = self.__drain_retry_default_seconds
+        return self.__drain_coordinator.noteDrain(wait_seconds, waiter)
+
+    def _admitRequest(self, kind: str):
+        """
+        Applies the rate limiter and circuit breaker before a request of
+        ``kind`` ('solve' or 'status'). Raises the local rejection, or
+        returns the admission to hand to ``_recordOutcome``.
+        """
+        rate_limiter = self.rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(kind)
+        circuit_breaker = self.circuit_breaker
+        if circuit_breaker is None:
+            return None
+        return circuit_breaker, circuit_breaker.before()
 
-    def __runWithDrainRetry(self, operation):
-        drain_retries_used = 0
-        drain_wait_used = 0.0
+    def _recordOutcome(self, admission, response=None) -> None:
+        """
+        Reports a response, or a transport error when None, to the circuit
+        breaker and the drain coordinator.
+        """
+        draining = response is not None and self.__isControlledDraining(response)
+        if response is not None and not draining:
+            self.__drain_coordinator.noteAnswer(_active_drain_waiter.get())
+        if admission is None:
+            return
+        circuit_breaker, probe = admission
+        if response is None or (response.status_code >= 500 and not draining):
+            circuit_breaker.recordFailure(probe)
+        else:
+            circuit_breaker.recordSuccess(probe)
 
+    @staticmethod
+    def _releaseAdmission(admission) -> None:
+        """Returns an admission whose request ended without an outcome."""
+        if admission is not None:
+            circuit_breaker, probe = admission
+            circuit_breaker.release(probe)
+
+    def __waitOutDrain(self, waiter=None):
         while True:
-            try:
-                return operation()
-            except SolverAiDrainingException as error:
-                if drain_retries_used >= self.__drain_max_retries:
-                    raise
+            delay_seconds, waiter = self.__drain_coordinator.schedule(waiter)
+            if delay_seconds <= 0:
+                return waiter
+            sleep(check_wait(delay_seconds))
+
+    def __runWithDrainRetry(self, operation, budget=None):
+        if budget is None:
+            budget = self._newDrainRetryBudget()
+        drain_round = 0
+        waiter = None
+
+        while True:
+            # Wait out a drain published by this or any other call first
+            waiter = self.__waitOutDrain(waiter)
+            with self._drainWaiterContext(waiter):
+                try:
+                    return operation()
+                except SolverAiDrainingException as error:
+                    reservation = budget.reserve(error, drain_round)
+                    if reservation is None:
+                        self._noteDrain(error, waiter=waiter)
+                        raise
+
+                    wait_seconds, drain_round = reservation
+                    waiter = self._noteDrain(error, wait_seconds, waiter)
+                    recorder = active_recorder()
+                    if recorder is not None:
+                        recorder.drain_retries += 1
+                    check_wait(wait_seconds)
+            sleep(wait_seconds)
 
-                wait_seconds = None
+    def __send(self, request):
+        if self.__hedging_policy is None:
+            return self._sendRead(request)
+        return self.__hedging_policy.run(lambda: self._sendRead(request))
+
+    def _sendRead(self, request):
+        """One attempt of an idempotent Computer read (status, setup)."""
+        method, url, kwargs = request
+        kwargs = self._requestKwargs(kwargs, 'status')
+        admission = self._admitRequest('status')
+        try:
+            response = self.__transport.request(method, url, **kwargs)
+        except Exception as error:
+            self._recordOutcome(admission)
+            self._raiseIfDeadlineExceeded(error)
+            raise
+        self._recordOutcome(admission, response)
+        return response
+
+    def _fetchSolve(self, request, cache_key: Optional[str] = None):
+        """
+        Runs one solve exchange and returns ``(response, results)``.
+
+        With ``stream_results`` a ``200`` body is decoded while it streams and
+        ``results`` is the parsed ``SolverAiComputeResults``; every other
+        response is read whole and ``results`` is None, leaving it to
+        ``_resultsFromSolveResponse``. A ``results_parser`` takes precedence
+        over streaming: the body is read whole and parsed by its workers.
+        """
+        method, url, kwargs = request
+        kwargs = self._requestKwargs(kwargs, 'solve')
+        admission = self._admitRequest('solve')
+        try:
+            with self.__transport.open(method, url, **kwargs) as response:
                 if (
-                    self.__honor_retry_after
-                    and error.retry_after_seconds is not None
+                    self.__stream_results
+                    and self.__results_parser is None
+                    and response.status_code == 200
                 ):
-                    wait_seconds = error.retry_after_seconds
-                else:
-                    wait_seconds = (
-                        self.__drain_retry_default_seconds + random.random()
+                    self._recordOutcome(admission, response)
+                    admission = None
+                    return response, self.__resultsFromStream(
+                        response,
+                        cache_key,
                     )
+                response = response.read()
+        except Exception as error:
+            self._recordOutcome(admission)
+            self._raiseIfDeadlineExceeded(error)
+            raise
+        self._recordOutcome(admission, response)
+        return response, None
 
-                if (
-                    self.__drain_max_wait_seconds is not None
-                    and drain_wait_used + wait_seconds >
-                    self.__drain_max_wait_seconds
-                ):
-                    raise
+    @staticmethod
+    def _raiseIfDeadlineExceeded(error: Exception) -> None:
+        """A request that failed after the deadline passed (typically a
+        socket timeout lowered to it) reports the deadline instead."""
+        deadline_error = deadline_exceeded_error()
+        if deadline_error is not None and error is not deadline_error:
+            raise deadline_error from error
+
+    def __resultsFromStream(self, response, cache_key=None):
+        builder = SolverAiComputeResultsBuilder(keep_raw=cache_key is not None)
+        add = builder.add
+        recorder = active_recorder()
+        if recorder is not None:
+            # Body reads count as transfer and row parsing as parse, so the
+            # rest of the streaming loop is JSON decode
+            add = recorder.timed('parse', add)
+            untimed_before = recorder.phase('transfer') + recorder.phase('parse')
+            started = perf_counter()
+        has_results = False
+        try:
+            body = response.iterBody()
+            if check_deadline() is not None:
+                body = iter_within_deadline(body)
+            for parent, key, value in iter_json_members(body):
+                if parent == 'results':
+                    add(key, value)
+                    has_results = True
+                elif key == 'results':
+                    raise Exception('Failed retrieving data.')
+        except (JSONDecodeError, UnicodeDecodeError):
+            raise Exception('Failed retrieving data.')
+        finally:
+            if recorder is not None:
+                untimed = (
+                    recorder.phase('transfer') + recorder.phase('parse')
+                    - untimed_before
+                )
+                recorder.addPhase('decode', perf_counter() - started - untimed)
+        if not has_results:
+            raise KeyError('results')
 
-                sleep(wait_seconds)
-                drain_retries_used += 1
-                drain_wait_used += wait_seconds
+        results = builder.build()
+        if cache_key is not None:
+            self.__result_cache.put(self.__problemId, cache_key, builder.raw)
+        return results
 
-    def __getInputsOutputsOnce(self):
-        headers = self.__headers.copy()
-        headers["Content-Type"] = "application/json"
+    def _inputsOutputsRequest(self):
         url = f'{self.__base_url_Computer}problem_setup/{self.__problemId}'
-        response = requests.get(url, headers=headers)
+        headers = self._jsonHeaders()
+        if self.__inputs_outputs_cache is not None:
+            headers.update(
+                self.__inputs_outputs_cache.validators(self.__problemId)
+            )
+        return 'GET', url, {'headers': headers}
+
+    @staticmethod
+    def __inputsOutputsFromData(data):
+        try:
+            return data['inputs'], data['outputs']
+        except Exception:
+            raise Exception('Failed retrieving data.')
+
+    def _freshInputsOutputs(self):
+        """Inputs/outputs served from the cache inside its TTL, or None."""
+        if self.__inputs_outputs_cache is None:
+            return None
+        body = self.__inputs_outputs_cache.fresh(self.__problemId)
+        if body is None:
+            return None
+        return self.__inputsOutputsFromData(get_json_codec().loads(body))
+
+    def _inputsOutputsFromResponse(self, response):
+        cache = self.__inputs_outputs_cache
+        if cache is not None and response.status_code == 304:
+            body = cache.revalidated(self.__problemId)
+            if body is None:
+                raise Exception('Failed retrieving data.')
+            return self.__inputsOutputsFromData(get_json_codec().loads(body))
         if self.__isControlledDraining(response):
             raise self.__buildDrainingException(response)
         if self.__isStatusCodeOk(response):
             data = self.__parseJsonResponse(response)
-            try:
-                return data['inputs'], data['outputs']
-            except Exception:
-                raise Exception('Failed retrieving data.')
+            inputs_outputs = self.__inputsOutputsFromData(data)
+            headers = getattr(response, 'headers', {}) or {}
+            if cache is not None and response.status_code == 200:
+                cache.store(
+                    self.__problemId,
+                    response_body(response),
+                    etag=headers.get('ETag'),
+                    last_modified=headers.get('Last-Modified'),
+                )
+            version = headers.get('ETag') or headers.get('Last-Modified')
+            if self.__result_cache is not None and version:
+                # A new version of the problem makes earlier solves stale
+                self.__result_cache.observeProblemVersion(self.__problemId, version)
+            return inputs_outputs
         raise Exception(f'Failed with code: {self.__parseJsonResponse(response)}.')
 
-    def getInputsOutputs(self):
-        return self.__runWithDrainRetry(self.__getInputsOutputsOnce)
+    def __getInputsOutputsOnce(self):
+        response = self.__send(self._inputsOutputsRequest())
+        return self._inputsOutputsFromResponse(response)
+
+    def getInputsOutputs(self, deadline_seconds: Optional[float] = None):
+        with self._boundedCall('getInputsOutputs', deadline_seconds):
+            cached = self._freshInputsOutputs()
+            if cached is not None:
+                return cached
+            return self.__runWithDrainRetry(self.__getInputsOutputsOnce)
 
     def getProblemSetup(self):
         return self.getInputsOutputs()
 
-    def _runSolver(self, input: SolverAiComputeInput) -> SolverAiComputeResults:
-        headers = self.__headers.copy()
-        headers["Content-Type"] = "application/json"
+    def _solveRequest(self, input: SolverAiComputeInput):
         url = f'{self.__base_url_Computer}solvejson/'
-        jsonData = input.getJson()
-        response = requests.post(url, headers=headers, data=jsonData)
+        recorder = active_recorder()
+        if recorder is None:
+            jsonData = input.getJsonBytes()
+        else:
+            started = perf_counter()
+            jsonData = input.getJsonBytes()
+            recorder.addPhase('serialize', perf_counter() - started)
+        return 'POST', url, {'headers': self._jsonHeaders(), 'data': jsonData}
+
+    def _singleFlightKey(self, input: SolverAiComputeInput):
+        # The canonical payload already names the problem; the token keeps
+        # callers with different credentials from sharing results or errors
+        return self.__base_url_Computer, self.__credential, input.getFingerprint()
+
+    def _cacheKey(self, input: SolverAiComputeInput) -> Optional[str]:
+        if self.__result_cache is None:
+            return None
+        return result_cache_key(
+            self.__base_url_Computer,
+            self.__credential,
+            input.getFingerprint(),
+        )
+
+    def _cachedResults(self, cache_key: Optional[str]):
+        if cache_key is None:
+            return None
+        cached = self.__result_cache.get(self.__problemId, cache_key)
+        if cached is None:
+            return None
+        return SolverAiComputeResults(cached)
+
+    def _resultsFromSolveResponse(
+        self,
+        response,
+        cache_key: Optional[str] = None,
+        results: Optional[SolverAiComputeResults] = None,
+    ) -> SolverAiComputeResults:
+        transfer_stats = getattr(response, 'transfer_stats', None)
+        if transfer_stats is not None:
+            _last_transfer_stats.set(transfer_stats)
+        if results is not None:
+            return results
         if self.__isControlledDraining(response):
             raise self.__buildDrainingException(response)
         if self.__isStatusCodeOk(response):
             if self.__isSetupInExecution(response):
+                self._invalidateCachedResults()
                 raise SetupInExecutionException()
+            parse = self._submitResultsParse(response, cache_key)
+            if parse is not None:
+                recorder = active_recorder()
+                if recorder is None:
+                    payload = self.__awaitParse(parse)
+                else:
+                    payload = recorder.timed('parse', self.__awaitParse)(parse)
+                return self._resultsFromParsed(payload, cache_key)
             data = self.__parseJsonResponse(response)
-            return SolverAiComputeResults(data['results'])
+            recorder = active_recorder()
+            if recorder is None:
+                results = SolverAiComputeResults(data['results'])
+            else:
+                started = perf_counter()
+                results = SolverAiComputeResults(data['results'])
+                recorder.addPhase('parse', perf_counter() - started)
+            if cache_key is not None:
+                self.__result_cache.put(
+                    self.__problemId,
+                    cache_key,
+                    data['results'],
+                )
+            return results
         else:
             raise Exception(f'{self.__parseJsonResponse(response)}.')
 
-    def runSolver(self, input: SolverAiComputeInput) -> SolverAiComputeResults:
+    def _submitResultsParse(self, response, cache_key: Optional[str] = None):
+        """Hands a successful solve body to ``results_parser`` and returns
+        the future of its payload, or None when there is nothing to hand."""
+        if self.__results_parser is None or response.status_code != 200:
+            return None
+        return self.__results_parser.submit(
+            response_body(response),
+            keep_raw=cache_key is not None,
+        )
+
+    @staticmethod
+    def __awaitParse(parse):
+        try:
+            return parse.result(check_deadline())
+        except FutureTimeoutError:
+            check_deadline()
+            raise
+
+    def _resultsFromParsed(
+        self,
+        payload: dict,
+        cache_key: Optional[str] = None,
+    ) -> SolverAiComputeResults:
+        if cache_key is not None:
+            self.__result_cache.put(self.__problemId, cache_key, payload['raw'])
+        return results_from_payload(payload)
+
+    def _runSolver(
+        self,
+        input: SolverAiComputeInput,
+        cache_key: Optional[str] = None,
+    ) -> SolverAiComputeResults:
+        return self.__submitSolve(self._solveRequest(input), cache_key)
+
+    def __submitSolve(self, request, cache_key=None):
+        response, results = self._fetchSolve(request, cache_key)
+        return self._resultsFromSolveResponse(response, cache_key, results)
+
+    @staticmethod
+    def _setupWaitDeadline(setup_wait_strategy):
+        if setup_wait_strategy.max_wait_seconds is None:
+            return None
+        return monotonic() + setup_wait_strategy.max_wait_seconds
+
+    @staticmethod
+    def _setupWaitRemaining(deadline, attempts, waited_seconds):
+        """
+        Returns the seconds left before ``deadline`` (None when unbounded);
+        raises once the setup wait deadline has passed.
+        """
+        if deadline is None:
+            return None
+        remaining_seconds = deadline - monotonic()
+        if remaining_seconds <= 0:
+            raise SolverAiWaitTimeoutError(
+                attempts,
+                waited_seconds,
+                'Timed out waiting for problem setup to complete.',
+            )
+        return remaining_seconds
+
+    def __runSolverUntilSetupComplete(
+        self,
+        input,
+        budget=None,
+        setup_wait_strategy=None,
+    ):
+        if self.__single_flight is None:
+            return self.__solveUntilSetupComplete(
+                input,
+                budget,
+                setup_wait_strategy,
+            )
+        return self.__single_flight.run(
+            self._singleFlightKey(input),
+            lambda: self.__solveUntilSetupComplete(
+                input,
+                budget,
+                setup_wait_strategy,
+            ),
+        )
+
+    def __solveUntilSetupComplete(
+        self,
+        input,
+        budget=None,
+        setup_wait_strategy=None,
+    ):
+        cache_key = self._cacheKey(input)
+        cached = self._cachedResults(cache_key)
+        if cached is not None:
+            return cached
+
+        setup_wait_strategy = self._resolveSetupWaitStrategy(
+            setup_wait_strategy
+        )
+        # Serialized once and reused for every resubmission
+        request = self._solveRequest(input)
+
         def run_until_setup_complete():
+            deadline = self._setupWaitDeadline(setup_wait_strategy)
+            attempts = 0
+            waited_seconds = 0.0
             while True:
                 try:
-                    return self._runSolver(input)
+                    return self.__submitSolve(request, cache_key)
                 except SetupInExecutionException:
-                    sleep(5)
+                    attempts += 1
+                    recorder = active_recorder()
+                    if recorder is not None:
+                        recorder.setup_retries += 1
+
+                remaining_seconds = self._setupWaitRemaining(
+                    deadline,
+                    attempts,
+                    waited_seconds,
+                )
+                if setup_wait_strategy.poll_status:
+                    status_info = self.waitForProblemReady(
+                        require_not_updating=(
+                            setup_wait_strategy.require_not_updating
+                        ),
+                        max_wait_seconds=remaining_seconds,
+                        polling_strategy=setup_wait_strategy.polling_strategy,
+                    )
+                    waited_seconds += status_info.waited_seconds
+                    if status_info.poll_count > 1:
+                        continue
+                    # Status was already READY; back off before resubmitting
+                    # so a lagging solve endpoint cannot cause a hot loop
+
+                wait_seconds = setup_wait_strategy.polling_strategy.interval(
+                    attempts
+                )
+                if remaining_seconds is not None:
+                    wait_seconds = min(wait_seconds, remaining_seconds)
+                sleep(check_wait(wait_seconds))
+                waited_seconds += wait_seconds
+
+        return self.__runWithDrainRetry(run_until_setup_complete, budget)
+
+    def runSolver(
+        self,
+        input: SolverAiComputeInput,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiComputeResults:
+        """
+        Solves ``input``. ``deadline_seconds`` bounds the whole call across
+        drain retries, ``202`` setup waits and status polls; once it cannot
+        be met ``SolverAiDeadlineExceededError`` is raised.
+        """
+        with self._boundedCall('runSolver', deadline_seconds):
+            return self.__runSolverUntilSetupComplete(
+                input,
+                setup_wait_strategy=setup_wait_strategy,
+            )
+
+    def runSolverBatch(
+        self,
+        inputs: Iterable[SolverAiComputeInput],
+        max_concurrency: Optional[int] = None,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+    ) -> list[Union[SolverAiComputeResults, Exception]]:
+        """
+        Runs ``runSolver`` over ``inputs`` with at most ``max_concurrency``
+        solves in flight (default: the transport's ``pool_maxsize``).
+
+        Returns one entry per input, in input order: the
+        ``SolverAiComputeResults`` on success, or the raised exception for
+        that item. One item failing never aborts the rest of the batch.
+
+        All items share one drain retry budget, so a drain seen by many items
+        at once costs one retry round rather than one per item.
+        """
+        inputs = list(inputs)
+        if not inputs:
+            return []
+
+        if max_concurrency is None:
+            max_concurrency = self.__transport.pool_maxsize
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1.')
+
+        budget = self._newDrainRetryBudget()
+
+        def run_one(input):
+            try:
+                with self._instrumentedCall('runSolver'):
+                    return self.__runSolverUntilSetupComplete(
+                        input,
+                        budget,
+                        setup_wait_strategy,
+                    )
+            except Exception as error:
+                return error
 
-        return self.__runWithDrainRetry(run_until_setup_complete)
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(inputs))
+        ) as executor:
+            # Preserve order by reading futures in submission order
+            futures = [executor.submit(run_one, input) for input in inputs]
+            return [future.result() for future in futures]
@@ -23,3 +23,56 @@ class SolverAiDrainingException(Exception):
                 message += f" (retry after {retry_after_seconds}s)"
 
         super().__init__(message)
+
+
+class SolverAiWaitTimeoutError(TimeoutError):
+    def __init__(
+        self,
+        poll_count=0,
+        waited_seconds=0.0,
+        message=None,
+    ):
+        self.poll_count = poll_count
+        self.waited_seconds = waited_seconds
+
+        if message is None:
+            message = 'Timed out waiting for the problem to become ready.'
+
+        super().__init__(message)
+
+
+class SolverAiRateLimitedError(Exception):
+    def __init__(self, kind, retry_after_seconds=None, message=None):
+        self.kind = kind
+        self.retry_after_seconds = retry_after_seconds
+
+        if message is None:
+            message = f"Rate limit for {kind} requests exceeded"
+            if retry_after_seconds is not None:
+                message += f" (retry after {retry_after_seconds:.3f}s)"
+
+        super().__init__(message)
+
+
+class SolverAiCircuitOpenError(Exception):
+    def __init__(self, retry_after_seconds=None, message=None):
+        self.retry_after_seconds = retry_after_seconds
+
+        if message is None:
+            message = "Circuit breaker is open"
+            if retry_after_seconds is not None:
+                message += f" (retry after {retry_after_seconds:.3f}s)"
+
+        super().__init__(message)
+
+
+class SolverAiDeadlineExceededError(TimeoutError):
+    def __init__(self, deadline_seconds=None, message=None):
+        self.deadline_seconds = deadline_seconds
+
+        if message is None:
+            message = "Call deadline exceeded"
+            if deadline_seconds is not None:
+                message += f" ({deadline_seconds:.3f}s)"
+
+        super().__init__(message)
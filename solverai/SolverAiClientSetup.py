@@ -1,7 +1,7 @@
-from typing import Union
+from time import perf_counter
+from typing import Optional, Union
 from re import escape
 from requests import get, post, patch, delete
-from json import loads, dumps
 from re import search
 from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
@@ -9,6 +9,14 @@ import io
 
 import pandas as pd
 
+from .SolverAiInstrumentation import (
+    SolverAiInstrumentation,
+    active_recorder,
+    instrumented_call,
+)
+from .SolverAiJsonCodec import get_json_codec, loads_response
+from .SolverAiTransport import send_instrumented
+
 
 class SolverAiClientSetup:
 
@@ -21,7 +29,8 @@ class SolverAiClientSetup:
         self,
         datamanagerUrl: str,
         token: str,
-        post_batch: bool = False
+        post_batch: bool = False,
+        instrumentation: Optional[SolverAiInstrumentation] = None,
     ) -> None:
         self.__base_url_DM = datamanagerUrl + "/api/data/"
         self.__headers = {
@@ -35,6 +44,52 @@ class SolverAiClientSetup:
 
         self.__post_batch = post_batch
         self.__post_batch_queue = []
+        self.__instrumentation = instrumentation
+
+    @property
+    def instrumentation(self) -> Optional[SolverAiInstrumentation]:
+        return self.__instrumentation
+
+    def __instrumentedCall(self, method: str, urlSuffix: str):
+        """One instrumented call per HTTP request, named e.g. 'POST equations'."""
+        return instrumented_call(
+            self.__instrumentation,
+            'setup',
+            f'{method} {urlSuffix}',
+        )
+
+    @staticmethod
+    def __send(httpFunction, method: str, url: str, **kwargs):
+        if active_recorder() is None:
+            return httpFunction(url, **kwargs)
+        return send_instrumented(
+            lambda _method, url, **kwargs: httpFunction(url, **kwargs),
+            method,
+            url,
+            **kwargs,
+        )
+
+    @staticmethod
+    def __loads(response):
+        recorder = active_recorder()
+        if recorder is None:
+            return loads_response(response)
+        started = perf_counter()
+        try:
+            return loads_response(response)
+        finally:
+            recorder.addPhase('decode', perf_counter() - started)
+
+    @staticmethod
+    def __serialize(serializer, *args):
+        recorder = active_recorder()
+        if recorder is None:
+            return serializer(*args)
+        started = perf_counter()
+        try:
+            return serializer(*args)
+        finally:
+            recorder.addPhase('serialize', perf_counter() - started)
 
     def _postPatch(self, urlSuffix, data: dict, filePath_or_df: tuple, id=None):
         """
@@ -56,6 +111,11 @@ class SolverAiClientSetup:
         return self.__execute_postpatch(urlSuffix, data, filePath_or_df, id)
 
     def __execute_postpatch(self, urlSuffix, data: dict, filePath_or_df: tuple, id=None):
+        method = 'POST' if id is None else 'PATCH'
+        with self.__instrumentedCall(method, urlSuffix):
+            return self.__run_postpatch(urlSuffix, data, filePath_or_df, id)
+
+    def __run_postpatch(self, urlSuffix, data: dict, filePath_or_df: tuple, id=None):
         isPost = True
         if id is not None:
             isPost = False
@@ -63,9 +123,11 @@ class SolverAiClientSetup:
         if isPost:
             url = f'{self.__base_url_DM}{urlSuffix}/'
             httpFunction = post
+            method = 'POST'
         else:
             url = f'{self.__base_url_DM}{urlSuffix}/{id}/'
             httpFunction = patch
+            method = 'PATCH'
 
         tempData = data.copy()
         if 'vectorizationIndices' in tempData and \
@@ -74,8 +136,11 @@ class SolverAiClientSetup:
         if filePath_or_df is not None:
             try:
                 is_close = False
-                file_content, is_close = self.__post_patch_data_processor(filePath_or_df[0])
-                response = httpFunction(
+                file_content, is_close = self.__serialize(
+                    self.__post_patch_data_processor, filePath_or_df[0]
+                )
+                response = self.__send(
+                    httpFunction, method,
                     url, headers=self.__headers, data=tempData,
                     files={filePath_or_df[1]: file_content}
                 )
@@ -85,9 +150,9 @@ class SolverAiClientSetup:
         else:  # If no files, convert data to a JSON string
             headers = self.__headers.copy()
             headers["Content-Type"] = "application/json"
-            jsonData = dumps(tempData)
-            response = httpFunction(
-                url, headers=headers, data=jsonData
+            jsonData = self.__serialize(get_json_codec().dumps, tempData)
+            response = self.__send(
+                httpFunction, method, url, headers=headers, data=jsonData
             )
 
         return self.__processResponse(response)
@@ -183,25 +248,26 @@ class SolverAiClientSetup:
     def __processResponse(self, response):
         if self.__isStatusCodeOk(response):
             try:
-                data = loads(response.text)
+                data = self.__loads(response)
             except Exception:
                 raise Exception('Failed retrieving data.')
             return data['id']
         else:
-            raise Exception(f'Failed with code: {loads(response.text)}.')
+            raise Exception(f'Failed with code: {self.__loads(response)}.')
 
     def __getIds(self, urlSuffix: str, nameRegex: str):
         url = f'{self.__base_url_DM}{urlSuffix}/'
         headers = self.__headers.copy()
-        response = get(
-            url, headers=headers
-        )
-        if response.status_code != 200:
-            raise Exception(loads(response.text)['detail'])
-        try:
-            data = loads(response.text)
-        except Exception:
-            raise Exception('Failed retrieving data.')
+        with self.__instrumentedCall('GET', urlSuffix):
+            response = self.__send(
+                get, 'GET', url, headers=headers
+            )
+            if response.status_code != 200:
+                raise Exception(self.__loads(response)['detail'])
+            try:
+                data = self.__loads(response)
+            except Exception:
+                raise Exception('Failed retrieving data.')
 
         ids = list()
         for module in data:
@@ -248,7 +314,8 @@ class SolverAiClientSetup:
     def __deleteId(self, urlSuffix: str, id: str) -> str:
         error = ''
         url = f'{self.__base_url_DM}{urlSuffix}/{id}/'
-        response = delete(url, headers=self.__headers)
+        with self.__instrumentedCall('DELETE', urlSuffix):
+            response = self.__send(delete, 'DELETE', url, headers=self.__headers)
         if not self.__isStatusCodeOk(response):
             error = f'Failed Deleting: {url}\n'
         return error
@@ -507,18 +574,19 @@ class SolverAiClientSetup:
     def __getOne(self, urlSuffix: str, id: str) -> dict:
         """GET /<urlSuffix>/<id>/ and return parsed JSON dict."""
         url = f'{self.__base_url_DM}{urlSuffix}/{id}/'
-        response = get(url, headers=self.__headers)
-        if not self.__isStatusCodeOk(response):
-            # keep error style consistent with your other methods
+        with self.__instrumentedCall('GET', urlSuffix):
+            response = self.__send(get, 'GET', url, headers=self.__headers)
+            if not self.__isStatusCodeOk(response):
+                # keep error style consistent with your other methods
+                try:
+                    raise Exception(self.__loads(response).get('detail', response.text))
+                except Exception:
+                    raise Exception(f"Failed GET: {url} (status={response.status_code})")
+
             try:
-                raise Exception(loads(response.text).get('detail', response.text))
+                return self.__loads(response)
             except Exception:
-                raise Exception(f"Failed GET: {url} (status={response.status_code})")
-
-        try:
-            return loads(response.text)
-        except Exception:
-            raise Exception("Failed retrieving data.")
+                raise Exception("Failed retrieving data.")
 
     def getProblemModuleIdsByName(self, problem_name: str):
         """
@@ -1,6 +1,9 @@
 from enum import Enum
+from hashlib import sha256
 from json import dumps
 
+from .SolverAiJsonCodec import get_json_codec
+
 
 class CONSTRAINT(Enum):
     SMALLER_THAN = 'smaller than'
@@ -59,12 +62,36 @@ class SolverAiComputeInput:
         self.objectives[name] = {
             'Operation': operation.value}
 
-    def getJson(self):
-        return dumps({
+    def __payload(self):
+        return {
             'id': self.problem_id,
             'solverSetup': self.solverSetup,
             'inputs': self.inputs,
             'constraints': self.constraints,
             'objectives': self.objectives,
             'isDebug': self.isDebug
-        })
+        }
+
+    def getJson(self):
+        return self.getJsonBytes().decode('utf-8')
+
+    def getJsonBytes(self) -> bytes:
+        """UTF-8 encoded solve payload, as sent to ``solvejson/``."""
+        return get_json_codec().dumps(self.__payload())
+
+    def getFingerprint(self) -> str:
+        """
+        SHA-256 hex digest of the canonical ``getJson()`` payload.
+
+        Keys are sorted and whitespace is dropped, so two inputs that
+        serialize to the same solve request share a fingerprint regardless
+        of the order in which inputs, constraints or objectives were added.
+        Always built with the standard library, so the key is the same
+        whichever JSON codec is active.
+        """
+        canonical = dumps(
+            self.__payload(),
+            sort_keys=True,
+            separators=(',', ':'),
+        )
+        return sha256(canonical.encode('utf-8')).hexdigest()
@@ -1,20 +1,330 @@
-from ast import literal_eval
+from array import array
+from typing import Optional
+
 import pandas as pd
 
+from .SolverAiNumericParser import (
+    is_float_block,
+    locked_literal_eval,
+    np,
+    parse_rows,
+    rows_to_array,
+)
+
+
+BUILDER_CHUNK_ROWS = 512
+
+
+def block_from_values(values: array, width: int, count: int, float32: bool = False):
+    """
+    Storage for ``count`` rows of ``width`` floats held row after row in one
+    ``array('d')``; with NumPy the array is wrapped without a copy, without
+    it the rows are unpacked into lists.
+    """
+    if np is None:
+        return [values[index * width:(index + 1) * width].tolist() for index in range(count)]
+    if width == 0 or count == 0:
+        block = np.empty((count, width), dtype=np.float64)
+    else:
+        block = np.frombuffer(values, dtype=np.float64).reshape(count, width)
+    return block.astype(np.float32) if float32 else block
+
+
+def pack_rows(rows, width: int, float32: bool = False, integers: tuple = ()):
+    """
+    Packs parsed rows into a C-contiguous ``(rows, width)`` NumPy array of
+    float64 (float32 with ``float32``) and returns ``(block, integers)``,
+    ``integers`` being the columns that held only ints, which read back as
+    ints. Rows are packed only when every value is exact: rows holding
+    anything else (``None``, strings), ints beyond 2**53 (2**24 with
+    ``float32``), ragged rows and every block without NumPy stay a list.
+    Storage that is already packed, with int columns ``integers``, is only
+    cast.
+    """
+    if np is None:
+        return rows, ()
+    dtype = np.float32 if float32 else np.float64
+    if len(rows) == 0:
+        return np.empty((0, width), dtype=dtype), ()
+    limit = 2 ** 24 if float32 else 2 ** 53
+    if isinstance(rows, np.ndarray):
+        if integers and float32 and np.abs(rows[:, list(integers)]).max() > limit:
+            return rows, integers
+        return rows.astype(dtype, copy=False), integers
+    if is_float_block(rows):
+        integers = ()
+    else:
+        integers = _integer_columns(rows, limit)
+        if integers is None:
+            return rows, ()
+    try:
+        block = np.array(rows, dtype=dtype)
+    except ValueError:
+        return rows, ()
+    return (block, integers) if block.ndim == 2 else (rows, ())
+
+
+def _integer_columns(rows: list, limit: int) -> Optional[tuple]:
+    """The columns of ``rows`` holding only ints no larger than ``limit``,
+    or None when a column mixes types, holds anything but ints and floats,
+    or the rows are ragged."""
+    width = len(rows[0])
+    if any(len(row) != width for row in rows):
+        return None
+    integers = []
+    for index, column in enumerate(zip(*rows)):
+        types = set(map(type, column))
+        if types == {int}:
+            if max(map(abs, column)) > limit:
+                return None
+            integers.append(index)
+        elif types != {float}:
+            return None
+    return tuple(integers)
+
+
+def dataframe_layout(inputVariableNames: list, outputVariableNames: list):
+    """
+    Column layout of a results frame: ``(keep_idx, columns)``, where
+    ``keep_idx`` indexes the inputs that are not also outputs and ``columns``
+    names those inputs followed by every output.
+    """
+    outputs = set(outputVariableNames)
+    keep_idx = [
+        i for i, variable in enumerate(inputVariableNames) if variable not in outputs
+    ]
+    columns = [inputVariableNames[i] for i in keep_idx] + list(outputVariableNames)
+    return keep_idx, columns
+
+
+def _column_runs(keep_idx: list) -> list:
+    """``keep_idx`` as ``(start, stop)`` runs of consecutive columns, which
+    copy as plain slices."""
+    runs = []
+    for index in keep_idx:
+        if runs and runs[-1][1] == index:
+            runs[-1][1] = index + 1
+        else:
+            runs.append([index, index + 1])
+    return [tuple(run) for run in runs]
+
+
+def _block_rows(block, rows: slice = slice(None), integers: tuple = ()) -> list:
+    if isinstance(block, list):
+        return block[rows]
+    rows = block[rows].tolist()
+    if integers:
+        for row in rows:
+            for index in integers:
+                row[index] = int(row[index])
+    return rows
+
+
+def _join_blocks(blocks: list, count: int):
+    """The first ``count`` rows of consecutive ``(block, integers)`` pairs,
+    as one such pair."""
+    if (
+        np is not None
+        and blocks
+        and all(isinstance(block, np.ndarray) for block, _ in blocks)
+        and len({integers for _, integers in blocks}) == 1
+    ):
+        integers = blocks[0][1]
+        if len(blocks) == 1:
+            return blocks[0][0][:count], integers
+        try:
+            return np.concatenate([block for block, _ in blocks])[:count], integers
+        except ValueError:
+            pass
+    rows = []
+    for block, integers in blocks:
+        rows.extend(_block_rows(block, integers=integers))
+    return rows[:count], ()
+
 
 class SolverAiComputeResults:
-    def __init__(self, j: dict):
+    """
+    Results of one solve.
+
+    Names and counts are parsed up front; the ``X`` and ``Y`` rows are kept
+    as their raw strings and each block is decoded on first access, after
+    which its strings are released. ``getXRow``/``getXRows`` (and the ``Y``
+    counterparts) decode only the rows asked for while a block is still raw.
+
+    Decoded blocks of ints and floats are kept packed by ``pack_rows``,
+    float32 when built with ``float32=True``, with their int columns noted
+    so those read back as ints; ``getXArray()``/``getYArray()`` return the
+    stored arrays themselves. ``getX()``/``getY()`` turn a block into a list
+    of rows once and return that same list from then on, so changes made to
+    it are kept; ``compact()`` packs it again.
+
+    ``getDataFrame()`` builds a new frame from the stored arrays in one copy;
+    ``getDataFrame(copy=False)`` gives one whose columns are read-only views
+    of the stored arrays.
+    """
+
+    __slots__ = (
+        'numberOfResults',
+        'objectiveVariableNames',
+        'constraintVariableNames',
+        'inputVariableNames',
+        'outputVariableNames',
+        '__texts',
+        '__blocks',
+        '__integers',
+        '__float32',
+        '__arrays',
+        '__layout',
+    )
+
+    def __init__(self, j: dict, float32: bool = False):
+        numberOfResults = j["Number Of Results"]
+        self.__setFields(j, float32)
+        self.__texts = {
+            'X': [j["X" + str(i)] for i in range(numberOfResults)],
+            'Y': [j["Y" + str(i)] for i in range(numberOfResults)],
+        }
+        self.__blocks = {'X': None, 'Y': None}
+
+    def __setFields(self, j: dict, float32: bool) -> None:
         self.numberOfResults = j["Number Of Results"]
         self.objectiveVariableNames = \
-            literal_eval(j["Objective Variable Names"])
+            locked_literal_eval(j["Objective Variable Names"])
         self.constraintVariableNames = \
-            literal_eval(j["Constraint Variable Names"])
-        self.inputVariableNames = literal_eval(j["Input Variable Names"])
-        self.outputVariableNames = literal_eval(j["Output Variable Names"])
-        self.X = [list(literal_eval(j["X" + str(i)]))
-                  for i in range(self.numberOfResults)]
-        self.Y = [list(literal_eval(j["Y" + str(i)]))
-                  for i in range(self.numberOfResults)]
+            locked_literal_eval(j["Constraint Variable Names"])
+        self.inputVariableNames = \
+            locked_literal_eval(j["Input Variable Names"])
+        self.outputVariableNames = \
+            locked_literal_eval(j["Output Variable Names"])
+        self.__float32 = float32
+        self.__integers = {'X': (), 'Y': ()}
+        self.__arrays = {}
+        self.__layout = None
+
+    @classmethod
+    def _fromParsed(
+        cls,
+        j: dict,
+        X,
+        Y,
+        float32: bool = False,
+        integers: tuple = ((), ()),
+    ) -> 'SolverAiComputeResults':
+        """Builds results whose ``X``/``Y`` rows were already parsed, as
+        lists of rows or packed storage whose int columns are ``integers``
+        (for ``X``, then ``Y``)."""
+        results = cls.__new__(cls)
+        results.__setFields(j, float32)
+        results.__texts = {'X': None, 'Y': None}
+        results.__blocks = {}
+        for prefix, rows, columns in zip(('X', 'Y'), (X, Y), integers):
+            results.__blocks[prefix], results.__integers[prefix] = pack_rows(
+                rows,
+                results.__width(prefix),
+                float32,
+                columns,
+            )
+        return results
+
+    @classmethod
+    def _fromRowTexts(
+        cls,
+        j: dict,
+        X: list,
+        Y: list,
+        float32: bool = False,
+    ) -> 'SolverAiComputeResults':
+        """Builds results from the raw ``X{i}``/``Y{i}`` strings, in order."""
+        results = cls.__new__(cls)
+        results.__setFields(j, float32)
+        results.__texts = {'X': X, 'Y': Y}
+        results.__blocks = {'X': None, 'Y': None}
+        return results
+
+    @property
+    def X(self) -> list:
+        return self.__listed('X')
+
+    @X.setter
+    def X(self, X: list) -> None:
+        self.__replace('X', X)
+
+    @property
+    def Y(self) -> list:
+        return self.__listed('Y')
+
+    @Y.setter
+    def Y(self, Y: list) -> None:
+        self.__replace('Y', Y)
+
+    def __width(self, prefix: str) -> int:
+        if prefix == 'X':
+            return len(self.inputVariableNames)
+        return len(self.outputVariableNames)
+
+    def __decoded(self, prefix: str):
+        block = self.__blocks[prefix]
+        if block is None:
+            texts = self.__texts[prefix]
+            if texts is None:
+                # Another thread decoded the block in the meantime
+                return self.__blocks[prefix]
+            block, self.__integers[prefix] = pack_rows(
+                parse_rows(texts),
+                self.__width(prefix),
+                self.__float32,
+            )
+            self.__blocks[prefix] = block
+            self.__texts[prefix] = None
+        return block
+
+    def __listed(self, prefix: str) -> list:
+        block = self.__decoded(prefix)
+        if not isinstance(block, list):
+            self.__replace(prefix, _block_rows(block, integers=self.__integers[prefix]))
+            block = self.__blocks[prefix]
+        return block
+
+    def __replace(self, prefix: str, rows: list) -> None:
+        self.__blocks[prefix] = rows
+        self.__integers[prefix] = ()
+        self.__texts[prefix] = None
+        self.__arrays.pop(prefix, None)
+
+    def __slice(self, prefix: str, rows: slice) -> list:
+        block = self.__blocks[prefix]
+        if block is None:
+            texts = self.__texts[prefix]
+            if texts is not None:
+                block, integers = parse_rows(texts[rows]), ()
+                if self.__float32:
+                    # Rounded like the whole block would be
+                    block, integers = pack_rows(block, self.__width(prefix), True)
+                return _block_rows(block, integers=integers)
+            block = self.__blocks[prefix]
+        return _block_rows(block, rows, self.__integers[prefix])
+
+    def compact(self, float32: Optional[bool] = None) -> 'SolverAiComputeResults':
+        """
+        Decodes both blocks now and packs those holding only ints and
+        floats (see ``pack_rows``), releasing the raw strings and any lists given out by ``getX()`` /
+        ``getY()``. ``float32=True`` also downcasts the stored values to
+        float32 (about 7 significant digits), halving their size. Returns
+        these results.
+        """
+        if float32 is not None:
+            self.__float32 = float32
+        for prefix in ('X', 'Y'):
+            block, integers = pack_rows(
+                self.__decoded(prefix),
+                self.__width(prefix),
+                self.__float32,
+                self.__integers[prefix],
+            )
+            self.__integers[prefix] = integers
+            self.__blocks[prefix] = block
+        self.__arrays = {}
+        return self
 
     def getNumberOfResults(self) -> int:
         return self.numberOfResults
@@ -37,17 +347,169 @@ class SolverAiComputeResults:
     def getY(self):
         return self.Y
 
-    def getDataFrame(self) -> pd.DataFrame:
-        inputVariableNames = self.getInputVariableNames()
-        outputVariableNames = self.getOutputVariableNames()
-        X = self.getX()
-        keep_idx = \
-            [i for i, variable in enumerate(inputVariableNames) if variable not in outputVariableNames]
-        if len(keep_idx) != len(inputVariableNames):
-            inputVariableNames = [inputVariableNames[i] for i in keep_idx]
-            X = [[row[i] for i in keep_idx] for row in X]
-        all_var_names = inputVariableNames + outputVariableNames
-        all_data = [
-            x + y for x, y in zip(X, self.getY())
-        ]
-        return pd.DataFrame(all_data, columns=all_var_names)
+    def getXRow(self, index: int) -> list:
+        return self.__slice('X', slice(index, index + 1 or None))[0]
+
+    def getYRow(self, index: int) -> list:
+        return self.__slice('Y', slice(index, index + 1 or None))[0]
+
+    def getXRows(
+        self,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> list:
+        return self.__slice('X', slice(start, stop))
+
+    def getYRows(
+        self,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> list:
+        return self.__slice('Y', slice(start, stop))
+
+    def getXArray(self):
+        """The ``X`` block as a NumPy array, results x inputs: the stored
+        array itself when the block is packed (float64, or float32 for
+        float32 results), else a float64 copy of its rows."""
+        return self.__array('X')
+
+    def getYArray(self):
+        """The ``Y`` block as a NumPy array, results x outputs: the stored
+        array itself when the block is packed (float64, or float32 for
+        float32 results), else a float64 copy of its rows."""
+        return self.__array('Y')
+
+    def __array(self, prefix: str):
+        block = self.__decoded(prefix)
+        if np is not None and isinstance(block, np.ndarray):
+            return block
+        array = self.__arrays.get(prefix)
+        if array is None:
+            array = self.__arrays[prefix] = rows_to_array(
+                block,
+                self.__width(prefix),
+                prefix,
+            )
+        return array
+
+    def getDataFrame(self, copy: bool = True) -> pd.DataFrame:
+        """
+        The inputs that are not also outputs, then the outputs, one row per
+        result, in a new frame on every call. The column layout is worked
+        out once.
+
+        With NumPy storage the frame is filled from the stored arrays in one
+        copy. ``copy=False`` skips that copy: each column is a read-only
+        view of the stored arrays, so the frame cannot change the results.
+        Columns that held only ints are int64, converted from the stored
+        floats.
+        """
+        if self.__layout is None:
+            keep_idx, columns = dataframe_layout(
+                self.inputVariableNames,
+                self.outputVariableNames,
+            )
+            self.__layout = keep_idx, _column_runs(keep_idx), columns
+        keep_idx, runs, columns = self.__layout
+        X = self.__decoded('X')
+        Y = self.__decoded('Y')
+        integers = self.__integers
+
+        if np is None or not isinstance(X, np.ndarray) or not isinstance(Y, np.ndarray):
+            X = _block_rows(X, integers=integers['X'])
+            if len(keep_idx) != len(self.inputVariableNames):
+                X = [[row[i] for i in keep_idx] for row in X]
+            return pd.DataFrame(
+                [x + y for x, y in zip(X, _block_rows(Y, integers=integers['Y']))],
+                columns=columns,
+            )
+
+        width = len(keep_idx)
+        intColumns = [
+            column for column, index in enumerate(keep_idx) if index in integers['X']
+        ] + [width + index for index in integers['Y']]
+        if copy:
+            data = np.empty((len(X), width + Y.shape[1]), dtype=np.result_type(X, Y))
+            column = 0
+            for start, stop in runs:
+                data[:, column:column + stop - start] = X[:, start:stop]
+                column += stop - start
+            data[:, width:] = Y
+            if not intColumns:
+                return pd.DataFrame(data, columns=columns, copy=False)
+            views = [data[:, column] for column in range(data.shape[1])]
+        else:
+            views = [X[:, i] for i in keep_idx] + [Y[:, i] for i in range(Y.shape[1])]
+            for view in views:
+                view.flags.writeable = False
+        for column in intColumns:
+            views[column] = views[column].astype(np.int64)
+        return pd.DataFrame(dict(zip(columns, views)), columns=columns, copy=False)
+
+
+class SolverAiComputeResultsBuilder:
+    """
+    Builds ``SolverAiComputeResults`` from ``results`` members fed one at a
+    time, e.g. while a solve response is still streaming in.
+
+    ``X{i}``/``Y{i}`` strings are parsed in blocks of ``BUILDER_CHUNK_ROWS``
+    consecutive rows as they arrive, packed like a decoded block and
+    dropped, so the row strings of a whole response are never held at
+    once; rows arriving out of order wait for the rows before them.
+    ``keep_raw`` also keeps every member in ``raw`` (needed when the raw
+    results are also written to a result cache); ``float32`` is passed on
+    to the results.
+    """
+
+    def __init__(self, keep_raw: bool = False, float32: bool = False) -> None:
+        self.__fields = {}
+        self.__pending = {'X': {}, 'Y': {}}
+        self.__blocks = {'X': [], 'Y': []}
+        # Rows parsed so far, and the end of the consecutive rows after them
+        self.__parsed = {'X': 0, 'Y': 0}
+        self.__ready = {'X': 0, 'Y': 0}
+        self.__raw = {} if keep_raw else None
+        self.__float32 = float32
+
+    @property
+    def raw(self):
+        """Raw ``results`` dict when built with ``keep_raw``, else None."""
+        return self.__raw
+
+    def add(self, key: str, value) -> None:
+        if self.__raw is not None:
+            self.__raw[key] = value
+        prefix, index = key[:1], key[1:]
+        if prefix in self.__pending and index.isdecimal():
+            pending = self.__pending[prefix]
+            pending[int(index)] = value
+            ready = self.__ready[prefix]
+            while ready in pending:
+                ready += 1
+            self.__ready[prefix] = ready
+            if ready - self.__parsed[prefix] >= BUILDER_CHUNK_ROWS:
+                self.__parseRows(prefix, ready)
+        else:
+            self.__fields[key] = value
+
+    def __parseRows(self, prefix: str, stop: int) -> None:
+        pending = self.__pending[prefix]
+        rows = parse_rows([pending.pop(i) for i in range(self.__parsed[prefix], stop)])
+        self.__blocks[prefix].append(pack_rows(rows, 0, self.__float32))
+        self.__parsed[prefix] = stop
+
+    def build(self) -> SolverAiComputeResults:
+        numberOfResults = self.__fields["Number Of Results"]
+        for prefix in ('X', 'Y'):
+            if self.__parsed[prefix] < numberOfResults:
+                self.__parseRows(prefix, numberOfResults)
+            self.__pending[prefix].clear()
+        X, xIntegers = _join_blocks(self.__blocks['X'], numberOfResults)
+        Y, yIntegers = _join_blocks(self.__blocks['Y'], numberOfResults)
+        return SolverAiComputeResults._fromParsed(
+            self.__fields,
+            X,
+            Y,
+            self.__float32,
+            (xIntegers, yIntegers),
+        )
@@ -0,0 +1,141 @@
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import monotonic
+from typing import Iterable, Optional, Tuple
+
+from .SolverAiClientExceptions import SolverAiDeadlineExceededError
+
+
+@dataclass(frozen=True)
+class SolverAiTimeouts:
+    """
+    Socket timeouts of Computer requests, in seconds.
+
+    connect_seconds: TCP/TLS connection setup
+    status_read_seconds: wait for the next byte of a ``check_problem_status/``
+        or ``problem_setup/`` response
+    solve_read_seconds: wait for the next byte of a ``solvejson/`` response,
+        including the time the Computer spends solving before it answers;
+        off by default, as solves may run for as long as they need
+
+    None disables that timeout. An active call deadline lowers every timeout
+    to the time it has left.
+    """
+    connect_seconds: Optional[float] = 10.0
+    status_read_seconds: Optional[float] = 60.0
+    solve_read_seconds: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        for name in ('connect_seconds', 'status_read_seconds', 'solve_read_seconds'):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f'{name} must be positive.')
+
+    def forRequest(
+        self,
+        kind: str,
+        remaining_seconds: Optional[float] = None,
+    ) -> Optional[Tuple[Optional[float], Optional[float]]]:
+        """``(connect, read)`` for a request of ``kind`` ('solve' or 'status')."""
+        read_seconds = (
+            self.solve_read_seconds if kind == 'solve'
+            else self.status_read_seconds
+        )
+        connect_seconds = self.connect_seconds
+        if remaining_seconds is not None:
+            connect_seconds = min(connect_seconds or math.inf, remaining_seconds)
+            read_seconds = min(read_seconds or math.inf, remaining_seconds)
+        if connect_seconds is None and read_seconds is None:
+            return None
+        return connect_seconds, read_seconds
+
+
+class _SolverAiDeadline:
+
+    __slots__ = ('expires_at', 'budget_seconds')
+
+    def __init__(self, expires_at: float, budget_seconds: float) -> None:
+        self.expires_at = expires_at
+        self.budget_seconds = budget_seconds
+
+
+# Deadline of the call in progress, seen by every layer below it
+_active_deadline: ContextVar = ContextVar(
+    'solverai_active_deadline',
+    default=None,
+)
+
+
+@contextmanager
+def deadline_scope(deadline_seconds: Optional[float]):
+    """
+    Bounds the enclosed call to ``deadline_seconds`` from now. A call nested
+    in one with an earlier deadline keeps the earlier one.
+    """
+    if deadline_seconds is None:
+        yield
+        return
+    if deadline_seconds < 0:
+        raise ValueError('deadline_seconds must not be negative.')
+
+    deadline = _SolverAiDeadline(monotonic() + deadline_seconds, deadline_seconds)
+    current = _active_deadline.get()
+    if current is not None and current.expires_at <= deadline.expires_at:
+        yield
+        return
+    token = _active_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _active_deadline.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """Seconds left before the active deadline, or None without one."""
+    deadline = _active_deadline.get()
+    if deadline is None:
+        return None
+    return deadline.expires_at - monotonic()
+
+
+def deadline_exceeded_error() -> Optional[SolverAiDeadlineExceededError]:
+    """The error to raise once the active deadline has passed, else None."""
+    deadline = _active_deadline.get()
+    if deadline is None or monotonic() < deadline.expires_at:
+        return None
+    return SolverAiDeadlineExceededError(deadline.budget_seconds)
+
+
+def check_deadline() -> Optional[float]:
+    """Raises once the active deadline has passed; returns the time left."""
+    deadline = _active_deadline.get()
+    if deadline is None:
+        return None
+    left_seconds = deadline.expires_at - monotonic()
+    if left_seconds <= 0:
+        raise SolverAiDeadlineExceededError(deadline.budget_seconds)
+    return left_seconds
+
+
+def check_wait(wait_seconds: float) -> float:
+    """
+    Returns ``wait_seconds`` when the active deadline leaves room for the
+    wait and a request after it; raises now otherwise rather than sleeping
+    into a certain timeout.
+    """
+    deadline = _active_deadline.get()
+    if (
+        deadline is not None
+        and monotonic() + wait_seconds >= deadline.expires_at
+    ):
+        raise SolverAiDeadlineExceededError(deadline.budget_seconds)
+    return wait_seconds
+
+
+def iter_within_deadline(chunks: Iterable[bytes]):
+    """Yields ``chunks``, raising once the active deadline passes."""
+    for chunk in chunks:
+        check_deadline()
+        yield chunk
@@ -0,0 +1,201 @@
+from threading import Lock
+from time import monotonic
+from typing import Optional, Tuple
+
+
+class _SolverAiDrainWaiter:
+    """State of one call waiting out a drain."""
+
+    __slots__ = ('episode', 'seq', 'probe', 'pending')
+
+    def __init__(self, episode: int, seq: int) -> None:
+        self.episode = episode
+        self.seq = seq
+        self.probe = False
+        # What the last returned delay was waiting for
+        self.pending = None
+
+
+class SolverAiDrainCoordinator:
+    """
+    Drain state shared by every call talking to one Computer.
+
+    A drain is a property of the Computer, not of a single call: the first
+    ``503 Draining`` publishes a resume time that every call sharing the
+    coordinator waits on. Once it passes, exactly one call is let through as
+    a probe while the others keep waiting. When the probe gets any answer
+    other than a drain, the waiting calls are released in arrival order,
+    spread over ``release_spread_seconds`` so they do not all hit the
+    Computer at the same instant. A probe that is drained again publishes
+    the new resume time and the cycle repeats, so each drain round costs one
+    request rather than one per caller.
+
+    release_spread_seconds: window over which waiting calls are released
+    probe_poll_seconds: how often waiting calls check on the probe
+    probe_timeout_seconds: a probe without an answer after this long is
+        taken as accepted (drain rejections are immediate), releasing the
+        waiting calls; None waits for the probe's answer however long
+
+    Every compute client owns one by default; pass one instance as
+    ``drain_coordinator=`` to share it between clients.
+    """
+
+    def __init__(
+        self,
+        release_spread_seconds: float = 1.0,
+        probe_poll_seconds: float = 0.1,
+        probe_timeout_seconds: Optional[float] = 5.0,
+    ) -> None:
+        if release_spread_seconds < 0:
+            raise ValueError('release_spread_seconds must not be negative.')
+        if probe_poll_seconds <= 0:
+            raise ValueError('probe_poll_seconds must be positive.')
+
+        self.release_spread_seconds = release_spread_seconds
+        self.probe_poll_seconds = probe_poll_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.__lock = Lock()
+        self.__draining = False
+        self.__episode = 0
+        self.__next_seq = 0
+        self.__resume_at = 0.0
+        self.__probe_started_at = None
+        self.__released_episode = 0
+        self.__released_at = 0.0
+        self.__released_waiters = 0
+        self.__probes = 0
+
+    @property
+    def draining(self) -> bool:
+        return self.__draining
+
+    def delaySeconds(self) -> float:
+        """Seconds left before the announced resume time; 0 when not draining."""
+        with self.__lock:
+            if not self.__draining:
+                return 0.0
+            return max(self.__resume_at - monotonic(), 0.0)
+
+    def schedule(
+        self,
+        waiter: Optional[_SolverAiDrainWaiter] = None,
+    ) -> Tuple[float, Optional[_SolverAiDrainWaiter]]:
+        """
+        Returns ``(delay_seconds, waiter)``. With a delay of 0 the caller may
+        send now (as the probe when ``waiter.probe`` is set); otherwise it
+        sleeps ``delay_seconds`` and calls ``schedule`` again with ``waiter``.
+        Calling again counts as having slept the whole delay.
+        """
+        if waiter is None and not self.__draining:
+            return 0.0, None
+
+        with self.__lock:
+            now = monotonic()
+            if self.__draining:
+                if waiter is None or waiter.episode != self.__episode:
+                    waiter = self.__newWaiter()
+                if (
+                    now < self.__resume_at
+                    and waiter.pending != ('resume', self.__resume_at)
+                ):
+                    waiter.pending = ('resume', self.__resume_at)
+                    return self.__resume_at - now, waiter
+                if self.__probe_started_at is None:
+                    self.__probe_started_at = now
+                    self.__probes += 1
+                    waiter.probe = True
+                    waiter.pending = None
+                    return 0.0, waiter
+                if (
+                    self.probe_timeout_seconds is None
+                    or now - self.__probe_started_at < self.probe_timeout_seconds
+                ):
+                    waiter.pending = ('probe',)
+                    return self.probe_poll_seconds, waiter
+                self.__release(now)
+
+            if waiter.episode != self.__released_episode or waiter.probe:
+                return 0.0, None
+            release_at = self.__released_at
+            if self.__released_waiters:
+                release_at += (
+                    self.release_spread_seconds
+                    * waiter.seq / self.__released_waiters
+                )
+            if now >= release_at or waiter.pending == ('release', release_at):
+                return 0.0, None
+            waiter.pending = ('release', release_at)
+            return release_at - now, waiter
+
+    def noteDrain(
+        self,
+        wait_seconds: float,
+        waiter: Optional[_SolverAiDrainWaiter] = None,
+    ) -> _SolverAiDrainWaiter:
+        """
+        Publishes a drain expected to end in ``wait_seconds``. Returns the
+        caller's waiter, already counted as waiting for the published
+        resume time when the caller sleeps ``wait_seconds`` itself.
+        """
+        with self.__lock:
+            now = monotonic()
+            resume_at = now + max(wait_seconds, 0.0)
+            if not self.__draining:
+                self.__draining = True
+                self.__episode += 1
+                self.__next_seq = 0
+                self.__resume_at = resume_at
+            elif waiter is not None and waiter.probe:
+                # The probe was drained again: a new round starts now
+                self.__resume_at = resume_at
+            else:
+                self.__resume_at = max(self.__resume_at, resume_at)
+            if waiter is not None and waiter.probe:
+                self.__probe_started_at = None
+            if waiter is None or waiter.episode != self.__episode:
+                waiter = self.__newWaiter()
+            waiter.probe = False
+            waiter.pending = ('resume', self.__resume_at)
+            return waiter
+
+    def noteAnswer(self, waiter: Optional[_SolverAiDrainWaiter]) -> None:
+        """The probe got an answer other than a drain: release everyone."""
+        if waiter is None or not waiter.probe:
+            return
+        with self.__lock:
+            if self.__draining and waiter.episode == self.__episode:
+                self.__release(monotonic())
+            waiter.probe = False
+
+    def abandon(self, waiter: Optional[_SolverAiDrainWaiter]) -> None:
+        """The probe ended without an answer; the next caller probes instead."""
+        if waiter is None or not waiter.probe:
+            return
+        with self.__lock:
+            if self.__draining and waiter.episode == self.__episode:
+                self.__probe_started_at = None
+            waiter.probe = False
+
+    def getStats(self) -> dict:
+        with self.__lock:
+            return {
+                'draining': self.__draining,
+                'episodes': self.__episode,
+                'probes': self.__probes,
+                'delay_seconds': (
+                    max(self.__resume_at - monotonic(), 0.0)
+                    if self.__draining else 0.0
+                ),
+            }
+
+    def __newWaiter(self) -> _SolverAiDrainWaiter:
+        waiter = _SolverAiDrainWaiter(self.__episode, self.__next_seq)
+        self.__next_seq += 1
+        return waiter
+
+    def __release(self, now: float) -> None:
+        self.__draining = False
+        self.__probe_started_at = None
+        self.__released_episode = self.__episode
+        self.__released_at = now
+        self.__released_waiters = self.__next_seq
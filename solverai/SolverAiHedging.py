@@ -0,0 +1,171 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class SolverAiHedgingStats:
+    requests: int
+    hedged: int
+    hedge_wins: int
+    hedge_rate: float
+    win_rate: float
+    hedge_delay_seconds: float
+
+
+class SolverAiHedgingPolicy:
+    """
+    Hedged requests for the idempotent Computer reads
+    (``check_problem_status/`` and ``problem_setup/``).
+
+    percentile: latency percentile of recent reads used as the hedge delay
+    initial_delay_seconds: hedge delay until ``min_samples`` reads completed
+    min_delay_seconds / max_delay_seconds: bounds of the hedge delay
+    window_size: number of recent read latencies kept
+    max_workers: threads shared by all attempts sent under this policy
+
+    A read that has not answered within the hedge delay is sent a second
+    time; the first successful response wins. A request in flight cannot be
+    aborted, so the losing attempt is left to finish and its response is
+    closed as soon as it arrives, returning the connection to the pool.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay_seconds: float = 0.1,
+        min_delay_seconds: float = 0.005,
+        max_delay_seconds: Optional[float] = None,
+        min_samples: int = 20,
+        window_size: int = 256,
+        max_workers: int = 16,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError('percentile must be between 0 and 1.')
+        if min_samples < 1 or window_size < min_samples:
+            raise ValueError(
+                'min_samples must be at least 1 and at most window_size.'
+            )
+
+        self.percentile = percentile
+        self.initial_delay_seconds = initial_delay_seconds
+        self.min_delay_seconds = min_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.min_samples = min_samples
+        self.__lock = Lock()
+        self.__latencies = deque(maxlen=window_size)
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='solverai-hedge',
+        )
+        self.__requests = 0
+        self.__hedged = 0
+        self.__hedge_wins = 0
+
+    def hedgeDelaySeconds(self) -> float:
+        with self.__lock:
+            if len(self.__latencies) < self.min_samples:
+                delay_seconds = self.initial_delay_seconds
+            else:
+                latencies = sorted(self.__latencies)
+                index = min(
+                    int(self.percentile * len(latencies)),
+                    len(latencies) - 1,
+                )
+                delay_seconds = latencies[index]
+        delay_seconds = max(delay_seconds, self.min_delay_seconds)
+        if self.max_delay_seconds is not None:
+            delay_seconds = min(delay_seconds, self.max_delay_seconds)
+        return delay_seconds
+
+    def run(self, attempt: Callable[[], object]):
+        """
+        Runs ``attempt`` and, when it is slower than the hedge delay, a
+        second copy of it; returns the first successful result. Raises the
+        first error when every attempt fails.
+        """
+        with self.__lock:
+            self.__requests += 1
+        primary = self.__submit(attempt)
+        done, _ = wait([primary], timeout=self.hedgeDelaySeconds())
+        if done:
+            return primary.result()
+
+        hedge = self.__submit(attempt)
+        with self.__lock:
+            self.__hedged += 1
+
+        attempts = [primary, hedge]
+        pending = set(attempts)
+        first_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next(
+                (
+                    future for future in attempts
+                    if future in done and future.exception() is None
+                ),
+                None,
+            )
+            if winner is not None:
+                break
+            if first_error is None:
+                first_error = next(
+                    future.exception() for future in attempts if future in done
+                )
+        else:
+            raise first_error
+
+        if winner is hedge:
+            with self.__lock:
+                self.__hedge_wins += 1
+        for loser in attempts:
+            if loser is not winner:
+                loser.add_done_callback(self.__discard)
+        return winner.result()
+
+    def getStats(self) -> SolverAiHedgingStats:
+        delay_seconds = self.hedgeDelaySeconds()
+        with self.__lock:
+            return SolverAiHedgingStats(
+                requests=self.__requests,
+                hedged=self.__hedged,
+                hedge_wins=self.__hedge_wins,
+                hedge_rate=(
+                    self.__hedged / self.__requests if self.__requests else 0.0
+                ),
+                win_rate=(
+                    self.__hedge_wins / self.__hedged if self.__hedged else 0.0
+                ),
+                hedge_delay_seconds=delay_seconds,
+            )
+
+    def close(self) -> None:
+        self.__executor.shutdown(wait=False)
+
+    def __submit(self, attempt):
+        # A context copy per attempt: one Context cannot run in two threads
+        return self.__executor.submit(
+            copy_context().run,
+            self.__timedAttempt,
+            attempt,
+        )
+
+    def __timedAttempt(self, attempt):
+        started = monotonic()
+        result = attempt()
+        with self.__lock:
+            self.__latencies.append(monotonic() - started)
+        return result
+
+    @staticmethod
+    def __discard(future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        close = getattr(future.result(), 'close', None)
+        if callable(close):
+            close()
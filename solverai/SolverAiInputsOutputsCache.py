@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class SolverAiInputsOutputsCacheStats:
+    hits: int
+    revalidations: int
+    fetches: int
+    expirations: int
+    entries: int
+
+
+class SolverAiInputsOutputsCache:
+    """
+    TTL cache of ``problem_setup/`` (``getInputsOutputs()``) responses.
+
+    ttl_seconds: how long a fetched or revalidated entry is served without
+        contacting the Computer
+
+    Once an entry is older than ``ttl_seconds`` the next call revalidates it
+    with ``If-None-Match`` / ``If-Modified-Since`` when the Computer sent an
+    ``ETag`` / ``Last-Modified``; a ``304`` renews the entry without a body.
+    Without validators a stale entry is fetched again in full.
+
+    ``observeState`` expires a problem's entry when its status is
+    ``PROCESSING`` or ``UPDATING`` or differs from the last status seen, so
+    the next call always checks with the Computer after a change.
+
+    Entries are stored as the raw response body and decoded on every hit, so
+    callers never share mutable inputs/outputs objects.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0) -> None:
+        if ttl_seconds < 0:
+            raise ValueError('ttl_seconds must not be negative.')
+
+        self.__ttl_seconds = ttl_seconds
+        self.__lock = Lock()
+
+        # problem_id -> [body, etag, last_modified, validated_at]
+        self.__entries = {}
+        self.__states = {}
+
+        self.__hits = 0
+        self.__revalidations = 0
+        self.__fetches = 0
+        self.__expirations = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self.__ttl_seconds
+
+    def fresh(self, problem_id) -> Optional[bytes]:
+        """Body of an entry still inside its TTL, or None."""
+        with self.__lock:
+            entry = self.__entries.get(problem_id)
+            if entry is None or monotonic() - entry[3] > self.__ttl_seconds:
+                return None
+            self.__hits += 1
+            return entry[0]
+
+    def validators(self, problem_id) -> dict:
+        """Conditional request headers for a stale entry, possibly empty."""
+        with self.__lock:
+            entry = self.__entries.get(problem_id)
+            headers = {}
+            if entry is None:
+                return headers
+            if entry[1] is not None:
+                headers['If-None-Match'] = entry[1]
+            if entry[2] is not None:
+                headers['If-Modified-Since'] = entry[2]
+            return headers
+
+    def store(
+        self,
+        problem_id,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        with self.__lock:
+            self.__entries[problem_id] = [body, etag, last_modified, monotonic()]
+            self.__fetches += 1
+
+    def revalidated(self, problem_id) -> Optional[bytes]:
+        """
+        Renews the entry after a ``304`` and returns its body, or None when
+        the entry was dropped while the request was in flight.
+        """
+        with self.__lock:
+            entry = self.__entries.get(problem_id)
+            if entry is None:
+                return None
+            entry[3] = monotonic()
+            self.__revalidations += 1
+            return entry[0]
+
+    def expire(self, problem_id) -> None:
+        """Forces the next call to check with the Computer."""
+        with self.__lock:
+            entry = self.__entries.get(problem_id)
+            if entry is not None and entry[3] != -float('inf'):
+                entry[3] = -float('inf')
+                self.__expirations += 1
+
+    def observeState(self, problem_id, state: str) -> None:
+        with self.__lock:
+            previous = self.__states.get(problem_id)
+            self.__states[problem_id] = state
+        if state in ('PROCESSING', 'UPDATING') or (
+            previous is not None and previous != state
+        ):
+            self.expire(problem_id)
+
+    def invalidateProblem(self, problem_id) -> None:
+        with self.__lock:
+            self.__entries.pop(problem_id, None)
+            self.__states.pop(problem_id, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__states.clear()
+
+    def getStats(self) -> SolverAiInputsOutputsCacheStats:
+        with self.__lock:
+            return SolverAiInputsOutputsCacheStats(
+                hits=self.__hits,
+                revalidations=self.__revalidations,
+                fetches=self.__fetches,
+                expirations=self.__expirations,
+                entries=len(self.__entries),
+            )
@@ -0,0 +1,393 @@
+import bisect
+import math
+import warnings
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter, time
+from typing import Callable, Optional
+
+
+PHASES = ('serialize', 'connect', 'ttfb', 'transfer', 'decode', 'parse')
+
+# Upper bounds of the histogram buckets, in seconds: 100us doubling to ~105s
+HISTOGRAM_BUCKET_BOUNDS = tuple(0.0001 * 2 ** index for index in range(21))
+
+_active_recorder: ContextVar = ContextVar(
+    'solverai_active_call_recorder',
+    default=None,
+)
+_no_call = nullcontext()
+
+
+@dataclass(frozen=True)
+class SolverAiCallTiming:
+    """
+    Timing of one instrumented client call.
+
+    ``phases`` maps each measured phase of ``PHASES`` to seconds summed over
+    every attempt of the call; a phase that could not be measured (for
+    example ``connect`` on a session without the pooled adapter) is absent.
+    """
+    client: str
+    operation: str
+    started_at: float
+    total_seconds: float
+    phases: dict = field(default_factory=dict)
+    attempts: int = 0
+    drain_retries: int = 0
+    setup_retries: int = 0
+    status_polls: int = 0
+    request_bytes: int = 0
+    request_wire_bytes: int = 0
+    response_bytes: int = 0
+    response_wire_bytes: int = 0
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+
+class SolverAiCallRecorder:
+    """
+    Collects the measurements of the call in progress.
+
+    The active recorder is carried in a context variable, so lower layers
+    (transport, parsers) find it without any extra arguments and pay a single
+    lookup when instrumentation is disabled. Phases, attempts and transfers
+    may be added from several threads at once (hedged reads, executor
+    threads), so they are added under a lock.
+    """
+
+    def __init__(self, client: str, operation: str) -> None:
+        self.__lock = Lock()
+        self.client = client
+        self.operation = operation
+        self.started_at = time()
+        self.started = perf_counter()
+        self.phases = {}
+        self.attempts = 0
+        self.drain_retries = 0
+        self.setup_retries = 0
+        self.status_polls = 0
+        self.request_bytes = 0
+        self.request_wire_bytes = 0
+        self.response_bytes = 0
+        self.response_wire_bytes = 0
+        self.status_code = None
+
+    def addPhase(self, phase: str, seconds: float) -> None:
+        with self.__lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + max(seconds, 0.0)
+
+    def phase(self, phase: str) -> float:
+        return self.phases.get(phase, 0.0)
+
+    def timed(self, phase: str, function: Callable) -> Callable:
+        """Wraps ``function`` so the time spent in it counts as ``phase``."""
+        def timed_function(*args, **kwargs):
+            started = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.addPhase(phase, perf_counter() - started)
+        return timed_function
+
+    def addAttempt(self, status_code: int) -> None:
+        with self.__lock:
+            self.attempts += 1
+            self.status_code = status_code
+
+    def addTransfer(
+        self,
+        request_bytes: int = 0,
+        request_wire_bytes: int = 0,
+        response_bytes: int = 0,
+        response_wire_bytes: int = 0,
+    ) -> None:
+        with self.__lock:
+            self.request_bytes += request_bytes
+            self.request_wire_bytes += request_wire_bytes
+            self.response_bytes += response_bytes
+            self.response_wire_bytes += response_wire_bytes
+
+    def finish(self, error: Optional[BaseException] = None) -> SolverAiCallTiming:
+        with self.__lock:
+            return self.__timing(error)
+
+    def __timing(self, error: Optional[BaseException]) -> SolverAiCallTiming:
+        return SolverAiCallTiming(
+            client=self.client,
+            operation=self.operation,
+            started_at=self.started_at,
+            total_seconds=perf_counter() - self.started,
+            phases=dict(self.phases),
+            attempts=self.attempts,
+            drain_retries=self.drain_retries,
+            setup_retries=self.setup_retries,
+            status_polls=self.status_polls,
+            request_bytes=self.request_bytes,
+            request_wire_bytes=self.request_wire_bytes,
+            response_bytes=self.response_bytes,
+            response_wire_bytes=self.response_wire_bytes,
+            status_code=self.status_code,
+            error=type(error).__name__ if error is not None else None,
+        )
+
+
+def active_recorder() -> Optional[SolverAiCallRecorder]:
+    return _active_recorder.get()
+
+
+def instrumented_call(
+    instrumentation: Optional['SolverAiInstrumentation'],
+    client: str,
+    operation: str,
+):
+    """``instrumentation.call(...)``, or a shared no-op when it is None."""
+    if instrumentation is None:
+        return _no_call
+    return instrumentation.call(client, operation)
+
+
+class SolverAiHistogram:
+    """
+    Fixed log-bucket latency histogram.
+
+    Buckets double from 100us to ~105s (``HISTOGRAM_BUCKET_BOUNDS``) plus an
+    overflow bucket, so recording is O(log buckets) and memory is constant.
+    Percentiles are the upper bound of the bucket holding that rank, clamped
+    to the observed min and max. Values are added and read under a lock.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.counts = [0] * (len(HISTOGRAM_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        with self.__lock:
+            self.counts[bisect.bisect_left(HISTOGRAM_BUCKET_BOUNDS, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        with self.__lock:
+            return self.__percentile(fraction)
+
+    def __percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(HISTOGRAM_BUCKET_BOUNDS):
+                    upper = HISTOGRAM_BUCKET_BOUNDS[index]
+                else:
+                    upper = self.max
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        with self.__lock:
+            return {
+                'count': self.count,
+                'mean': self.mean,
+                'min': self.min if self.count else 0.0,
+                'max': self.max,
+                'p50': self.__percentile(0.50),
+                'p90': self.__percentile(0.90),
+                'p99': self.__percentile(0.99),
+            }
+
+
+class _SolverAiOperationStats:
+
+    def __init__(self) -> None:
+        self.histograms = {}
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.drain_retries = 0
+        self.setup_retries = 0
+        self.status_polls = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def add(self, timing: SolverAiCallTiming) -> None:
+        self.calls += 1
+        self.errors += timing.error is not None
+        self.retries += timing.retries
+        self.drain_retries += timing.drain_retries
+        self.setup_retries += timing.setup_retries
+        self.status_polls += timing.status_polls
+        self.request_bytes += timing.request_bytes
+        self.response_bytes += timing.response_bytes
+        self.__histogram('total').add(timing.total_seconds)
+        for phase, seconds in timing.phases.items():
+            self.__histogram(phase).add(seconds)
+
+    def __histogram(self, name: str) -> SolverAiHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = SolverAiHistogram()
+        return histogram
+
+    def summary(self) -> dict:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'drain_retries': self.drain_retries,
+            'setup_retries': self.setup_retries,
+            'status_polls': self.status_polls,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'seconds': {
+                name: histogram.summary()
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+
+class SolverAiInstrumentation:
+    """
+    Per-call timing hooks for the compute and setup clients.
+
+    Pass one instance as ``instrumentation=`` to any number of clients.
+    Every finished call produces a ``SolverAiCallTiming`` that is aggregated
+    into per-operation histograms and handed to each registered observer.
+    Clients built without instrumentation skip all timing.
+
+    Observers run on the thread that made the call; an observer that raises
+    is reported with a ``RuntimeWarning`` and never fails the call.
+    """
+
+    def __init__(self, aggregate: bool = True) -> None:
+        self.__aggregate = aggregate
+        self.__observers = []
+        self.__lock = Lock()
+        self.__operations = {}
+        self.__since = time()
+
+    def addObserver(self, observer: Callable[[SolverAiCallTiming], None]) -> None:
+        with self.__lock:
+            self.__observers = self.__observers + [observer]
+
+    def removeObserver(self, observer: Callable[[SolverAiCallTiming], None]) -> None:
+        with self.__lock:
+            self.__observers = [
+                registered for registered in self.__observers
+                if registered is not observer
+            ]
+
+    def call(self, client: str, operation: str):
+        """
+        Context manager instrumenting one client call.
+
+        Calls nested in an instrumented call (for example the status polls of
+        a ``runSolver`` setup wait) are folded into the outer call.
+        """
+        if _active_recorder.get() is not None:
+            return _no_call
+        return self.__call(client, operation)
+
+    @contextmanager
+    def __call(self, client, operation):
+        recorder = SolverAiCallRecorder(client, operation)
+        token = _active_recorder.set(recorder)
+        error = None
+        try:
+            yield recorder
+        except BaseException as raised:
+            error = raised
+            raise
+        finally:
+            _active_recorder.reset(token)
+            self.record(recorder.finish(error))
+
+    def record(self, timing: SolverAiCallTiming) -> None:
+        with self.__lock:
+            observers = self.__observers
+            if self.__aggregate:
+                key = (timing.client, timing.operation)
+                stats = self.__operations.get(key)
+                if stats is None:
+                    stats = self.__operations[key] = _SolverAiOperationStats()
+                stats.add(timing)
+
+        for observer in observers:
+            try:
+                observer(timing)
+            except Exception as error:
+                warnings.warn(
+                    f'SolverAi instrumentation observer failed: {error!r}',
+                    RuntimeWarning,
+                )
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        Aggregated statistics keyed by ``'<client>.<operation>'``; each entry
+        holds call, error, retry and byte counters plus a latency summary
+        (count, mean, min, max, p50, p90, p99 in seconds) for ``'total'`` and
+        every measured phase.
+        """
+        with self.__lock:
+            now = time()
+            snapshot = {
+                'since': self.__since,
+                'until': now,
+                'operations': {
+                    f'{client}.{operation}': stats.summary()
+                    for (client, operation), stats in sorted(
+                        self.__operations.items()
+                    )
+                },
+            }
+            if reset:
+                self.__operations = {}
+                self.__since = now
+        return snapshot
+
+    def report(self, reset: bool = False) -> str:
+        """Plain-text table of ``snapshot()``, in milliseconds."""
+        snapshot = self.snapshot(reset)
+        lines = [
+            f'{"operation":<32}{"phase":<11}{"count":>7}{"mean":>10}'
+            f'{"p50":>10}{"p90":>10}{"p99":>10}{"max":>10}'
+        ]
+        for name, stats in snapshot['operations'].items():
+            lines.append(
+                f'{name} calls={stats["calls"]} errors={stats["errors"]} '
+                f'retries={stats["retries"]} '
+                f'drain_retries={stats["drain_retries"]} '
+                f'setup_retries={stats["setup_retries"]} '
+                f'request_bytes={stats["request_bytes"]} '
+                f'response_bytes={stats["response_bytes"]}'
+            )
+            for phase in ('total',) + PHASES:
+                summary = stats['seconds'].get(phase)
+                if summary is None:
+                    continue
+                lines.append(
+                    f'{"":<32}{phase:<11}{summary["count"]:>7}'
+                    + ''.join(
+                        f'{summary[key] * 1000:>10.2f}'
+                        for key in ('mean', 'p50', 'p90', 'p99', 'max')
+                    )
+                )
+        return '\n'.join(lines)
@@ -0,0 +1,226 @@
+import json
+import math
+import re
+from typing import Optional, Union
+
+
+class SolverAiJsonCodec:
+    """
+    JSON encoder/decoder used for every request and response body.
+
+    ``dumps`` returns UTF-8 bytes so payloads go to the wire without a str
+    round-trip, and ``loads`` accepts bytes or str. Subclasses wrap a faster
+    third-party backend and fall back to the standard library for the few
+    inputs the backend rejects (for example ``NaN`` literals or integers
+    wider than 64 bits), so switching backends never changes what can be
+    sent or read.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumpsText(self, obj) -> str:
+        return self.dumps(obj).decode('utf-8')
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}()'
+
+
+class SolverAiStdlibJsonCodec(SolverAiJsonCodec):
+    pass
+
+
+def _has_non_finite(obj) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+# Integer literals of 19 digits or more may not fit in 64 bits, which orjson
+# silently decodes as floats; digits inside strings only cost a fallback
+_WIDE_INTEGER = re.compile(r'(?<![\d.])\d{19,}(?![\d.eE])')
+_WIDE_INTEGER_BYTES = re.compile(_WIDE_INTEGER.pattern.encode())
+
+
+def has_wide_integer(data: Union[bytes, bytearray, str]) -> bool:
+    """Whether JSON text ``data`` may hold an integer wider than 64 bits."""
+    pattern = _WIDE_INTEGER if isinstance(data, str) else _WIDE_INTEGER_BYTES
+    return pattern.search(data) is not None
+
+
+class _SolverAiFastJsonCodec(SolverAiJsonCodec):
+    """Shared stdlib fallback for the third-party backends."""
+
+    _encode_errors = (TypeError, OverflowError)
+    _decode_errors = (ValueError,)
+
+    def _dumps(self, obj) -> bytes:
+        raise NotImplementedError
+
+    def _loads(self, data):
+        raise NotImplementedError
+
+    def dumps(self, obj) -> bytes:
+        try:
+            data = self._dumps(obj)
+        except self._encode_errors:
+            return super().dumps(obj)
+        # orjson and msgspec write NaN and Infinity as null; the object is
+        # only searched for them when a null was written at all
+        if b'null' in data and _has_non_finite(obj):
+            return super().dumps(obj)
+        return data
+
+    def loads(self, data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        if has_wide_integer(data):
+            return super().loads(data)
+        try:
+            return self._loads(data)
+        except self._decode_errors:
+            return super().loads(data)
+
+
+class SolverAiOrjsonCodec(_SolverAiFastJsonCodec):
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.__orjson = orjson
+        self.__options = orjson.OPT_NON_STR_KEYS
+        self._encode_errors = (orjson.JSONEncodeError,)
+        self._decode_errors = (orjson.JSONDecodeError,)
+
+    def _dumps(self, obj) -> bytes:
+        return self.__orjson.dumps(obj, option=self.__options)
+
+    def _loads(self, data):
+        return self.__orjson.loads(data)
+
+
+class SolverAiMsgspecCodec(_SolverAiFastJsonCodec):
+
+    name = 'msgspec'
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.__encoder = msgspec.json.Encoder()
+        self.__decoder = msgspec.json.Decoder()
+        self._encode_errors = (msgspec.EncodeError, TypeError, OverflowError)
+        self._decode_errors = (msgspec.DecodeError,)
+
+    def _dumps(self, obj) -> bytes:
+        return self.__encoder.encode(obj)
+
+    def _loads(self, data):
+        return self.__decoder.decode(data)
+
+
+class SolverAiUjsonCodec(_SolverAiFastJsonCodec):
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+
+        self.__ujson = ujson
+
+    def _dumps(self, obj) -> bytes:
+        return self.__ujson.dumps(
+            obj,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+        ).encode('utf-8')
+
+    def _loads(self, data):
+        return self.__ujson.loads(data)
+
+
+# Fastest first; the first importable backend becomes the default
+JSON_CODECS = {
+    'orjson': SolverAiOrjsonCodec,
+    'msgspec': SolverAiMsgspecCodec,
+    'ujson': SolverAiUjsonCodec,
+    'json': SolverAiStdlibJsonCodec,
+}
+
+_default_codec: Optional[SolverAiJsonCodec] = None
+
+
+def available_json_codecs() -> list:
+    """Names of the codecs whose backend is installed, fastest first."""
+    names = []
+    for name, codec_class in JSON_CODECS.items():
+        try:
+            codec_class()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def new_json_codec(name: Optional[str] = None) -> SolverAiJsonCodec:
+    """
+    Builds the codec called ``name``, or the fastest installed one when
+    ``name`` is None. Raises ``ValueError`` for unknown names and
+    ``ImportError`` when the requested backend is not installed.
+    """
+    if name is None:
+        for codec_class in JSON_CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+    if name not in JSON_CODECS:
+        raise ValueError(
+            f'Unknown JSON codec {name!r}; expected one of {list(JSON_CODECS)}.'
+        )
+    return JSON_CODECS[name]()
+
+
+def get_json_codec() -> SolverAiJsonCodec:
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = new_json_codec()
+    return _default_codec
+
+
+def set_json_codec(
+    codec: Union[SolverAiJsonCodec, str, None] = None,
+) -> SolverAiJsonCodec:
+    """
+    Sets the process-wide codec by instance or name; None restores the
+    automatic choice. Returns the codec now in use.
+    """
+    global _default_codec
+    if codec is None or isinstance(codec, str):
+        codec = new_json_codec(codec)
+    _default_codec = codec
+    return codec
+
+
+def response_body(response) -> Union[bytes, str]:
+    """Raw body of ``response``, as bytes when the response exposes them."""
+    content = getattr(response, 'content', None)
+    if isinstance(content, (bytes, bytearray)):
+        return content
+    return response.text
+
+
+def loads_response(response):
+    return get_json_codec().loads(response_body(response))
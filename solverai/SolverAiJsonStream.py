@@ -0,0 +1,145 @@
+import codecs
+import json
+from typing import Iterable, Iterator, Tuple
+
+
+_WHITESPACE = ' \t\n\r'
+_VALUE_TERMINATORS = _WHITESPACE + ',:]}'
+_decoder = json.JSONDecoder()
+
+
+class _SolverAiJsonStreamReader:
+    """
+    Pull reader over a chunked UTF-8 JSON body.
+
+    Only the unread tail of the body is buffered: consumed text is dropped
+    as the reader advances, so memory stays near the size of the largest
+    single value rather than the whole document.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.__chunks = iter(chunks)
+        self.__utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.__buffer = ''
+        self.__pos = 0
+        self.__exhausted = False
+
+    def __fill(self, min_length: int = 0) -> bool:
+        """Reads until the unread text is at least ``min_length`` long."""
+        if self.__pos:
+            self.__buffer = self.__buffer[self.__pos:]
+            self.__pos = 0
+        parts = [self.__buffer]
+        length = len(self.__buffer)
+        read_any = False
+        while not self.__exhausted and (not read_any or length < min_length):
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                self.__exhausted = True
+                text = self.__utf8.decode(b'', final=True)
+            else:
+                text = self.__utf8.decode(chunk)
+            if text:
+                parts.append(text)
+                length += len(text)
+                read_any = True
+        self.__buffer = ''.join(parts)
+        return read_any
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end of the body."""
+        while True:
+            buffer = self.__buffer
+            pos = self.__pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.__pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.__fill():
+                return ''
+
+    def expect(self, character: str) -> None:
+        found = self.peek()
+        if found != character:
+            raise json.JSONDecodeError(
+                f'Expecting {character!r}',
+                found or '<end of body>',
+                0,
+            )
+        self.__pos += 1
+
+    def value(self):
+        """Decodes the next complete JSON value."""
+        if not self.peek():
+            raise json.JSONDecodeError('Expecting value', '<end of body>', 0)
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                if self.__exhausted:
+                    raise
+            else:
+                # A number cut at a chunk boundary ("3." of "3.25") decodes as
+                # a shorter number, so only accept a value once the character
+                # after it is visible and ends it
+                if (
+                    self.__exhausted
+                    or (
+                        end < len(self.__buffer)
+                        and self.__buffer[end] in _VALUE_TERMINATORS
+                    )
+                ):
+                    self.__pos = end
+                    return value
+            # Grow geometrically so a huge value is rescanned O(log n) times
+            unread = len(self.__buffer) - self.__pos
+            self.__fill(min_length=2 * unread)
+
+
+def iter_json_members(
+    chunks: Iterable[bytes],
+    expand: Tuple[str, ...] = ('results',),
+) -> Iterator[Tuple[object, str, object]]:
+    """
+    Incrementally decodes a JSON object body.
+
+    Yields ``(parent, key, value)`` for every member of the top-level object
+    with ``parent`` None. Members whose key is in ``expand`` and whose value
+    is an object are not yielded whole; their own members are yielded one by
+    one with ``parent`` set to that key, so each value can be consumed and
+    dropped before the next one is read.
+
+    Raises ``json.JSONDecodeError`` on malformed or truncated input.
+    """
+    reader = _SolverAiJsonStreamReader(chunks)
+    for key in _iter_object_keys(reader):
+        if key in expand and reader.peek() == '{':
+            for member_key in _iter_object_keys(reader):
+                yield key, member_key, reader.value()
+        else:
+            yield None, key, reader.value()
+    if reader.peek():
+        raise json.JSONDecodeError('Extra data', reader.peek(), 0)
+
+
+def _iter_object_keys(reader: _SolverAiJsonStreamReader) -> Iterator[str]:
+    """
+    Yields each key of the object at the reader; the caller must consume the
+    member value before asking for the next key.
+    """
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.expect('}')
+        return
+    while True:
+        if reader.peek() != '"':
+            raise json.JSONDecodeError('Expecting property name', reader.peek(), 0)
+        key = reader.value()
+        reader.expect(':')
+        yield key
+        if reader.peek() == ',':
+            reader.expect(',')
+            continue
+        reader.expect('}')
+        return
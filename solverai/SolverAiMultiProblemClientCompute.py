@@ -0,0 +1,203 @@
+from threading import Lock
+from typing import Optional
+
+from .SolverAiCircuitBreaker import SolverAiCircuitBreaker
+from .SolverAiClientCompute import (
+    SolverAiClientCompute,
+    SolverAiProblemStatusInfo,
+)
+from .SolverAiComputeInput import SolverAiComputeInput
+from .SolverAiComputeResults import SolverAiComputeResults
+from .SolverAiDeadline import SolverAiTimeouts
+from .SolverAiDrainCoordinator import SolverAiDrainCoordinator
+from .SolverAiHedging import SolverAiHedgingPolicy
+from .SolverAiInputsOutputsCache import SolverAiInputsOutputsCache
+from .SolverAiInstrumentation import SolverAiInstrumentation
+from .SolverAiPollingStrategy import (
+    SolverAiPollingStrategy,
+    SolverAiSetupWaitStrategy,
+)
+from .SolverAiRateLimiter import SolverAiRateLimiter
+from .SolverAiResultCache import SolverAiResultCache
+from .SolverAiResultsParser import SolverAiResultsParserPool
+from .SolverAiSingleFlight import SolverAiSingleFlight
+from .SolverAiTransport import SolverAiTransport
+
+
+class SolverAiMultiProblemClientCompute:
+    """
+    One compute client for every problem hosted on a Computer.
+
+    ``runSolver``, ``getProblemStatusInfo``, ``getInputsOutputs`` and
+    ``waitForProblemReady`` take the problem id per call. All problems share
+    one transport (connection pool), one ``SolverAiDrainCoordinator``, one
+    optional ``SolverAiInstrumentation`` registry and the result and
+    inputs/outputs caches, so a problem costs a dict entry holding a
+    lightweight ``SolverAiClientCompute`` view, created on first use.
+    """
+
+    def __init__(
+        self,
+        computerUrl: str,
+        token: str,
+        drain_max_retries: int = 1,
+        drain_retry_default_seconds: float = 60,
+        honor_retry_after: bool = True,
+        drain_max_wait_seconds: Optional[float] = None,
+        transport: Optional[SolverAiTransport] = None,
+        result_cache: Optional[SolverAiResultCache] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        stream_results: bool = False,
+        instrumentation: Optional[SolverAiInstrumentation] = None,
+        drain_coordinator: Optional[SolverAiDrainCoordinator] = None,
+        inputs_outputs_cache: Optional[SolverAiInputsOutputsCache] = None,
+        rate_limiter: Optional[SolverAiRateLimiter] = None,
+        circuit_breaker: Optional[SolverAiCircuitBreaker] = None,
+        hedging_policy: Optional[SolverAiHedgingPolicy] = None,
+        timeouts: Optional[SolverAiTimeouts] = None,
+        single_flight: Optional[SolverAiSingleFlight] = None,
+        results_parser: Optional[SolverAiResultsParserPool] = None,
+    ) -> None:
+        if drain_coordinator is None:
+            drain_coordinator = SolverAiDrainCoordinator()
+        self.__template = SolverAiClientCompute(
+            computerUrl,
+            token,
+            None,
+            drain_max_retries=drain_max_retries,
+            drain_retry_default_seconds=drain_retry_default_seconds,
+            honor_retry_after=honor_retry_after,
+            drain_max_wait_seconds=drain_max_wait_seconds,
+            transport=transport,
+            result_cache=result_cache,
+            polling_strategy=polling_strategy,
+            setup_wait_strategy=setup_wait_strategy,
+            stream_results=stream_results,
+            instrumentation=instrumentation,
+            drain_coordinator=drain_coordinator,
+            inputs_outputs_cache=inputs_outputs_cache,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            timeouts=timeouts,
+            single_flight=single_flight,
+            results_parser=results_parser,
+        )
+        self.__clients = {}
+        self.__lock = Lock()
+
+    @property
+    def transport(self) -> SolverAiTransport:
+        return self.__template.transport
+
+    @property
+    def drain_coordinator(self) -> SolverAiDrainCoordinator:
+        return self.__template.drain_coordinator
+
+    @property
+    def instrumentation(self) -> Optional[SolverAiInstrumentation]:
+        return self.__template.instrumentation
+
+    @property
+    def result_cache(self) -> Optional[SolverAiResultCache]:
+        return self.__template.result_cache
+
+    @property
+    def problemIds(self) -> list:
+        return list(self.__clients)
+
+    def getResultCacheStats(self):
+        return self.__template.getResultCacheStats()
+
+    def getInputsOutputsCacheStats(self):
+        return self.__template.getInputsOutputsCacheStats()
+
+    def getHedgingStats(self):
+        return self.__template.getHedgingStats()
+
+    def getSingleFlightStats(self):
+        return self.__template.getSingleFlightStats()
+
+    @staticmethod
+    def getLastTransferStats():
+        return SolverAiClientCompute.getLastTransferStats()
+
+    def forProblem(self, problemId: str) -> SolverAiClientCompute:
+        """
+        The ``SolverAiClientCompute`` for ``problemId``, sharing this
+        client's transport and coordinators. Closing it is a no-op.
+        """
+        client = self.__clients.get(problemId)
+        if client is None:
+            with self.__lock:
+                client = self.__clients.get(problemId)
+                if client is None:
+                    client = self.__template._withProblem(problemId)
+                    self.__clients[problemId] = client
+        return client
+
+    def forgetProblem(self, problemId: str) -> None:
+        """Drops the entry for ``problemId``; it is rebuilt on next use."""
+        with self.__lock:
+            self.__clients.pop(problemId, None)
+
+    def getProblemStatusInfo(
+        self,
+        problemId: str,
+        require_not_updating: bool = False,
+    ) -> SolverAiProblemStatusInfo:
+        return self.forProblem(problemId).getProblemStatusInfo(
+            require_not_updating=require_not_updating,
+        )
+
+    def waitForProblemReady(
+        self,
+        problemId: str,
+        require_not_updating: bool = False,
+        poll_interval_seconds: float = 1.0,
+        max_wait_seconds: Optional[float] = None,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiProblemStatusInfo:
+        return self.forProblem(problemId).waitForProblemReady(
+            require_not_updating=require_not_updating,
+            poll_interval_seconds=poll_interval_seconds,
+            max_wait_seconds=max_wait_seconds,
+            polling_strategy=polling_strategy,
+            deadline_seconds=deadline_seconds,
+        )
+
+    def getInputsOutputs(
+        self,
+        problemId: str,
+        deadline_seconds: Optional[float] = None,
+    ):
+        return self.forProblem(problemId).getInputsOutputs(deadline_seconds)
+
+    def runSolver(
+        self,
+        problemId: str,
+        input: SolverAiComputeInput,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiComputeResults:
+        if input.problem_id != problemId:
+            raise ValueError(
+                f'Input is for problem {input.problem_id!r}, '
+                f'not {problemId!r}.'
+            )
+        return self.forProblem(problemId).runSolver(
+            input,
+            setup_wait_strategy=setup_wait_strategy,
+            deadline_seconds=deadline_seconds,
+        )
+
+    def close(self) -> None:
+        self.__template.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
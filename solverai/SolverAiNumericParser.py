@@ -0,0 +1,105 @@
+from ast import literal_eval
+from itertools import chain
+from threading import Lock
+from typing import Sequence
+
+from .SolverAiJsonCodec import SolverAiStdlibJsonCodec, get_json_codec, has_wide_integer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# CPython 3.11 can fail with "AST constructor recursion depth mismatch" when
+# several threads compile at once, so literal_eval calls are serialized
+_literal_eval_lock = Lock()
+
+
+def locked_literal_eval(text: str):
+    with _literal_eval_lock:
+        return literal_eval(text)
+
+
+def _parse_row(text: str, loads) -> list:
+    try:
+        row = loads(text)
+    except Exception:
+        row = None
+    if isinstance(row, list):
+        return row
+    return list(locked_literal_eval(text))
+
+
+def parse_rows(texts: Sequence[str]) -> list:
+    """
+    Parses ``X{i}``/``Y{i}`` row strings such as ``'[1.0, -2.5e-08]'`` into
+    lists, with the same values ``literal_eval`` would give.
+
+    Rows are numeric JSON arrays, so the whole block is decoded at once by
+    the active JSON codec; only when that fails is each row retried on its
+    own, with ``literal_eval`` as the last resort for rows that are not JSON
+    (tuples, ``None``). Blocks holding integers that may not fit in 64 bits
+    are decoded by the standard library, which keeps them exact.
+    """
+    if not texts:
+        return []
+    block = '[' + ','.join(texts) + ']'
+    if has_wide_integer(block):
+        loads = SolverAiStdlibJsonCodec().loads
+    else:
+        loads = get_json_codec().loads
+    try:
+        rows = loads(block)
+    except Exception:
+        rows = None
+    # Unbalanced brackets can still decode, just into the wrong rows
+    if (
+        isinstance(rows, list)
+        and len(rows) == len(texts)
+        and all(type(row) is list for row in rows)
+    ):
+        return rows
+    return [_parse_row(text, loads) for text in texts]
+
+
+def is_float_block(rows: Sequence[list]) -> bool:
+    """Whether every value of ``rows`` is a float, so the rows survive a
+    float64 round trip unchanged."""
+    return set(map(type, chain.from_iterable(rows))) <= {float}
+
+
+def rows_to_array(rows: Sequence[list], width: int = 0, prefix: str = 'X'):
+    """
+    Packs parsed rows into one contiguous ``(len(rows), width)`` float64
+    NumPy array; ``width`` only matters when there are no rows. ``None``
+    values become NaN. Raises ValueError naming the first ragged or
+    non-numeric ``{prefix}{i}`` row.
+    """
+    if np is None:
+        raise ImportError('numpy is required for array results.')
+    if not rows:
+        return np.empty((0, width), dtype=np.float64)
+    try:
+        array = np.array(rows, dtype=np.float64)
+    except (TypeError, ValueError):
+        array = None
+    if array is not None and array.ndim == 2:
+        return array
+
+    width = len(rows[0])
+    for index, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(
+                f'Malformed {prefix}{index} row: expected {width} values, '
+                f'got {len(row)}.'
+            )
+        try:
+            np.array(row, dtype=np.float64).reshape(width)
+        except (TypeError, ValueError):
+            raise ValueError(f'Malformed {prefix}{index} row: {row!r}.')
+    raise ValueError(f'Malformed {prefix} rows.')
+
+
+def parse_numeric_array(texts: Sequence[str], width: int = 0, prefix: str = 'X'):
+    """``rows_to_array`` of ``parse_rows(texts)``."""
+    return rows_to_array(parse_rows(texts), width, prefix)
@@ -0,0 +1,330 @@
+from bisect import bisect_right
+from typing import Mapping, Optional, Sequence, Union
+
+from .SolverAiComputeInput import OBJECTIVE, SolverAiComputeInput
+from .SolverAiComputeResults import SolverAiComputeResults
+from .SolverAiNumericParser import np
+
+
+def _objective_array(F):
+    if np is None:
+        raise ImportError('numpy is required for Pareto analytics.')
+    F = np.asarray(F, dtype=np.float64)
+    if F.ndim != 2:
+        raise ValueError('Objective values must be a 2D array, points x objectives.')
+    if np.isnan(F).any():
+        raise ValueError('Objective values must not be NaN.')
+    return F
+
+
+class _FrontBuffer:
+    """
+    Points of one front, one growing row per objective after the first, for
+    dominance checks. Points arrive in lexicographic order without
+    duplicates, so every earlier point is no worse on the first objective
+    and one that is nowhere worse on the others is strictly better.
+    """
+
+    __slots__ = ('values', 'size')
+
+    def __init__(self) -> None:
+        self.values = None
+        self.size = 0
+
+    def add(self, point) -> None:
+        if self.values is None:
+            self.values = np.empty((len(point) - 1, 16))
+        elif self.size == self.values.shape[1]:
+            self.values = np.concatenate(
+                (self.values, np.empty_like(self.values)),
+                axis=1,
+            )
+        self.values[:, self.size] = point[1:]
+        self.size += 1
+
+    def dominates(self, point) -> bool:
+        values = self.values[:, :self.size]
+        mask = values[0] <= point[1]
+        for objective in range(1, len(values)):
+            mask &= values[objective] <= point[objective + 1]
+        return bool(mask.any())
+
+
+class _FrontStaircase:
+    """
+    Second and third objectives of one front's points, reduced to the pairs
+    no other pair is below on both: sorted on the second, with the third
+    falling. Points arrive sorted on the first objective, so a front
+    dominates a point when some pair is nowhere above the point's own.
+    """
+
+    __slots__ = ('seconds', 'thirds')
+
+    def __init__(self) -> None:
+        self.seconds = []
+        self.thirds = []
+
+    def dominates(self, point) -> bool:
+        index = bisect_right(self.seconds, point[0])
+        return index > 0 and self.thirds[index - 1] <= point[1]
+
+    def add(self, point) -> None:
+        second, third = point
+        index = bisect_right(self.seconds, second)
+        if index and self.seconds[index - 1] == second:
+            index -= 1
+        end = index
+        while end < len(self.thirds) and self.thirds[end] >= third:
+            end += 1
+        self.seconds[index:end] = [second]
+        self.thirds[index:end] = [third]
+
+
+def _ranks_2d(points) -> list:
+    # Sorted on the first objective, a point is dominated by a front exactly
+    # when that front's smallest second objective so far is not above its
+    # own, and those minima rise with the front index
+    minima = []
+    ranks = []
+    for value in points[:, 1].tolist():
+        rank = bisect_right(minima, value)
+        if rank == len(minima):
+            minima.append(value)
+        else:
+            minima[rank] = value
+        ranks.append(rank)
+    return ranks
+
+
+def _ranks_nd(points) -> list:
+    # Efficient non-dominated sort with binary search over the fronts: if
+    # front r dominates a point, so does every front before it
+    if points.shape[1] == 3:
+        new_front, points = _FrontStaircase, points[:, 1:].tolist()
+    else:
+        new_front = _FrontBuffer
+    fronts = []
+    ranks = []
+    for point in points:
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if fronts[middle].dominates(point):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append(new_front())
+        fronts[low].add(point)
+        ranks.append(low)
+    return ranks
+
+
+def non_dominated_ranks(F):
+    """
+    Non-dominated sorting of objective values ``F`` (points x objectives,
+    every objective minimized): the front of every point, 0 for the Pareto
+    front. Identical points share a front.
+
+    Points are sorted once and each is placed by a binary search over the
+    fronts found so far. Two objectives compare against one running
+    minimum per front (O(n log n) in all), three against a staircase of
+    the front's last two objectives, and more against the front's points.
+    """
+    F = _objective_array(F)
+    if len(F) == 0:
+        return np.zeros(0, dtype=np.intp)
+    points, inverse = np.unique(F, axis=0, return_inverse=True)
+    if F.shape[1] == 1:
+        ranks = np.arange(len(points))
+    elif F.shape[1] == 2:
+        ranks = np.array(_ranks_2d(points), dtype=np.intp)
+    else:
+        ranks = np.array(_ranks_nd(points), dtype=np.intp)
+    return ranks[inverse.reshape(-1)]
+
+
+def crowding_distances(F, ranks):
+    """
+    NSGA-II crowding distance of every point within its front: the sum over
+    objectives of the gap between its neighbours, relative to the front's
+    range. The first and last point of a front on any objective get
+    infinity.
+    """
+    F = _objective_array(F)
+    ranks = np.asarray(ranks)
+    distances = np.zeros(len(F))
+    if len(F) == 0:
+        return distances
+    for objective in range(F.shape[1]):
+        order = np.lexsort((F[:, objective], ranks))
+        values = F[order, objective]
+        fronts = ranks[order]
+        changes = fronts[1:] != fronts[:-1]
+        first = np.concatenate(([True], changes))
+        last = np.concatenate((changes, [True]))
+        starts = np.flatnonzero(first)
+        ends = np.flatnonzero(last)
+        spans = np.repeat(values[ends] - values[starts], ends - starts + 1)
+
+        gaps = np.zeros(len(values))
+        gaps[1:-1] = values[2:] - values[:-2]
+        inner = ~(first | last) & (spans > 0)
+        contribution = np.zeros(len(values))
+        contribution[inner] = gaps[inner] / spans[inner]
+        contribution[first | last] = np.inf
+        distances[order] += contribution
+    return distances
+
+
+def _hypervolume_3d(F, reference) -> float:
+    # Sweep on the third objective, keeping the 2D staircase of the points
+    # seen so far and the area it dominates
+    r1, r2, r3 = reference.tolist()
+    order = np.lexsort((F[:, 1], F[:, 0], F[:, 2]))
+    xs, ys = [], []
+    area = volume = 0.0
+    previous = None
+    for x, y, z in F[order].tolist():
+        if previous is not None:
+            volume += area * (z - previous)
+        previous = z
+        index = bisect_right(xs, x)
+        if index and ys[index - 1] <= y:
+            continue
+        if index and xs[index - 1] == x:
+            index -= 1
+        upper = ys[index - 1] if index else r2
+        right = xs[index] if index < len(xs) else r1
+        area += (upper - y) * (right - x)
+        end = index
+        while end < len(xs) and ys[end] >= y:
+            right = xs[end + 1] if end + 1 < len(xs) else r1
+            area += (ys[end] - y) * (right - xs[end])
+            end += 1
+        xs[index:end] = [x]
+        ys[index:end] = [y]
+    return volume + area * (r3 - previous)
+
+
+def hypervolume(F, reference) -> float:
+    """
+    Volume of objective space dominated by the points of ``F`` (every
+    objective minimized) and bounded by ``reference``, for 2 or 3
+    objectives. Points that are not better than ``reference`` on every
+    objective add nothing.
+    """
+    F = _objective_array(F)
+    reference = np.asarray(reference, dtype=np.float64).reshape(-1)
+    if F.shape[1] not in (2, 3):
+        raise ValueError('Hypervolume is supported for 2 and 3 objectives.')
+    if len(reference) != F.shape[1]:
+        raise ValueError(f'reference needs {F.shape[1]} values.')
+    F = F[(F < reference).all(axis=1)]
+    if len(F) == 0:
+        return 0.0
+    if F.shape[1] == 3:
+        return _hypervolume_3d(F, reference)
+
+    F = F[np.lexsort((F[:, 1], F[:, 0]))]
+    best = np.minimum.accumulate(F[:, 1])
+    front = F[np.concatenate(([True], F[1:, 1] < best[:-1]))]
+    widths = np.diff(np.concatenate((front[:, 0], reference[:1])))
+    return float(np.sum(widths * (reference[1] - front[:, 1])))
+
+
+class SolverAiParetoAnalysis:
+    """
+    Pareto analytics over the objectives of ``SolverAiComputeResults``.
+
+    compute_input: the ``SolverAiComputeInput`` that was solved; objectives
+        it maximizes are maximized here too
+    senses: ``{name: OBJECTIVE or 'minimize'/'maximize'}``, overriding
+        ``compute_input``; objectives found in neither are minimized
+
+    Objective columns are read from the outputs (or, failing that, the
+    inputs) of the results. Ranks and crowding distances are computed once
+    and kept; all values are returned in the objectives' own units.
+    """
+
+    def __init__(
+        self,
+        results: SolverAiComputeResults,
+        compute_input: Optional[SolverAiComputeInput] = None,
+        senses: Optional[Mapping[str, Union[OBJECTIVE, str]]] = None,
+    ) -> None:
+        names = list(results.getObjectiveVariableNames())
+        if not names:
+            raise ValueError('Results have no objectives.')
+        operations = {}
+        if compute_input is not None:
+            for name, objective in compute_input.objectives.items():
+                operations[name] = objective['Operation']
+        for name, sense in (senses or {}).items():
+            operations[name] = sense.value if isinstance(sense, OBJECTIVE) else sense
+        self.objectiveVariableNames = names
+        self.senses = {
+            name: OBJECTIVE(operations.get(name, OBJECTIVE.MINIMIZE.value))
+            for name in names
+        }
+
+        outputs = results.getOutputVariableNames()
+        inputs = results.getInputVariableNames()
+        columns = []
+        for name in names:
+            if name in outputs:
+                columns.append(results.getYArray()[:, outputs.index(name)])
+            elif name in inputs:
+                columns.append(results.getXArray()[:, inputs.index(name)])
+            else:
+                raise ValueError(f'Objective {name} is not a result variable.')
+        self.__objectives = _objective_array(np.stack(columns, axis=1))
+        self.__signs = np.array([
+            -1.0 if self.senses[name] is OBJECTIVE.MAXIMIZE else 1.0
+            for name in names
+        ])
+        self.__minimized = self.__objectives * self.__signs
+        self.__ranks = None
+        self.__distances = None
+
+    def getObjectiveVariableNames(self) -> list[str]:
+        return self.objectiveVariableNames
+
+    def getSenses(self) -> dict:
+        return self.senses
+
+    def getObjectives(self):
+        """Objective values, results x objectives."""
+        return self.__objectives
+
+    def getRanks(self):
+        """Front of every result, 0 for the Pareto front."""
+        if self.__ranks is None:
+            self.__ranks = non_dominated_ranks(self.__minimized)
+        return self.__ranks
+
+    def getFront(self, rank: int = 0):
+        """Indices of the results on front ``rank``, in result order."""
+        return np.flatnonzero(self.getRanks() == rank)
+
+    def getParetoFront(self):
+        """Indices of the non-dominated results."""
+        return self.getFront(0)
+
+    def getCrowdingDistances(self):
+        """Crowding distance of every result within its front."""
+        if self.__distances is None:
+            self.__distances = crowding_distances(self.__minimized, self.getRanks())
+        return self.__distances
+
+    def getHypervolume(self, reference: Optional[Sequence[float]] = None) -> float:
+        """
+        Hypervolume of the results for 2 or 3 objectives, bounded by
+        ``reference`` in the objectives' units; by default the worst value
+        of each objective over all results.
+        """
+        if reference is None:
+            reference = self.__minimized.max(axis=0, initial=-np.inf)
+        else:
+            reference = np.asarray(reference, dtype=np.float64) * self.__signs
+        return hypervolume(self.__minimized, reference)
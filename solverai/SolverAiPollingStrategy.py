@@ -0,0 +1,130 @@
+import random
+from typing import Optional
+
+
+DEFAULT_SETUP_RETRY_SECONDS = 5
+
+
+class SolverAiPollingStrategy:
+    """
+    Decides how long to sleep between status polls.
+
+    ``interval(poll_number)`` is called after the ``poll_number``-th poll
+    (starting at 1) returned a transient state. Strategies hold no per-wait
+    state, so one instance can be shared by every client and thread.
+    """
+
+    def interval(self, poll_number: int) -> float:
+        raise NotImplementedError
+
+
+class SolverAiFixedPolling(SolverAiPollingStrategy):
+
+    def __init__(self, interval_seconds: float = 1.0) -> None:
+        if interval_seconds < 0:
+            raise ValueError('interval_seconds must not be negative.')
+        self.interval_seconds = interval_seconds
+
+    def interval(self, poll_number: int) -> float:
+        return self.interval_seconds
+
+
+class SolverAiBackoffPolling(SolverAiPollingStrategy):
+    """
+    Exponential backoff with jitter and a fast early phase.
+
+    The first ``fast_polls`` waits use ``fast_interval_seconds`` so short
+    setups are noticed quickly. After that the interval starts at
+    ``min_interval_seconds`` and grows by ``multiplier`` per poll up to
+    ``max_interval_seconds``. Each interval is then scaled down by a random
+    factor in ``[1 - jitter, 1]`` so many workers waiting on the same problem
+    spread their polls out instead of hitting the Computer in lockstep.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float = 0.5,
+        max_interval_seconds: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        fast_polls: int = 3,
+        fast_interval_seconds: Optional[float] = 0.1,
+    ) -> None:
+        if min_interval_seconds < 0:
+            raise ValueError('min_interval_seconds must not be negative.')
+        if max_interval_seconds < min_interval_seconds:
+            raise ValueError(
+                'max_interval_seconds must not be below min_interval_seconds.'
+            )
+        if multiplier < 1:
+            raise ValueError('multiplier must be at least 1.')
+        if not 0 <= jitter <= 1:
+            raise ValueError('jitter must be between 0 and 1.')
+        if fast_polls < 0:
+            raise ValueError('fast_polls must not be negative.')
+
+        if fast_interval_seconds is None:
+            fast_interval_seconds = min_interval_seconds
+
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.fast_polls = fast_polls
+        self.fast_interval_seconds = fast_interval_seconds
+
+    def baseInterval(self, poll_number: int) -> float:
+        if poll_number <= self.fast_polls:
+            return self.fast_interval_seconds
+
+        exponent = poll_number - self.fast_polls - 1
+        # Cap the exponent so very long waits cannot overflow
+        exponent = min(exponent, 64)
+        return min(
+            self.max_interval_seconds,
+            self.min_interval_seconds * self.multiplier ** exponent,
+        )
+
+    def interval(self, poll_number: int) -> float:
+        base_interval = self.baseInterval(poll_number)
+        if not self.jitter:
+            return base_interval
+        return base_interval * (1 - self.jitter * random.random())
+
+
+class SolverAiSetupWaitStrategy:
+    """
+    How ``runSolver`` waits out a non-drain ``202`` setup-in-execution.
+
+    polling_strategy: interval between attempts; defaults to the historical
+        fixed 5 second retry
+    max_wait_seconds: optional deadline for the whole setup wait of one solve;
+        exceeding it raises ``SolverAiWaitTimeoutError``
+    poll_status: when True, wait on the cheap ``check_problem_status``
+        endpoint until READY and only then resubmit the solve, instead of
+        re-uploading the full payload on every attempt
+    require_not_updating: forwarded to the status polls when
+        ``poll_status`` is True
+
+    The solve payload is serialized once per ``runSolver`` call and reused
+    for every resubmission.
+    """
+
+    def __init__(
+        self,
+        polling_strategy: Optional[SolverAiPollingStrategy] = None,
+        max_wait_seconds: Optional[float] = None,
+        poll_status: bool = False,
+        require_not_updating: bool = False,
+    ) -> None:
+        if max_wait_seconds is not None and max_wait_seconds < 0:
+            raise ValueError('max_wait_seconds must not be negative.')
+        if polling_strategy is None:
+            polling_strategy = SolverAiFixedPolling(
+                DEFAULT_SETUP_RETRY_SECONDS
+            )
+
+        self.polling_strategy = polling_strategy
+        self.max_wait_seconds = max_wait_seconds
+        self.poll_status = poll_status
+        self.require_not_updating = require_not_updating
@@ -0,0 +1,125 @@
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from .SolverAiClientExceptions import SolverAiRateLimitedError
+
+
+RATE_LIMIT_KINDS = ('solve', 'status')
+
+
+class SolverAiTokenBucket:
+    """
+    Token bucket refilled at ``rate_per_second`` up to ``burst`` tokens.
+
+    ``tryAcquire`` never blocks: it takes a token and returns 0, or returns
+    how many seconds remain until the next token.
+    """
+
+    def __init__(self, rate_per_second: float, burst: Optional[float] = None):
+        if rate_per_second <= 0:
+            raise ValueError('rate_per_second must be positive.')
+        if burst is None:
+            burst = max(rate_per_second, 1.0)
+        if burst < 1:
+            raise ValueError('burst must be at least 1.')
+
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.__lock = Lock()
+        self.__tokens = float(burst)
+        self.__updated_at = monotonic()
+
+    def tryAcquire(self) -> float:
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(
+                self.burst,
+                self.__tokens + (now - self.__updated_at) * self.rate_per_second,
+            )
+            self.__updated_at = now
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+                return 0.0
+            return (1 - self.__tokens) / self.rate_per_second
+
+
+class SolverAiRateLimiter:
+    """
+    Client-side request budgets for the Computer.
+
+    ``solve`` covers ``solvejson/`` submissions and ``status`` covers status
+    and ``problem_setup/`` reads, so polling can never starve solves or the
+    reverse. A budget left as None is unlimited. A request over budget fails
+    at once with ``SolverAiRateLimitedError`` instead of being sent.
+    """
+
+    def __init__(
+        self,
+        solve_per_second: Optional[float] = None,
+        status_per_second: Optional[float] = None,
+        solve_burst: Optional[float] = None,
+        status_burst: Optional[float] = None,
+    ) -> None:
+        self.__buckets = {
+            'solve': None,
+            'status': None,
+        }
+        if solve_per_second is not None:
+            self.__buckets['solve'] = SolverAiTokenBucket(
+                solve_per_second,
+                solve_burst,
+            )
+        if status_per_second is not None:
+            self.__buckets['status'] = SolverAiTokenBucket(
+                status_per_second,
+                status_burst,
+            )
+        self.__lock = Lock()
+        self.__admitted = dict.fromkeys(RATE_LIMIT_KINDS, 0)
+        self.__rejected = dict.fromkeys(RATE_LIMIT_KINDS, 0)
+
+    def acquire(self, kind: str) -> None:
+        if kind not in self.__buckets:
+            raise ValueError(
+                f'Unknown rate limit kind {kind!r}; '
+                f'expected one of {list(RATE_LIMIT_KINDS)}.'
+            )
+        bucket = self.__buckets[kind]
+        wait_seconds = 0.0 if bucket is None else bucket.tryAcquire()
+        with self.__lock:
+            if wait_seconds:
+                self.__rejected[kind] += 1
+            else:
+                self.__admitted[kind] += 1
+        if wait_seconds:
+            raise SolverAiRateLimitedError(kind, wait_seconds)
+
+    def getStats(self) -> dict:
+        with self.__lock:
+            return {
+                kind: {
+                    'admitted': self.__admitted[kind],
+                    'rejected': self.__rejected[kind],
+                }
+                for kind in RATE_LIMIT_KINDS
+            }
+
+
+_default_rate_limiter: Optional[SolverAiRateLimiter] = None
+
+
+def get_rate_limiter() -> Optional[SolverAiRateLimiter]:
+    return _default_rate_limiter
+
+
+def set_rate_limiter(
+    rate_limiter: Optional[SolverAiRateLimiter],
+) -> Optional[SolverAiRateLimiter]:
+    """
+    Sets the rate limiter used by every compute client built without its own
+    ``rate_limiter``; None disables process-wide rate limiting.
+    """
+    global _default_rate_limiter
+    _default_rate_limiter = rate_limiter
+    return rate_limiter
@@ -0,0 +1,340 @@
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from threading import Lock
+from time import monotonic, time
+from typing import Optional
+
+from .SolverAiJsonCodec import get_json_codec
+
+
+# Bumped whenever the stored results change shape, so older disk entries miss
+RESULT_CACHE_VERSION = 1
+
+
+def result_cache_key(base_url: str, credential: str, fingerprint: str) -> str:
+    """
+    Key of one solve in a ``SolverAiResultCache``: a SHA-256 of the Computer
+    ``base_url``, the (already hashed) ``credential``, the input
+    ``fingerprint`` and ``RESULT_CACHE_VERSION``, so clients of different
+    Computers or tokens never share entries.
+    """
+    parts = (str(RESULT_CACHE_VERSION), base_url, credential, fingerprint)
+    return sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class SolverAiResultCacheStats:
+    hits: int
+    misses: int
+    memory_hits: int
+    disk_hits: int
+    hit_rate: float
+    entries: int
+    bytes_used: int
+    disk_entries: int
+    disk_bytes_used: int
+    evictions: int
+    invalidations: int
+
+
+class SolverAiResultCache:
+    """
+    Two-tier cache of raw ``solvejson/`` results keyed on
+    ``result_cache_key(...)``: the Computer, the hashed token and
+    ``SolverAiComputeInput.getFingerprint()``.
+
+    max_bytes: size budget of the in-memory LRU tier; least recently used
+        entries are evicted once the encoded results exceed it
+    disk_dir: optional directory for a persistent second tier; memory
+        evictions stay on disk and disk hits are promoted back to memory
+    disk_max_bytes: optional size budget of the disk tier; oldest files are
+        removed first
+    ttl_seconds: optional maximum age of an entry in either tier
+
+    Entries are stored as encoded JSON so their size is exact and every hit
+    builds a fresh ``SolverAiComputeResults``. All entries of a problem are
+    dropped by ``invalidateProblem`` when its status shows an update, and by
+    ``observeProblemVersion`` when its version (e.g. the inputs/outputs
+    ``ETag``) changes; with a disk tier the last version is kept on disk,
+    so an update made while no client was running is caught too.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError('max_bytes must not be negative.')
+
+        self.__max_bytes = max_bytes
+        self.__disk_dir = disk_dir
+        self.__disk_max_bytes = disk_max_bytes
+        self.__ttl_seconds = ttl_seconds
+        self.__lock = Lock()
+
+        # key -> (problem_id, encoded results, stored_at)
+        self.__entries = OrderedDict()
+        self.__keys_by_problem = {}
+        self.__versions = {}
+        self.__bytes_used = 0
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__memory_hits = 0
+        self.__disk_hits = 0
+        self.__evictions = 0
+        self.__invalidations = 0
+
+        self.__disk_entries = 0
+        self.__disk_bytes_used = 0
+        if disk_dir is not None:
+            os.makedirs(disk_dir, exist_ok=True)
+            for file_path in self.__diskFiles():
+                self.__disk_entries += 1
+                self.__disk_bytes_used += os.path.getsize(file_path)
+
+    @staticmethod
+    def __problemDirName(problem_id) -> str:
+        return sha256(str(problem_id).encode('utf-8')).hexdigest()[:32]
+
+    def __diskPath(self, problem_id, key: str) -> str:
+        return os.path.join(
+            self.__disk_dir,
+            self.__problemDirName(problem_id),
+            f'{key}.json',
+        )
+
+    def __versionPath(self, problem_id) -> str:
+        return os.path.join(
+            self.__disk_dir,
+            self.__problemDirName(problem_id),
+            'version',
+        )
+
+    def __diskFiles(self):
+        for entry in os.scandir(self.__disk_dir):
+            if not entry.is_dir():
+                continue
+            for file_entry in os.scandir(entry.path):
+                if file_entry.is_file() and file_entry.name.endswith('.json'):
+                    yield file_entry.path
+
+    def get(self, problem_id, key: str) -> Optional[dict]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and self.__isExpired(entry):
+                self.__removeMemoryEntry(key)
+                entry = None
+
+            if entry is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                self.__memory_hits += 1
+                return get_json_codec().loads(entry[1])
+
+            encoded = self.__readDisk(problem_id, key)
+            if encoded is None:
+                self.__misses += 1
+                return None
+
+            self.__hits += 1
+            self.__disk_hits += 1
+            self.__storeMemoryEntry(problem_id, key, encoded)
+            return get_json_codec().loads(encoded)
+
+    def put(self, problem_id, key: str, results: dict) -> None:
+        encoded = get_json_codec().dumps(results)
+        with self.__lock:
+            self.__storeMemoryEntry(problem_id, key, encoded)
+            self.__writeDisk(problem_id, key, encoded)
+
+    def invalidateProblem(self, problem_id) -> None:
+        with self.__lock:
+            self.__invalidate(problem_id)
+
+    def observeProblemVersion(self, problem_id, version: str) -> None:
+        """
+        Records ``version`` as the current version of ``problem_id``; when
+        it differs from the version recorded before, in this process or on
+        disk, the problem's entries are invalidated first.
+        """
+        with self.__lock:
+            previous = self.__versions.get(problem_id)
+            if previous is None:
+                previous = self.__readVersion(problem_id)
+            if previous == version:
+                self.__versions[problem_id] = version
+                return
+            if previous is not None:
+                self.__invalidate(problem_id)
+            self.__versions[problem_id] = version
+            self.__writeVersion(problem_id, version)
+
+    def clear(self) -> None:
+        with self.__lock:
+            problem_ids = list(self.__keys_by_problem)
+            self.__entries.clear()
+            self.__keys_by_problem.clear()
+            self.__bytes_used = 0
+            if self.__disk_dir is not None:
+                for file_path in list(self.__diskFiles()):
+                    os.remove(file_path)
+                self.__disk_entries = 0
+                self.__disk_bytes_used = 0
+            self.__invalidations += len(problem_ids)
+
+    def getStats(self) -> SolverAiResultCacheStats:
+        with self.__lock:
+            lookups = self.__hits + self.__misses
+            return SolverAiResultCacheStats(
+                hits=self.__hits,
+                misses=self.__misses,
+                memory_hits=self.__memory_hits,
+                disk_hits=self.__disk_hits,
+                hit_rate=self.__hits / lookups if lookups else 0.0,
+                entries=len(self.__entries),
+                bytes_used=self.__bytes_used,
+                disk_entries=self.__disk_entries,
+                disk_bytes_used=self.__disk_bytes_used,
+                evictions=self.__evictions,
+                invalidations=self.__invalidations,
+            )
+
+    def __invalidate(self, problem_id) -> None:
+        keys = self.__keys_by_problem.pop(problem_id, set())
+        for key in list(keys):
+            self.__removeMemoryEntry(key)
+        removed_from_disk = self.__removeDiskProblem(problem_id)
+        if keys or removed_from_disk:
+            self.__invalidations += 1
+
+    def __isExpired(self, entry) -> bool:
+        if self.__ttl_seconds is None:
+            return False
+        return monotonic() - entry[2] > self.__ttl_seconds
+
+    def __storeMemoryEntry(self, problem_id, key: str, encoded: bytes) -> None:
+        if key in self.__entries:
+            self.__removeMemoryEntry(key)
+        if len(encoded) > self.__max_bytes:
+            return
+
+        self.__entries[key] = (problem_id, encoded, monotonic())
+        self.__keys_by_problem.setdefault(problem_id, set()).add(key)
+        self.__bytes_used += len(encoded)
+
+        while self.__bytes_used > self.__max_bytes:
+            evicted_key = next(iter(self.__entries))
+            self.__removeMemoryEntry(evicted_key)
+            self.__evictions += 1
+
+    def __removeMemoryEntry(self, key: str) -> None:
+        problem_id, encoded, _ = self.__entries.pop(key)
+        self.__bytes_used -= len(encoded)
+        problem_keys = self.__keys_by_problem.get(problem_id)
+        if problem_keys is not None:
+            problem_keys.discard(key)
+            if not problem_keys:
+                del self.__keys_by_problem[problem_id]
+
+    def __readDisk(self, problem_id, key: str) -> Optional[bytes]:
+        if self.__disk_dir is None:
+            return None
+        file_path = self.__diskPath(problem_id, key)
+        try:
+            if (
+                self.__ttl_seconds is not None
+                and time() - os.path.getmtime(file_path) > self.__ttl_seconds
+            ):
+                size = os.path.getsize(file_path)
+                os.remove(file_path)
+                self.__disk_entries -= 1
+                self.__disk_bytes_used -= size
+                return None
+            with open(file_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def __readVersion(self, problem_id) -> Optional[str]:
+        if self.__disk_dir is None:
+            return None
+        try:
+            with open(self.__versionPath(problem_id), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def __writeVersion(self, problem_id, version: str) -> None:
+        if self.__disk_dir is None:
+            return
+        file_path = self.__versionPath(problem_id)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = f'{file_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(version)
+        os.replace(temp_path, file_path)
+
+    def __writeDisk(self, problem_id, key: str, encoded: bytes) -> None:
+        if self.__disk_dir is None:
+            return
+        if (
+            self.__disk_max_bytes is not None
+            and len(encoded) > self.__disk_max_bytes
+        ):
+            return
+
+        file_path = self.__diskPath(problem_id, key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if os.path.exists(file_path):
+            self.__disk_entries -= 1
+            self.__disk_bytes_used -= os.path.getsize(file_path)
+
+        temp_path = f'{file_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(encoded)
+        os.replace(temp_path, file_path)
+        self.__disk_entries += 1
+        self.__disk_bytes_used += len(encoded)
+
+        if (
+            self.__disk_max_bytes is not None
+            and self.__disk_bytes_used > self.__disk_max_bytes
+        ):
+            self.__evictDisk()
+
+    def __evictDisk(self) -> None:
+        files = sorted(self.__diskFiles(), key=os.path.getmtime)
+        for file_path in files:
+            if self.__disk_bytes_used <= self.__disk_max_bytes:
+                break
+            size = os.path.getsize(file_path)
+            os.remove(file_path)
+            self.__disk_entries -= 1
+            self.__disk_bytes_used -= size
+            self.__evictions += 1
+
+    def __removeDiskProblem(self, problem_id) -> bool:
+        if self.__disk_dir is None:
+            return False
+        problem_dir = os.path.join(
+            self.__disk_dir,
+            self.__problemDirName(problem_id),
+        )
+        if not os.path.isdir(problem_dir):
+            return False
+
+        removed = False
+        for file_entry in list(os.scandir(problem_dir)):
+            if file_entry.is_file() and file_entry.name.endswith('.json'):
+                size = file_entry.stat().st_size
+                os.remove(file_entry.path)
+                self.__disk_entries -= 1
+                self.__disk_bytes_used -= size
+                removed = True
+        return removed
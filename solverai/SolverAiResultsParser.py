@@ -0,0 +1,147 @@
+import multiprocessing
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from .SolverAiComputeResults import SolverAiComputeResults, block_from_values
+from .SolverAiJsonCodec import get_json_codec
+from .SolverAiNumericParser import is_float_block, parse_rows
+
+
+def _is_row_key(key: str) -> bool:
+    return key[:1] in ('X', 'Y') and key[1:].isdecimal()
+
+
+def _pack_rows(rows: list):
+    """
+    Packs parsed rows as ``('array', flat, width, count)``: one ``array('d')``
+    holding every value row after row, 8 bytes per value. Rows of uneven
+    width or holding anything but floats stay ``('rows', rows)``.
+    """
+    width = len(rows[0]) if rows else 0
+    if all(len(row) == width for row in rows) and is_float_block(rows):
+        flat = array('d')
+        for row in rows:
+            flat.extend(row)
+        return 'array', flat, width, len(rows)
+    return 'rows', rows
+
+
+def _unpack_rows(packed):
+    if packed[0] == 'rows':
+        return packed[1]
+    return block_from_values(*packed[1:])
+
+
+def parse_results(results: dict, keep_raw: bool = False) -> dict:
+    """
+    Parses a ``results`` dict of a solve response into a picklable payload
+    for ``results_from_payload``: the plain fields, the ``X``/``Y`` rows
+    packed by ``_pack_rows`` and, with ``keep_raw``, ``results`` itself.
+    """
+    count = results['Number Of Results']
+    return {
+        'fields': {
+            key: value for key, value in results.items() if not _is_row_key(key)
+        },
+        'X': _pack_rows(
+            parse_rows([results[f'X{index}'] for index in range(count)])
+        ),
+        'Y': _pack_rows(
+            parse_rows([results[f'Y{index}'] for index in range(count)])
+        ),
+        'raw': results if keep_raw else None,
+    }
+
+
+def parse_results_body(body: bytes, keep_raw: bool = False) -> dict:
+    """``parse_results`` of a raw ``solvejson/`` response body."""
+    try:
+        data = get_json_codec().loads(body)
+    except Exception:
+        raise Exception('Failed retrieving data.')
+    return parse_results(data['results'], keep_raw)
+
+
+def results_from_payload(payload: dict) -> SolverAiComputeResults:
+    return SolverAiComputeResults._fromParsed(
+        payload['fields'],
+        _unpack_rows(payload['X']),
+        _unpack_rows(payload['Y']),
+    )
+
+
+def default_mp_context():
+    """
+    ``forkserver``, else ``spawn``: compute clients run transport, batch and
+    hedging threads, and forking a multithreaded process can deadlock on a
+    lock another thread held at the time.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+class SolverAiResultsParserPool:
+    """
+    Parses solve responses in worker processes.
+
+    Turning each ``X{i}``/``Y{i}`` string into numbers is CPU-bound and
+    holds the GIL, starving the threads that wait on the network. With
+    ``results_parser=`` a compute client hands the raw response body to
+    this pool instead; workers decode and parse it and send back the rows
+    packed as ``array('d')``, so only compact binary data crosses the
+    process boundary and the I/O threads keep running meanwhile.
+
+    max_workers: worker processes (default: one per CPU)
+    min_body_bytes: bodies below this size are parsed in the calling
+        thread, where a process round trip would cost more than it saves
+    mp_context: ``multiprocessing`` context for the workers (default:
+        ``default_mp_context()``, never ``fork``)
+
+    Numeric values come back as floats. Results whose rows are not all
+    numeric or not all the same width are returned as plain lists.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        min_body_bytes: int = 64 * 1024,
+        mp_context=None,
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError('max_workers must be at least 1.')
+        if min_body_bytes < 0:
+            raise ValueError('min_body_bytes must not be negative.')
+
+        if mp_context is None:
+            mp_context = default_mp_context()
+        self.min_body_bytes = min_body_bytes
+        self.__executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+        )
+
+    def submit(self, body: bytes, keep_raw: bool = False) -> Future:
+        """Future of the ``parse_results_body`` payload of ``body``."""
+        if len(body) >= self.min_body_bytes:
+            return self.__executor.submit(parse_results_body, body, keep_raw)
+
+        future = Future()
+        try:
+            future.set_result(parse_results_body(body, keep_raw))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def parse(self, body: bytes) -> SolverAiComputeResults:
+        return results_from_payload(self.submit(body).result())
+
+    def close(self) -> None:
+        self.__executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import Awaitable, Callable, Hashable
+
+from .SolverAiClientExceptions import SolverAiDeadlineExceededError
+from .SolverAiDeadline import check_deadline
+
+
+@dataclass(frozen=True)
+class SolverAiSingleFlightStats:
+    leaders: int
+    coalesced: int
+    in_flight: int
+
+
+class _SolverAiFlight:
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SolverAiSingleFlight:
+    """
+    Coalesces identical solves that are in flight at the same time.
+
+    The first call for a key (the leader) runs the solve; calls for the same
+    key arriving before it finishes wait for it and receive the very same
+    ``SolverAiComputeResults`` object, or the same exception. Nothing is
+    kept once the solve finishes: a later call starts a new one, so this is
+    not a cache (see ``SolverAiResultCache`` for that).
+
+    A waiting call still honours its own deadline, and when the leader
+    fails only because its deadline ran out, the waiting calls start the
+    solve again rather than raise that error. In the async client the
+    shared solve runs as its own task, so cancelling one caller never
+    cancels the solve the others are waiting on.
+
+    Pass one instance as ``single_flight=`` to every client that should
+    share in-flight solves; only clients with the same Computer URL and
+    token share a solve.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__flights = {}
+        self.__tasks = {}
+        self.__leaders = 0
+        self.__coalesced = 0
+
+    def run(self, key: Hashable, function: Callable):
+        while True:
+            with self.__lock:
+                flight = self.__flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self.__flights[key] = _SolverAiFlight()
+                    self.__leaders += 1
+                else:
+                    self.__coalesced += 1
+
+            if leader:
+                try:
+                    flight.result = function()
+                    return flight.result
+                except BaseException as error:
+                    flight.error = error
+                    raise
+                finally:
+                    with self.__lock:
+                        del self.__flights[key]
+                    flight.done.set()
+
+            # check_deadline raises once the caller's own deadline has passed
+            while not flight.done.wait(check_deadline()):
+                pass
+            if isinstance(flight.error, SolverAiDeadlineExceededError):
+                continue
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+    async def runAsync(self, key: Hashable, function: Callable[[], Awaitable]):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.__lock:
+                task = self.__tasks.get(key)
+                leader = task is None or task.done() or task.get_loop() is not loop
+                if leader:
+                    task = self.__tasks[key] = asyncio.ensure_future(function())
+                    task.add_done_callback(
+                        lambda done, key=key: self.__forgetTask(key, done)
+                    )
+                    self.__leaders += 1
+                else:
+                    self.__coalesced += 1
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), check_deadline())
+            except SolverAiDeadlineExceededError:
+                # The task runs under the deadline of the call that started it
+                if leader:
+                    raise
+            except asyncio.TimeoutError:
+                check_deadline()
+                raise
+
+    def getStats(self) -> SolverAiSingleFlightStats:
+        with self.__lock:
+            return SolverAiSingleFlightStats(
+                leaders=self.__leaders,
+                coalesced=self.__coalesced,
+                in_flight=len(self.__flights) + len(self.__tasks),
+            )
+
+    def __forgetTask(self, key, task) -> None:
+        with self.__lock:
+            if self.__tasks.get(key) is task:
+                del self.__tasks[key]
+        if not task.cancelled():
+            # Mark the error retrieved when every caller has gone away
+            task.exception()
@@ -0,0 +1,382 @@
+import copy
+import itertools
+import random
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterator, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .SolverAiComputeInput import SolverAiComputeInput
+from .SolverAiComputeResults import SolverAiComputeResults, dataframe_layout
+from .SolverAiNumericParser import np
+from .SolverAiPollingStrategy import SolverAiSetupWaitStrategy
+
+
+SWEEP_DESIGNS = ('grid', 'lhs', 'random')
+INPUT_FIELDS = ('Min', 'Max', 'Value')
+CONSTRAINT_FIELDS = ('Value1', 'Value2')
+
+
+@dataclass(frozen=True)
+class SolverAiSweepParameter:
+    """
+    One swept quantity of a ``SolverAiComputeInput``.
+
+    target: ``'input'`` or ``'constraint'``
+    name: the input or constraint name, as passed to ``addInput`` /
+        ``addConstraint`` on the base input
+    field: ``'Min'``, ``'Max'`` or ``'Value'`` (both bounds, making the input
+        constant) for inputs; ``'Value1'`` or ``'Value2'`` for constraints
+    low / high: range sampled by the ``lhs`` and ``random`` designs, and
+        split into evenly spaced levels by ``grid``
+    levels: explicit grid levels, overriding ``low`` / ``high`` for ``grid``
+    integer: round every sampled value to an int
+    """
+    target: str
+    name: str
+    field: str
+    low: float = 0.0
+    high: float = 0.0
+    levels: Optional[Tuple[float, ...]] = None
+    integer: bool = False
+
+    def __post_init__(self) -> None:
+        if self.target == 'input':
+            fields = INPUT_FIELDS
+        elif self.target == 'constraint':
+            fields = CONSTRAINT_FIELDS
+        else:
+            raise ValueError("target must be 'input' or 'constraint'.")
+        if self.field not in fields:
+            raise ValueError(f'field must be one of {fields}.')
+        if self.levels is not None:
+            if not self.levels:
+                raise ValueError('levels must not be empty.')
+            object.__setattr__(self, 'levels', tuple(self.levels))
+        elif self.high < self.low:
+            raise ValueError('high must not be below low.')
+
+    @classmethod
+    def forInput(
+        cls,
+        name: str,
+        field: str,
+        low: float = 0.0,
+        high: float = 0.0,
+        levels: Optional[Sequence[float]] = None,
+        integer: bool = False,
+    ) -> 'SolverAiSweepParameter':
+        return cls('input', name, field, low, high, levels, integer)
+
+    @classmethod
+    def forConstraint(
+        cls,
+        name: str,
+        low: float = 0.0,
+        high: float = 0.0,
+        levels: Optional[Sequence[float]] = None,
+        field: str = 'Value1',
+        integer: bool = False,
+    ) -> 'SolverAiSweepParameter':
+        return cls('constraint', name, field, low, high, levels, integer)
+
+    @property
+    def column(self) -> str:
+        """Name of this parameter's coordinate column in sweep results."""
+        return f'{self.name}.{self.field}'
+
+    def gridLevels(self, count: int) -> Tuple[float, ...]:
+        if self.levels is not None:
+            return tuple(self.value(level) for level in self.levels)
+        if count == 1 or self.high == self.low:
+            return (self.value(self.low),)
+        step = (self.high - self.low) / (count - 1)
+        return tuple(self.value(self.low + step * index) for index in range(count))
+
+    def scaled(self, unit: float):
+        """The value at ``unit`` in [0, 1) of the range."""
+        return self.value(self.low + unit * (self.high - self.low))
+
+    def value(self, value):
+        return int(round(value)) if self.integer else value
+
+
+class SolverAiSweepResults:
+    """
+    Every row of every solve of a sweep in one columnar table.
+
+    Columns are ``point`` (sweep point index), ``result`` (row within that
+    point's results), one coordinate column per swept parameter, then the
+    input and output variables laid out as in
+    ``SolverAiComputeResults.getDataFrame()``. Each column is a typed
+    ``array`` (8 bytes per value), and rows are appended as solves complete,
+    so row order follows completion order; sort on ``point`` if needed.
+
+    Points whose solve raised are kept in ``errors`` and have no rows.
+    """
+
+    def __init__(self, coordinateColumns: Sequence[str]) -> None:
+        self.__coordinateColumns = list(coordinateColumns)
+        self.__variableColumns = None
+        self.__keep_idx = None
+        self.__columns = {
+            'point': array('q'),
+            'result': array('q'),
+        }
+        for name in self.__coordinateColumns:
+            self.__columns[name] = array('d')
+        self.numberOfPoints = 0
+        self.errors = {}
+
+    @property
+    def columns(self) -> list:
+        return list(self.__columns)
+
+    def column(self, name: str) -> array:
+        return self.__columns[name]
+
+    def __len__(self) -> int:
+        return len(self.__columns['point'])
+
+    def getFailedPoints(self) -> dict:
+        """``{point: (coordinates, exception)}`` for every failed solve."""
+        return self.errors
+
+    def add(self, point: int, coordinates: tuple, results: SolverAiComputeResults) -> None:
+        self.__setVariableColumns(results)
+        keep_idx = self.__keep_idx
+        columns = self.__columns
+        coordinateColumns = [columns[name] for name in self.__coordinateColumns]
+        variableColumns = [columns[name] for name in self.__variableColumns]
+        # Converted up front so a bad value cannot leave the columns ragged
+        if np is None:
+            rows = [
+                array('d', itertools.chain((x[i] for i in keep_idx), y))
+                for x, y in zip(results.getX(), results.getY())
+            ]
+            count = len(rows)
+            values = [array('d', column) for column in zip(*rows)]
+        else:
+            # Read from the stored arrays, so the results are not unpacked
+            values = np.concatenate(
+                (results.getXArray()[:, keep_idx], results.getYArray()),
+                axis=1,
+            )
+            count = len(values)
+            values = values.T.astype(np.float64, order='C')
+        columns['point'].extend(itertools.repeat(point, count))
+        columns['result'].extend(range(count))
+        for column, value in zip(coordinateColumns, coordinates):
+            column.extend(itertools.repeat(value, count))
+        for column, value in zip(variableColumns, values):
+            column.frombytes(value.tobytes())
+        self.numberOfPoints += 1
+
+    def addError(self, point: int, coordinates: tuple, error: Exception) -> None:
+        self.errors[point] = (coordinates, error)
+        self.numberOfPoints += 1
+
+    def __setVariableColumns(self, results: SolverAiComputeResults) -> None:
+        keep_idx, variableColumns = dataframe_layout(
+            results.getInputVariableNames(),
+            results.getOutputVariableNames(),
+        )
+        if self.__variableColumns is None:
+            clashes = set(variableColumns) & set(self.__columns)
+            if clashes:
+                raise ValueError(f'Variable names clash with sweep columns: {clashes}.')
+            self.__variableColumns = variableColumns
+            self.__keep_idx = keep_idx
+            for name in variableColumns:
+                self.__columns[name] = array('d')
+        elif variableColumns != self.__variableColumns:
+            raise ValueError('Solve results have different variables than the sweep.')
+
+    def getDataFrame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.__columns, columns=self.columns)
+
+
+class SolverAiSweep:
+    """
+    Design-of-experiments sweep over a base ``SolverAiComputeInput``.
+
+    design: ``'grid'`` (every combination of each parameter's levels),
+        ``'lhs'`` (Latin hypercube of ``samples`` points) or ``'random'``
+        (``samples`` uniform points)
+    grid_levels: levels per parameter for ``grid`` when a parameter has no
+        explicit ``levels``
+    seed: makes ``lhs`` / ``random`` points reproducible; without one a seed
+        is drawn once, so iterating the sweep twice gives the same points
+
+    Points and their inputs are generated lazily: a variant copies only the
+    input and constraint dicts it changes, and ``run`` keeps at most
+    ``max_concurrency`` of them alive, so memory is bounded by the result
+    table rather than the number of points.
+    """
+
+    def __init__(
+        self,
+        base_input: SolverAiComputeInput,
+        parameters: Sequence[SolverAiSweepParameter],
+        design: str = 'grid',
+        samples: Optional[int] = None,
+        grid_levels: int = 5,
+        seed: Optional[int] = None,
+    ) -> None:
+        parameters = list(parameters)
+        if not parameters:
+            raise ValueError('A sweep needs at least one parameter.')
+        if design not in SWEEP_DESIGNS:
+            raise ValueError(f'design must be one of {SWEEP_DESIGNS}.')
+        if design == 'grid':
+            if grid_levels < 1:
+                raise ValueError('grid_levels must be at least 1.')
+        elif samples is None or samples < 1:
+            raise ValueError(f'The {design} design needs samples of at least 1.')
+        for parameter in parameters:
+            entries = (
+                base_input.inputs if parameter.target == 'input'
+                else base_input.constraints
+            )
+            if parameter.name not in entries:
+                raise ValueError(
+                    f'Base input has no {parameter.target} {parameter.name!r}.'
+                )
+        columns = [parameter.column for parameter in parameters]
+        if len(set(columns)) != len(columns):
+            raise ValueError('Each parameter may be swept only once.')
+
+        self.base_input = base_input
+        self.parameters = parameters
+        self.design = design
+        self.samples = samples
+        self.grid_levels = grid_levels
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+
+    @property
+    def coordinateColumns(self) -> list:
+        return [parameter.column for parameter in self.parameters]
+
+    def __len__(self) -> int:
+        if self.design != 'grid':
+            return self.samples
+        count = 1
+        for parameter in self.parameters:
+            count *= len(parameter.gridLevels(self.grid_levels))
+        return count
+
+    def points(self) -> Iterator[tuple]:
+        """Coordinates of every point, one tuple per point, in point order."""
+        if self.design == 'grid':
+            return itertools.product(*(
+                parameter.gridLevels(self.grid_levels)
+                for parameter in self.parameters
+            ))
+        if self.design == 'lhs':
+            return self.__latinHypercubePoints()
+        return self.__randomPoints()
+
+    def __randomPoints(self):
+        generator = random.Random(self.seed)
+        for _ in range(self.samples):
+            yield tuple(
+                parameter.scaled(generator.random())
+                for parameter in self.parameters
+            )
+
+    def __latinHypercubePoints(self):
+        generator = random.Random(self.seed)
+        samples = self.samples
+        # One stratum permutation per parameter, 8 bytes per point
+        strata = []
+        for _ in self.parameters:
+            permutation = array('q', range(samples))
+            generator.shuffle(permutation)
+            strata.append(permutation)
+        for index in range(samples):
+            yield tuple(
+                parameter.scaled(
+                    (permutation[index] + generator.random()) / samples
+                )
+                for parameter, permutation in zip(self.parameters, strata)
+            )
+
+    def variant(self, coordinates: tuple) -> SolverAiComputeInput:
+        """The base input with every parameter set to its coordinate."""
+        variant = copy.copy(self.base_input)
+        variant.inputs = dict(variant.inputs)
+        variant.constraints = dict(variant.constraints)
+        for parameter, value in zip(self.parameters, coordinates):
+            if parameter.target == 'input':
+                entry = dict(variant.inputs[parameter.name])
+                if parameter.field == 'Value':
+                    entry['Min'] = entry['Max'] = value
+                else:
+                    entry[parameter.field] = value
+                entry['Constant'] = entry['Min'] == entry['Max']
+                variant.inputs[parameter.name] = entry
+            else:
+                entry = dict(variant.constraints[parameter.name])
+                entry[parameter.field] = value
+                variant.constraints[parameter.name] = entry
+        return variant
+
+    def variants(self) -> Iterator[Tuple[int, tuple, SolverAiComputeInput]]:
+        """Lazily yields ``(point, coordinates, input)`` for every point."""
+        for point, coordinates in enumerate(self.points()):
+            yield point, coordinates, self.variant(coordinates)
+
+    def run(
+        self,
+        client,
+        max_concurrency: Optional[int] = None,
+        setup_wait_strategy: Optional[SolverAiSetupWaitStrategy] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> SolverAiSweepResults:
+        """
+        Solves every point with ``client.runSolver`` (a
+        ``SolverAiClientCompute`` or a ``forProblem`` view), at most
+        ``max_concurrency`` at a time (default: the transport's
+        ``pool_maxsize``), and collects the results into one
+        ``SolverAiSweepResults``. ``deadline_seconds`` bounds each solve.
+        A failed point is recorded in ``errors`` and never stops the sweep.
+        """
+        if max_concurrency is None:
+            max_concurrency = client.transport.pool_maxsize
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1.')
+
+        results = SolverAiSweepResults(self.coordinateColumns)
+        variants = self.variants()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending = {}
+
+            def submit_next() -> None:
+                item = next(variants, None)
+                if item is None:
+                    return
+                point, coordinates, input = item
+                future = executor.submit(
+                    client.runSolver,
+                    input,
+                    setup_wait_strategy=setup_wait_strategy,
+                    deadline_seconds=deadline_seconds,
+                )
+                pending[future] = (point, coordinates)
+
+            for _ in range(max_concurrency):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    point, coordinates = pending.pop(future)
+                    try:
+                        results.add(point, coordinates, future.result())
+                    except Exception as error:
+                        results.addError(point, coordinates, error)
+                    submit_next()
+        return results
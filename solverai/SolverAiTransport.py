@@ -0,0 +1,503 @@
+import gzip
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import timedelta
+from time import perf_counter
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .SolverAiInstrumentation import active_recorder
+
+try:
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+except ImportError:
+    HTTPConnection = None
+
+
+SUPPORTED_REQUEST_COMPRESSIONS = ('gzip', 'deflate')
+ACCEPT_ENCODING = 'gzip, deflate'
+RESPONSE_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class SolverAiTransferStats:
+    """
+    Byte counts of one HTTP exchange.
+
+    ``*_bytes`` are payload sizes before compression (request) or after
+    decompression (response); ``*_wire_bytes`` are the sizes that actually
+    crossed the network.
+    """
+    request_bytes: int = 0
+    request_wire_bytes: int = 0
+    request_encoding: Optional[str] = None
+    response_bytes: int = 0
+    response_wire_bytes: int = 0
+    response_encoding: Optional[str] = None
+
+
+class SolverAiHttpResponse:
+    """Fully read, decoded response returned by ``SolverAiTransport.exchange``."""
+
+    def __init__(
+        self,
+        status_code: int,
+        headers,
+        content: bytes,
+        transfer_stats: SolverAiTransferStats,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.transfer_stats = transfer_stats
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _new_decompressor(encoding: Optional[str]):
+    if encoding == 'gzip':
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        return zlib.decompressobj(zlib.MAX_WBITS)
+    return None
+
+
+def _iter_raw_chunks(response):
+    """
+    Yields the undecoded body of ``response`` chunk by chunk.
+
+    Falls back to the already-materialized body for response objects that do
+    not expose a raw stream.
+    """
+    raw = getattr(response, 'raw', None)
+    if raw is not None and hasattr(raw, 'stream'):
+        yield from raw.stream(RESPONSE_CHUNK_BYTES, decode_content=False)
+        return
+
+    content = getattr(response, 'content', None)
+    if content is None:
+        content = response.text
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    yield content
+
+
+def iter_decoded_body(response, counters: Optional[dict] = None):
+    """
+    Yields the decoded body of ``response`` chunk by chunk, decompressing
+    gzip/deflate content incrementally so a compressed body is never held
+    in full. ``counters['wire_bytes']`` and ``counters['bytes']`` are updated
+    as the body is read.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    encoding = (headers.get('Content-Encoding') or '').strip().lower() or None
+    decompressor = _new_decompressor(encoding)
+    if counters is None:
+        counters = {}
+    counters.setdefault('wire_bytes', 0)
+    counters.setdefault('bytes', 0)
+    counters['encoding'] = encoding if decompressor is not None else None
+
+    is_first_chunk = True
+    for chunk in _iter_raw_chunks(response):
+        if not chunk:
+            continue
+        counters['wire_bytes'] += len(chunk)
+        if decompressor is None:
+            decoded = chunk
+        else:
+            try:
+                decoded = decompressor.decompress(chunk)
+            except zlib.error:
+                if not (is_first_chunk and encoding == 'deflate'):
+                    raise
+                # Some servers send raw deflate without the zlib wrapper
+                decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+                decoded = decompressor.decompress(chunk)
+        is_first_chunk = False
+        if decoded:
+            counters['bytes'] += len(decoded)
+            yield decoded
+
+    if decompressor is not None:
+        tail = decompressor.flush()
+        if tail:
+            counters['bytes'] += len(tail)
+            yield tail
+
+
+def _connect_timed(connect):
+    recorder = active_recorder()
+    if recorder is None:
+        return connect()
+    started = perf_counter()
+    try:
+        return connect()
+    finally:
+        recorder.addPhase('connect', perf_counter() - started)
+
+
+if HTTPConnection is not None:
+
+    class _SolverAiTimedHTTPConnection(HTTPConnection):
+        def connect(self):
+            return _connect_timed(super().connect)
+
+    class _SolverAiTimedHTTPSConnection(HTTPSConnection):
+        def connect(self):
+            return _connect_timed(super().connect)
+
+    class _SolverAiTimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = _SolverAiTimedHTTPConnection
+
+    class _SolverAiTimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = _SolverAiTimedHTTPSConnection
+
+    _TIMED_POOL_CLASSES = {
+        'http': _SolverAiTimedHTTPConnectionPool,
+        'https': _SolverAiTimedHTTPSConnectionPool,
+    }
+else:
+    _TIMED_POOL_CLASSES = None
+
+
+class _SolverAiTimedHTTPAdapter(HTTPAdapter):
+    """
+    ``HTTPAdapter`` whose new connections report their TCP/TLS setup time as
+    the ``connect`` phase of the active instrumented call.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if _TIMED_POOL_CLASSES is not None:
+            self.poolmanager.pool_classes_by_scheme = _TIMED_POOL_CLASSES
+
+
+def send_instrumented(
+    send,
+    method: str,
+    url: str,
+    request_bytes: Optional[int] = None,
+    request_wire_bytes: Optional[int] = None,
+    **kwargs,
+):
+    """
+    Calls ``send(method, url, **kwargs)`` (a ``requests``-style request
+    function) and records ``ttfb``/``transfer``, the attempt and its payload
+    sizes on the active instrumented call, if any. Request sizes default to
+    the length of a bytes/str ``data`` body.
+
+    ``ttfb`` runs from sending the request to receiving the response headers,
+    minus any ``connect`` time recorded meanwhile. For non-streamed requests
+    the body read after the headers is ``transfer``.
+    """
+    recorder = active_recorder()
+    if recorder is None:
+        return send(method, url, **kwargs)
+
+    if request_bytes is None:
+        data = kwargs.get('data')
+        request_bytes = len(data) if isinstance(data, (bytes, bytearray, str)) else 0
+    if request_wire_bytes is None:
+        request_wire_bytes = request_bytes
+    recorder.addTransfer(
+        request_bytes=request_bytes,
+        request_wire_bytes=request_wire_bytes,
+    )
+
+    connect_before = recorder.phase('connect')
+    started = perf_counter()
+    response = send(method, url, **kwargs)
+    elapsed = perf_counter() - started
+    connect_seconds = recorder.phase('connect') - connect_before
+
+    headers_seconds = elapsed
+    streamed = kwargs.get('stream', False)
+    response_elapsed = getattr(response, 'elapsed', None)
+    if not streamed and isinstance(response_elapsed, timedelta):
+        headers_seconds = min(response_elapsed.total_seconds(), elapsed)
+    recorder.addPhase('ttfb', headers_seconds - connect_seconds)
+    if not streamed:
+        recorder.addPhase('transfer', elapsed - headers_seconds)
+        content = getattr(response, 'content', None)
+        if not isinstance(content, (bytes, bytearray)):
+            text = getattr(response, 'text', None)
+            content = text.encode('utf-8') if isinstance(text, str) else b''
+        wire_bytes = getattr(getattr(response, 'raw', None), 'tell', None)
+        wire_bytes = wire_bytes() if callable(wire_bytes) else None
+        if not isinstance(wire_bytes, int):
+            wire_bytes = len(content)
+        recorder.addTransfer(
+            response_bytes=len(content),
+            response_wire_bytes=wire_bytes,
+        )
+    recorder.addAttempt(response.status_code)
+    return response
+
+
+class SolverAiStreamingResponse:
+    """
+    Response returned by ``SolverAiTransport.open`` whose body has not been
+    read yet.
+
+    ``iterBody()`` yields the decoded body chunk by chunk and may be consumed
+    once; ``transfer_stats`` reflects the bytes read so far.
+    """
+
+    def __init__(
+        self,
+        response,
+        request_bytes: int,
+        request_wire_bytes: int,
+        request_encoding: Optional[str],
+        recorder=None,
+    ) -> None:
+        self.__response = response
+        self.__recorder = recorder
+        self.__request_bytes = request_bytes
+        self.__request_wire_bytes = request_wire_bytes
+        self.__request_encoding = request_encoding
+        self.__counters = {'wire_bytes': 0, 'bytes': 0, 'encoding': None}
+
+    @property
+    def status_code(self) -> int:
+        return self.__response.status_code
+
+    @property
+    def headers(self):
+        return self.__response.headers
+
+    @property
+    def transfer_stats(self) -> SolverAiTransferStats:
+        return SolverAiTransferStats(
+            request_bytes=self.__request_bytes,
+            request_wire_bytes=self.__request_wire_bytes,
+            request_encoding=self.__request_encoding,
+            response_bytes=self.__counters['bytes'],
+            response_wire_bytes=self.__counters['wire_bytes'],
+            response_encoding=self.__counters['encoding'],
+        )
+
+    def iterBody(self):
+        body = iter_decoded_body(self.__response, self.__counters)
+        if self.__recorder is None:
+            return body
+        return self.__timedBody(body)
+
+    def __timedBody(self, body):
+        recorder = self.__recorder
+        while True:
+            started = perf_counter()
+            chunk = next(body, None)
+            recorder.addPhase('transfer', perf_counter() - started)
+            if chunk is None:
+                break
+            yield chunk
+        recorder.addTransfer(
+            response_bytes=self.__counters['bytes'],
+            response_wire_bytes=self.__counters['wire_bytes'],
+        )
+
+    def read(self) -> SolverAiHttpResponse:
+        content = b''.join(self.iterBody())
+        return SolverAiHttpResponse(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=content,
+            transfer_stats=self.transfer_stats,
+        )
+
+    def close(self) -> None:
+        close = getattr(self.__response, 'close', None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SolverAiTransport:
+    """
+    Pooled, keep-alive HTTP transport for the Computer endpoints.
+
+    Wraps a single ``requests.Session`` so that solves and status polls reuse
+    TCP/TLS connections instead of paying a fresh handshake per call.
+
+    pool_connections: number of per-host connection pools kept alive
+    pool_maxsize: maximum number of connections kept alive per host
+    pool_block: when True, callers wait for a free connection instead of
+        opening extra, non-pooled connections beyond ``pool_maxsize``
+    session: optional caller-owned ``requests.Session``; when given it is used
+        as-is (no adapters are mounted) and is not closed by ``close()``
+    request_compression: optional ``'gzip'`` or ``'deflate'``; request bodies
+        sent through ``exchange`` are compressed with it once they reach
+        ``request_compression_min_bytes``
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+        request_compression: Optional[str] = None,
+        request_compression_min_bytes: int = 16 * 1024,
+    ) -> None:
+        if pool_connections < 1:
+            raise ValueError('pool_connections must be at least 1.')
+        if pool_maxsize < 1:
+            raise ValueError('pool_maxsize must be at least 1.')
+        if (
+            request_compression is not None
+            and request_compression not in SUPPORTED_REQUEST_COMPRESSIONS
+        ):
+            raise ValueError(
+                f'request_compression must be one of '
+                f'{SUPPORTED_REQUEST_COMPRESSIONS}.'
+            )
+        if request_compression_min_bytes < 0:
+            raise ValueError('request_compression_min_bytes must not be negative.')
+
+        self.__request_compression = request_compression
+        self.__request_compression_min_bytes = request_compression_min_bytes
+
+        self.__pool_connections = pool_connections
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_block = pool_block
+        self.__owns_session = session is None
+
+        if session is None:
+            session = requests.Session()
+            adapter = _SolverAiTimedHTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.__session = session
+
+    @property
+    def session(self) -> requests.Session:
+        return self.__session
+
+    @property
+    def pool_connections(self) -> int:
+        return self.__pool_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self.__pool_maxsize
+
+    @property
+    def pool_block(self) -> bool:
+        return self.__pool_block
+
+    @property
+    def request_compression(self) -> Optional[str]:
+        return self.__request_compression
+
+    @property
+    def request_compression_min_bytes(self) -> int:
+        return self.__request_compression_min_bytes
+
+    def request(self, method: str, url: str, **kwargs):
+        return send_instrumented(self.__session.request, method, url, **kwargs)
+
+    def __compressBody(self, data: bytes):
+        if (
+            self.__request_compression is None
+            or len(data) < self.__request_compression_min_bytes
+        ):
+            return data, None
+        if self.__request_compression == 'gzip':
+            return gzip.compress(data, compresslevel=6), 'gzip'
+        return zlib.compress(data, 6), 'deflate'
+
+    def open(self, method: str, url: str, **kwargs) -> 'SolverAiStreamingResponse':
+        """
+        Sends one request and returns its response without reading the body.
+
+        A ``data`` body is compressed per ``request_compression`` and
+        compressed responses are negotiated with ``Accept-Encoding``. The
+        caller reads the decoded body with ``iterBody()`` or ``read()`` and
+        must close the returned response (it is a context manager).
+        """
+        recorder = active_recorder()
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
+
+        data = kwargs.pop('data', None)
+        request_bytes = 0
+        request_wire_bytes = 0
+        request_encoding = None
+        if data is not None:
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            request_bytes = len(data)
+            if recorder is None:
+                data, request_encoding = self.__compressBody(data)
+            else:
+                started = perf_counter()
+                data, request_encoding = self.__compressBody(data)
+                recorder.addPhase('serialize', perf_counter() - started)
+            request_wire_bytes = len(data)
+            if request_encoding is not None:
+                headers['Content-Encoding'] = request_encoding
+            kwargs['data'] = data
+
+        response = send_instrumented(
+            self.__session.request,
+            method,
+            url,
+            request_bytes=request_bytes,
+            request_wire_bytes=request_wire_bytes,
+            headers=headers,
+            stream=True,
+            **kwargs,
+        )
+        return SolverAiStreamingResponse(
+            response,
+            request_bytes,
+            request_wire_bytes,
+            request_encoding,
+            recorder,
+        )
+
+    def exchange(self, method: str, url: str, **kwargs) -> SolverAiHttpResponse:
+        """
+        Sends one request and reads the whole response body.
+
+        Same negotiation as ``open``; byte counts before and after
+        compression are returned in ``response.transfer_stats``.
+        """
+        with self.open(method, url, **kwargs) as response:
+            return response.read()
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self) -> None:
+        if self.__owns_session:
+            self.__session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,25 +1,119 @@
 from .client_config import get_setup_data, validate_token
 from .IdsDataManager import IdsDataManager
+from .SolverAiAsyncClientCompute import SolverAiAsyncClientCompute
+from .SolverAiCircuitBreaker import (
+    SolverAiCircuitBreaker,
+    get_circuit_breaker,
+    set_circuit_breaker,
+)
 from .SolverAiClientCompute import SolverAiClientCompute, SolverAiProblemStatusInfo
 from .SolverAiClientExceptions import (
     SetupInExecutionException,
+    SolverAiCircuitOpenError,
+    SolverAiDeadlineExceededError,
     SolverAiDrainingException,
+    SolverAiRateLimitedError,
+    SolverAiWaitTimeoutError,
 )
 from .SolverAiClientSetup import SolverAiClientSetup
 from .SolverAiComputeInput import SolverAiComputeInput
-from .SolverAiComputeResults import SolverAiComputeResults
+from .SolverAiComputeResults import (
+    SolverAiComputeResults,
+    SolverAiComputeResultsBuilder,
+)
+from .SolverAiDeadline import SolverAiTimeouts
+from .SolverAiDrainCoordinator import SolverAiDrainCoordinator
+from .SolverAiHedging import SolverAiHedgingPolicy, SolverAiHedgingStats
+from .SolverAiInputsOutputsCache import SolverAiInputsOutputsCache
+from .SolverAiInstrumentation import (
+    SolverAiCallTiming,
+    SolverAiHistogram,
+    SolverAiInstrumentation,
+)
+from .SolverAiJsonCodec import (
+    SolverAiJsonCodec,
+    available_json_codecs,
+    get_json_codec,
+    set_json_codec,
+)
+from .SolverAiMultiProblemClientCompute import (
+    SolverAiMultiProblemClientCompute,
+)
+from .SolverAiPareto import SolverAiParetoAnalysis
+from .SolverAiPollingStrategy import (
+    SolverAiBackoffPolling,
+    SolverAiFixedPolling,
+    SolverAiPollingStrategy,
+    SolverAiSetupWaitStrategy,
+)
+from .SolverAiRateLimiter import (
+    SolverAiRateLimiter,
+    get_rate_limiter,
+    set_rate_limiter,
+)
+from .SolverAiResultCache import SolverAiResultCache
+from .SolverAiResultsParser import SolverAiResultsParserPool
 from .SolverAiResultsWriter import SolverAiResultsWriter
+from .SolverAiSingleFlight import (
+    SolverAiSingleFlight,
+    SolverAiSingleFlightStats,
+)
+from .SolverAiSweep import (
+    SolverAiSweep,
+    SolverAiSweepParameter,
+    SolverAiSweepResults,
+)
+from .SolverAiTransport import SolverAiTransferStats, SolverAiTransport
 
 __all__ = [
     "get_setup_data",
     "validate_token",
     "IdsDataManager",
     "SolverAiClientCompute",
+    "SolverAiAsyncClientCompute",
+    "SolverAiMultiProblemClientCompute",
     "SolverAiProblemStatusInfo",
     "SetupInExecutionException",
     "SolverAiDrainingException",
+    "SolverAiWaitTimeoutError",
+    "SolverAiRateLimitedError",
+    "SolverAiCircuitOpenError",
+    "SolverAiDeadlineExceededError",
     "SolverAiClientSetup",
     "SolverAiComputeInput",
     "SolverAiComputeResults",
+    "SolverAiComputeResultsBuilder",
+    "SolverAiPollingStrategy",
+    "SolverAiFixedPolling",
+    "SolverAiBackoffPolling",
+    "SolverAiSetupWaitStrategy",
+    "SolverAiResultCache",
+    "SolverAiInputsOutputsCache",
     "SolverAiResultsWriter",
+    "SolverAiTransport",
+    "SolverAiTransferStats",
+    "SolverAiJsonCodec",
+    "available_json_codecs",
+    "get_json_codec",
+    "set_json_codec",
+    "SolverAiInstrumentation",
+    "SolverAiCallTiming",
+    "SolverAiHistogram",
+    "SolverAiDrainCoordinator",
+    "SolverAiRateLimiter",
+    "get_rate_limiter",
+    "set_rate_limiter",
+    "SolverAiCircuitBreaker",
+    "get_circuit_breaker",
+    "set_circuit_breaker",
+    "SolverAiHedgingPolicy",
+    "SolverAiHedgingStats",
+    "SolverAiTimeouts",
+    "SolverAiSweep",
+    "SolverAiSweepParameter",
+    "SolverAiSweepResults",
+    "SolverAiSingleFlight",
+    "SolverAiSingleFlightStats",
+    "SolverAiResultsParserPool",
+    "SolverAiParetoAnalysis",
 ]
@@ -12,9 +12,17 @@ PACKAGE_ROOT = Path(__file__).resolve().parents[1] / "solverai"
 
 
 class FakeDataFrame:
-    def __init__(self, data=None, columns=None):
-        self.data = list(data or [])
+    def __init__(self, data=None, columns=None, copy=None):
+        if isinstance(data, dict):
+            columns = list(columns or data)
+            data = zip(*(data[column] for column in columns))
+        elif hasattr(data, "tolist"):
+            data = data.tolist()
+        self.data = [
+            list(row) if isinstance(row, tuple) else row for row in (data or [])
+        ]
         self.columns = list(columns or [])
+        self.copy = copy
 
     def to_csv(self, buffer, index=False):
         if self.columns:
@@ -36,10 +44,82 @@ class FakeResponse:
         self.headers = dict(headers or {})
 
 
+class FakeHTTPAdapter:
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
+
+class FakeSession:
+    """Routes session calls to the module-level ``requests`` mocks."""
+
+    def __init__(self, requests_module):
+        self.requests_module = requests_module
+        self.adapters = {}
+        self.closed = False
+
+    def mount(self, prefix, adapter):
+        self.adapters[prefix] = adapter
+
+    def request(self, method, url, **kwargs):
+        return getattr(self.requests_module, method.lower())(url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRawStream:
+    def __init__(self, body, chunk_size):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.decode_content_flags = []
+
+    def stream(self, amt=65536, decode_content=None):
+        self.decode_content_flags.append(decode_content)
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+
+class FakeStreamedResponse:
+    """Response whose body is only reachable through ``raw.stream``."""
+
+    def __init__(self, status_code, body, headers=None, chunk_size=7):
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        self.raw = FakeRawStream(body, chunk_size)
+        self.closed = False
+
+    @property
+    def text(self):
+        raise AssertionError("streamed responses must be read through raw")
+
+    def close(self):
+        self.closed = True
+
+
 def json_response(status_code, payload, headers=None):
     return FakeResponse(status_code, json.dumps(payload), headers=headers)
 
 
+def build_solver_results_payload():
+    return {
+        "Number Of Results": 1,
+        "Objective Variable Names": "['objective']",
+        "Constraint Variable Names": "['constraint']",
+        "Input Variable Names": "['x']",
+        "Output Variable Names": "['y']",
+        "X0": "[1.0]",
+        "Y0": "[2.0]",
+    }
+
+
 def write_temp_text_file(directory, name, content):
     path = Path(directory) / name
     path.write_text(content, encoding="utf-8")
@@ -64,7 +144,7 @@ def _load_module(module_name, file_path, is_package=False):
 @contextlib.contextmanager
 def solverai_test_environment():
     saved_modules = {}
-    names_to_restore = {"requests", "pandas"}
+    names_to_restore = {"requests", "requests.adapters", "pandas"}
     names_to_restore.update(
         name for name in sys.modules
         if name == "solverai" or name.startswith("solverai.")
@@ -82,11 +162,19 @@ def solverai_test_environment():
     requests_module.post = Mock(name="requests.post")
     requests_module.patch = Mock(name="requests.patch")
     requests_module.delete = Mock(name="requests.delete")
+    requests_module.Session = Mock(
+        name="requests.Session",
+        side_effect=lambda: FakeSession(requests_module),
+    )
+    adapters_module = types.ModuleType("requests.adapters")
+    adapters_module.HTTPAdapter = FakeHTTPAdapter
+    requests_module.adapters = adapters_module
 
     pandas_module = types.ModuleType("pandas")
     pandas_module.DataFrame = FakeDataFrame
 
     sys.modules["requests"] = requests_module
+    sys.modules["requests.adapters"] = adapters_module
     sys.modules["pandas"] = pandas_module
 
     try:
@@ -106,6 +194,7 @@ def solverai_test_environment():
             if name == "solverai" or name.startswith("solverai."):
                 del sys.modules[name]
         sys.modules.pop("requests", None)
+        sys.modules.pop("requests.adapters", None)
         sys.modules.pop("pandas", None)
         for name, module in saved_modules.items():
             sys.modules[name] = module
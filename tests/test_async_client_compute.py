@@ -0,0 +1,211 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, call
+
+from _solverai_test_support import (
+    FakeResponse,
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiAsyncClientComputeTests(unittest.TestCase):
+
+    def build_client(self, env, **kwargs):
+        module = env.module("SolverAiAsyncClientCompute")
+        return module, module.SolverAiAsyncClientCompute(
+            "http://computer:8001",
+            "token",
+            "problem-1",
+            **kwargs,
+        )
+
+    def run_with_mock_sleep(self, module, coroutine_factory):
+        original_sleep = module.sleep
+        mock_sleep = AsyncMock()
+        module.sleep = mock_sleep
+        try:
+            return asyncio.run(coroutine_factory()), mock_sleep
+        finally:
+            module.sleep = original_sleep
+
+    def test_get_problem_status_info_returns_ready_state(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(200, "ready")
+            _, client = self.build_client(env)
+
+            status_info = asyncio.run(
+                client.getProblemStatusInfo(require_not_updating=True)
+            )
+
+            self.assertTrue(status_info.is_ready)
+            self.assertTrue(status_info.require_not_updating)
+            env.requests.get.assert_called_once_with(
+                "http://computer:8001/check_problem_status/problem-1",
+                headers={
+                    "Authorization": "Token token",
+                    "Content-Type": "application/json",
+                },
+                params={"require_not_updating": "true"},
+                timeout=(10.0, 60.0),
+            )
+
+    def test_wait_for_problem_ready_polls_through_updating(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(202, "setup in execution"),
+                json_response(202, "updating"),
+                json_response(200, "ready"),
+            ]
+            module, client = self.build_client(env)
+
+            status_info, mock_sleep = self.run_with_mock_sleep(
+                module,
+                lambda: client.waitForProblemReady(
+                    require_not_updating=True,
+                    poll_interval_seconds=2.5,
+                ),
+            )
+
+            self.assertEqual(status_info.state, "READY")
+            self.assertEqual(mock_sleep.await_args_list, [call(2.5), call(2.5)])
+
+    def test_wait_for_problem_ready_raises_on_terminal_error(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(400, "ERROR: setup failed")
+            module, client = self.build_client(env)
+
+            with self.assertRaises(RuntimeError):
+                self.run_with_mock_sleep(module, client.waitForProblemReady)
+
+    def test_wait_for_problem_ready_raises_timeout_error(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(202, "setup in execution")
+            module, client = self.build_client(env)
+            original_monotonic = module.monotonic
+            module.monotonic = Mock(side_effect=[0.0, 0.0, 0.75])
+
+            try:
+                with self.assertRaises(TimeoutError):
+                    self.run_with_mock_sleep(
+                        module,
+                        lambda: client.waitForProblemReady(max_wait_seconds=0.75),
+                    )
+            finally:
+                module.monotonic = original_monotonic
+
+            self.assertEqual(env.requests.get.call_count, 1)
+
+    def test_get_inputs_outputs_retries_after_draining_response(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(503, {"detail": "Draining"}, headers={"Retry-After": "30"}),
+                json_response(200, {"inputs": ["x"], "outputs": ["y"]}),
+            ]
+            module, client = self.build_client(env)
+
+            (inputs, outputs), mock_sleep = self.run_with_mock_sleep(
+                module,
+                client.getInputsOutputs,
+            )
+
+            self.assertEqual((inputs, outputs), (["x"], ["y"]))
+            mock_sleep.assert_awaited_once_with(30.0)
+
+    def test_run_solver_preserves_mixed_503_then_202_then_200_flow(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.side_effect = [
+                json_response(503, {"detail": "Draining"}, headers={"Retry-After": "60"}),
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            module, client = self.build_client(env)
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+
+            results, mock_sleep = self.run_with_mock_sleep(
+                module,
+                lambda: client.runSolver(compute_input),
+            )
+
+            self.assertEqual(results.getNumberOfResults(), 1)
+            self.assertEqual(mock_sleep.await_args_list, [call(60.0), call(5)])
+
+    def test_run_solver_can_poll_status_before_resubmitting(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.post.side_effect = [
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            env.requests.get.side_effect = [
+                json_response(202, "setup in execution"),
+                json_response(200, "ready"),
+            ]
+            module, client = self.build_client(env)
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+
+            results, mock_sleep = self.run_with_mock_sleep(
+                module,
+                lambda: client.runSolver(
+                    compute_input,
+                    setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                        polling_strategy=polling_module.SolverAiFixedPolling(0.25),
+                        poll_status=True,
+                    ),
+                ),
+            )
+
+            self.assertEqual(results.getNumberOfResults(), 1)
+            self.assertEqual(env.requests.post.call_count, 2)
+            mock_sleep.assert_awaited_once_with(0.25)
+
+    def test_run_solver_raises_draining_exception_when_fail_fast(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            exceptions_module = env.module("SolverAiClientExceptions")
+            env.requests.post.return_value = json_response(
+                503,
+                {"detail": "Draining"},
+                headers={"Retry-After": "60"},
+            )
+            module, client = self.build_client(env, drain_max_retries=0)
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+
+            with self.assertRaises(exceptions_module.SolverAiDrainingException):
+                self.run_with_mock_sleep(
+                    module,
+                    lambda: client.runSolver(compute_input),
+                )
+
+            self.assertEqual(env.requests.post.call_count, 1)
+
+    def test_many_concurrent_solves_share_a_bounded_executor(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.side_effect = lambda *args, **kwargs: json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            module, client = self.build_client(env, max_workers=2)
+
+            async def run_many():
+                async with client:
+                    return await asyncio.gather(*[
+                        client.runSolver(
+                            input_module.SolverAiComputeInput("problem-1")
+                        )
+                        for _ in range(50)
+                    ])
+
+            results = asyncio.run(run_many())
+
+            self.assertEqual(len(results), 50)
+            self.assertEqual(env.requests.post.call_count, 50)
+            env.requests.Session.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,264 @@
+import asyncio
+import threading
+import unittest
+
+from _solverai_test_support import json_response, solverai_test_environment
+
+
+class SolverAiCircuitBreakerTests(unittest.TestCase):
+
+    def build_client(self, env, **kwargs):
+        compute_module = env.module("SolverAiClientCompute")
+        module = env.module("SolverAiCircuitBreaker")
+        clock = [1000.0]
+        module.monotonic = lambda: clock[0]
+        breaker = module.SolverAiCircuitBreaker(**kwargs)
+        client = compute_module.SolverAiClientCompute(
+            "http://computer:8001",
+            "token",
+            "problem-1",
+            circuit_breaker=breaker,
+        )
+        return client, breaker, clock
+
+    def test_opens_after_threshold_failures_and_rejects_locally(self):
+        with solverai_test_environment() as env:
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.get.return_value = json_response(500, {"detail": "boom"})
+            client, breaker, _ = self.build_client(
+                env,
+                failure_threshold=3,
+                recovery_seconds=30,
+            )
+
+            for _ in range(3):
+                with self.assertRaises(Exception):
+                    client.getProblemStatusInfo()
+            with self.assertRaises(exceptions.SolverAiCircuitOpenError) as ctx:
+                client.getProblemStatusInfo()
+
+            self.assertEqual(env.requests.get.call_count, 3)
+            self.assertEqual(breaker.state, "open")
+            self.assertEqual(ctx.exception.retry_after_seconds, 30)
+            self.assertEqual(breaker.getStats()["rejected"], 1)
+
+    def test_failures_outside_the_window_do_not_accumulate(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(502, {"detail": "bad gateway"})
+            client, breaker, clock = self.build_client(
+                env,
+                failure_threshold=2,
+                window_seconds=10,
+            )
+
+            with self.assertRaises(Exception):
+                client.getProblemStatusInfo()
+            clock[0] += 11
+            with self.assertRaises(Exception):
+                client.getProblemStatusInfo()
+
+            self.assertEqual(breaker.state, "closed")
+
+    def test_controlled_drain_and_client_errors_are_not_failures(self):
+        with solverai_test_environment() as env:
+            compute_module = env.module("SolverAiClientCompute")
+            env.requests.get.side_effect = [
+                json_response(503, {"detail": "Draining"}, headers={"Retry-After": "0"}),
+                json_response(400, {"detail": "bad request"}),
+            ]
+            client, breaker, _ = self.build_client(env, failure_threshold=1)
+            compute_module.sleep = lambda seconds: None
+
+            with self.assertRaises(Exception):
+                client.getInputsOutputs()
+
+            self.assertEqual(env.requests.get.call_count, 2)
+            self.assertEqual(breaker.state, "closed")
+
+    def test_half_open_probe_closes_the_circuit_on_success(self):
+        with solverai_test_environment() as env:
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.get.side_effect = [
+                ConnectionError("refused"),
+                json_response(200, "ready"),
+                json_response(200, "ready"),
+            ]
+            client, breaker, clock = self.build_client(
+                env,
+                failure_threshold=1,
+                recovery_seconds=5,
+            )
+
+            with self.assertRaises(ConnectionError):
+                client.getProblemStatusInfo()
+            self.assertEqual(breaker.state, "open")
+
+            clock[0] += 5
+            self.assertEqual(breaker.state, "half_open")
+            probe = breaker.before()
+            with self.assertRaises(exceptions.SolverAiCircuitOpenError) as ctx:
+                client.getProblemStatusInfo()
+            self.assertIsNone(ctx.exception.retry_after_seconds)
+            breaker.recordSuccess(probe)
+
+            self.assertEqual(breaker.state, "closed")
+            self.assertTrue(client.getProblemStatusInfo().is_ready)
+
+    def test_failed_probe_reopens_the_circuit(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(500, {"detail": "boom"})
+            client, breaker, clock = self.build_client(
+                env,
+                failure_threshold=1,
+                recovery_seconds=5,
+            )
+
+            with self.assertRaises(Exception):
+                client.getProblemStatusInfo()
+            clock[0] += 5
+            with self.assertRaises(Exception):
+                client.getProblemStatusInfo()
+
+            self.assertEqual(breaker.state, "open")
+            self.assertEqual(breaker.getStats()["times_opened"], 2)
+            self.assertEqual(env.requests.get.call_count, 2)
+
+    def test_solve_failures_trip_the_process_wide_breaker(self):
+        with solverai_test_environment() as env:
+            compute_module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiCircuitBreaker")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.post.return_value = json_response(500, {"detail": "boom"})
+            env.package.set_circuit_breaker(
+                module.SolverAiCircuitBreaker(failure_threshold=2)
+            )
+            clients = [
+                compute_module.SolverAiClientCompute(
+                    "http://computer:8001", "token", f"problem-{index}",
+                )
+                for index in range(3)
+            ]
+
+            for index, client in enumerate(clients[:2]):
+                with self.assertRaises(Exception):
+                    client.runSolver(
+                        input_module.SolverAiComputeInput(f"problem-{index}")
+                    )
+            with self.assertRaises(exceptions.SolverAiCircuitOpenError):
+                clients[2].runSolver(input_module.SolverAiComputeInput("problem-2"))
+
+            self.assertEqual(env.requests.post.call_count, 2)
+
+    def test_async_client_rejects_locally_while_open(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            module = env.module("SolverAiCircuitBreaker")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.get.return_value = json_response(500, {"detail": "boom"})
+            client = async_module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                circuit_breaker=module.SolverAiCircuitBreaker(failure_threshold=1),
+            )
+
+            async def run():
+                async with client:
+                    with self.assertRaises(Exception):
+                        await client.getProblemStatusInfo()
+                    with self.assertRaises(exceptions.SolverAiCircuitOpenError):
+                        await client.getProblemStatusInfo()
+
+            asyncio.run(run())
+            self.assertEqual(env.requests.get.call_count, 1)
+
+    def test_cancelled_async_probe_releases_the_half_open_circuit(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            module = env.module("SolverAiCircuitBreaker")
+            clock = [1000.0]
+            module.monotonic = lambda: clock[0]
+            release = threading.Event()
+            responses = [json_response(500, {"detail": "boom"})]
+
+            def get(url, **kwargs):
+                if responses:
+                    return responses.pop()
+                release.wait(5)
+                return json_response(200, "ready")
+
+            env.requests.get.side_effect = get
+            breaker = module.SolverAiCircuitBreaker(
+                failure_threshold=1,
+                recovery_seconds=5,
+            )
+            client = async_module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                circuit_breaker=breaker,
+            )
+
+            async def run():
+                async with client:
+                    with self.assertRaises(Exception):
+                        await client.getProblemStatusInfo()
+                    clock[0] += 5
+                    with self.assertRaises(asyncio.TimeoutError):
+                        await asyncio.wait_for(client.getProblemStatusInfo(), 0.05)
+                    self.assertEqual(breaker.state, "half_open")
+                    release.set()
+                    self.assertTrue((await client.getProblemStatusInfo()).is_ready)
+
+            asyncio.run(run())
+            self.assertEqual(breaker.state, "closed")
+
+    def test_cancelled_async_calls_are_not_failures(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            module = env.module("SolverAiCircuitBreaker")
+            release = threading.Event()
+
+            def get(url, **kwargs):
+                release.wait(5)
+                return json_response(200, "ready")
+
+            env.requests.get.side_effect = get
+            breaker = module.SolverAiCircuitBreaker(failure_threshold=2)
+            client = async_module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                circuit_breaker=breaker,
+            )
+
+            async def run():
+                async with client:
+                    for _ in range(4):
+                        with self.assertRaises(asyncio.TimeoutError):
+                            await asyncio.wait_for(client.getProblemStatusInfo(), 0.02)
+                    self.assertEqual(breaker.state, "closed")
+                    release.set()
+                    self.assertTrue((await client.getProblemStatusInfo()).is_ready)
+
+            asyncio.run(run())
+            self.assertEqual(breaker.getStats()["recent_failures"], 0)
+
+    def test_problem_status_is_rejected_while_open(self):
+        with solverai_test_environment() as env:
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.get.return_value = json_response(500, {"detail": "boom"})
+            client, breaker, _ = self.build_client(env, failure_threshold=1)
+
+            with self.assertRaises(Exception):
+                client.getProblemStatus()
+            with self.assertRaises(exceptions.SolverAiCircuitOpenError):
+                client.getProblemStatus()
+
+            self.assertEqual(env.requests.get.call_count, 1)
+            self.assertEqual(breaker.state, "open")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,17 @@
+import json
 import tempfile
+import threading
 import unittest
 from datetime import datetime, timezone
 from unittest.mock import Mock, call
 
-from _solverai_test_support import FakeResponse, json_response, solverai_test_environment
-
-
-def build_solver_results_payload():
-    return {
-        "Number Of Results": 1,
-        "Objective Variable Names": "['objective']",
-        "Constraint Variable Names": "['constraint']",
-        "Input Variable Names": "['x']",
-        "Output Variable Names": "['y']",
-        "X0": "[1.0]",
-        "Y0": "[2.0]",
-    }
+from _solverai_test_support import (
+    FakeResponse,
+    FakeStreamedResponse,
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
 
 
 class SolverAiClientComputeTests(unittest.TestCase):
@@ -123,6 +119,7 @@ class SolverAiClientComputeTests(unittest.TestCase):
                     "Content-Type": "application/json",
                 },
                 params={"require_not_updating": "true"},
+                timeout=(10.0, 60.0),
             )
 
     def test_get_problem_status_info_raises_on_malformed_json(self):
@@ -244,6 +241,7 @@ class SolverAiClientComputeTests(unittest.TestCase):
                             "Content-Type": "application/json",
                         },
                         params={"require_not_updating": "true"},
+                        timeout=(10.0, 60.0),
                     ),
                     call(
                         "http://computer:8001/check_problem_status/problem-1",
@@ -252,6 +250,7 @@ class SolverAiClientComputeTests(unittest.TestCase):
                             "Content-Type": "application/json",
                         },
                         params={"require_not_updating": "true"},
+                        timeout=(10.0, 60.0),
                     ),
                     call(
                         "http://computer:8001/check_problem_status/problem-1",
@@ -260,6 +259,7 @@ class SolverAiClientComputeTests(unittest.TestCase):
                             "Content-Type": "application/json",
                         },
                         params={"require_not_updating": "true"},
+                        timeout=(10.0, 60.0),
                     ),
                 ],
             )
@@ -371,6 +371,97 @@ class SolverAiClientComputeTests(unittest.TestCase):
             mock_sleep.assert_called_once_with(0.75)
             self.assertEqual(env.requests.get.call_count, 1)
 
+    def test_wait_for_problem_ready_reports_polls_and_time_waited(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.get.side_effect = [
+                json_response(202, "setup in execution"),
+                json_response(202, "setup in execution"),
+                json_response(202, "setup in execution"),
+                json_response(200, "ready"),
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            original_sleep = module.sleep
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+
+            try:
+                status_info = client.waitForProblemReady(
+                    polling_strategy=polling_module.SolverAiBackoffPolling(
+                        min_interval_seconds=0.5,
+                        jitter=0.0,
+                        fast_polls=1,
+                        fast_interval_seconds=0.1,
+                    ),
+                )
+            finally:
+                module.sleep = original_sleep
+
+            self.assertEqual(
+                mock_sleep.call_args_list,
+                [call(0.1), call(0.5), call(1.0)],
+            )
+            self.assertEqual(status_info.poll_count, 4)
+            self.assertAlmostEqual(status_info.waited_seconds, 1.6)
+
+    def test_wait_for_problem_ready_uses_client_default_polling_strategy(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.get.side_effect = [
+                json_response(202, "setup in execution"),
+                json_response(200, "ready"),
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                polling_strategy=polling_module.SolverAiFixedPolling(0.2),
+            )
+            original_sleep = module.sleep
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+
+            try:
+                client.waitForProblemReady(poll_interval_seconds=9.0)
+            finally:
+                module.sleep = original_sleep
+
+            mock_sleep.assert_called_once_with(0.2)
+
+    def test_wait_for_problem_ready_timeout_reports_polls_and_time_waited(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            exceptions_module = env.module("SolverAiClientExceptions")
+            env.requests.get.return_value = json_response(202, "setup in execution")
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            original_sleep = module.sleep
+            original_monotonic = module.monotonic
+            module.sleep = Mock()
+            module.monotonic = Mock(side_effect=[0.0, 0.0, 1.0, 2.0, 2.6])
+
+            try:
+                with self.assertRaises(
+                    exceptions_module.SolverAiWaitTimeoutError
+                ) as ctx:
+                    client.waitForProblemReady(max_wait_seconds=2.5)
+            finally:
+                module.sleep = original_sleep
+                module.monotonic = original_monotonic
+
+            self.assertIsInstance(ctx.exception, TimeoutError)
+            self.assertEqual(ctx.exception.poll_count, 2)
+            self.assertAlmostEqual(ctx.exception.waited_seconds, 1.5)
+
     def test_get_problem_status_returns_inputs_and_outputs(self):
         with solverai_test_environment() as env:
             module = env.module("SolverAiClientCompute")
@@ -394,6 +485,7 @@ class SolverAiClientComputeTests(unittest.TestCase):
                     "Authorization": "Token token",
                     "Content-Type": "application/json",
                 },
+                timeout=(10.0, 60.0),
             )
 
     def test_get_problem_status_raises_on_malformed_json(self):
@@ -471,6 +563,7 @@ class SolverAiClientComputeTests(unittest.TestCase):
                     "Authorization": "Token token",
                     "Content-Type": "application/json",
                 },
+                timeout=(10.0, 60.0),
             )
 
     def test_get_problem_setup_returns_inputs_and_outputs(self):
@@ -751,6 +844,159 @@ class SolverAiClientComputeTests(unittest.TestCase):
             self.assertEqual(results.getNumberOfResults(), 1)
             mock_sleep.assert_called_once_with(5)
 
+    def test_run_solver_serializes_payload_once_across_setup_retries(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.post.side_effect = [
+                FakeResponse(202, "{}"),
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+            compute_input.getJsonBytes = Mock(wraps=compute_input.getJsonBytes)
+            original_sleep = module.sleep
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+
+            try:
+                client.runSolver(
+                    compute_input,
+                    setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                        polling_strategy=polling_module.SolverAiBackoffPolling(
+                            min_interval_seconds=0.5,
+                            jitter=0.0,
+                            fast_polls=1,
+                            fast_interval_seconds=0.1,
+                        ),
+                    ),
+                )
+            finally:
+                module.sleep = original_sleep
+
+            compute_input.getJsonBytes.assert_called_once_with()
+            self.assertEqual(mock_sleep.call_args_list, [call(0.1), call(0.5)])
+            payloads = [
+                kwargs["data"] for _, kwargs in env.requests.post.call_args_list
+            ]
+            self.assertEqual(len(set(payloads)), 1)
+
+    def test_run_solver_can_poll_status_before_resubmitting(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.post.side_effect = [
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            env.requests.get.side_effect = [
+                json_response(202, "setup in execution"),
+                json_response(202, "updating"),
+                json_response(200, "ready"),
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                    polling_strategy=polling_module.SolverAiFixedPolling(0.25),
+                    poll_status=True,
+                    require_not_updating=True,
+                ),
+            )
+            original_sleep = module.sleep
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+
+            try:
+                results = client.runSolver(
+                    input_module.SolverAiComputeInput("problem-1")
+                )
+            finally:
+                module.sleep = original_sleep
+
+            self.assertEqual(results.getNumberOfResults(), 1)
+            self.assertEqual(env.requests.post.call_count, 2)
+            self.assertEqual(env.requests.get.call_count, 3)
+            self.assertEqual(mock_sleep.call_args_list, [call(0.25), call(0.25)])
+
+    def test_run_solver_status_polling_backs_off_when_already_ready(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.post.side_effect = [
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            env.requests.get.return_value = json_response(200, "ready")
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            original_sleep = module.sleep
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+
+            try:
+                client.runSolver(
+                    input_module.SolverAiComputeInput("problem-1"),
+                    setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                        polling_strategy=polling_module.SolverAiFixedPolling(0.5),
+                        poll_status=True,
+                    ),
+                )
+            finally:
+                module.sleep = original_sleep
+
+            mock_sleep.assert_called_once_with(0.5)
+            self.assertEqual(env.requests.get.call_count, 1)
+
+    def test_run_solver_setup_wait_deadline_raises_timeout(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            exceptions_module = env.module("SolverAiClientExceptions")
+            env.requests.post.return_value = FakeResponse(202, "{}")
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            original_sleep = module.sleep
+            original_monotonic = module.monotonic
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+            module.monotonic = Mock(side_effect=[0.0, 0.0, 5.0, 8.0])
+
+            try:
+                with self.assertRaises(
+                    exceptions_module.SolverAiWaitTimeoutError
+                ) as ctx:
+                    client.runSolver(
+                        input_module.SolverAiComputeInput("problem-1"),
+                        setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                            max_wait_seconds=8.0,
+                        ),
+                    )
+            finally:
+                module.sleep = original_sleep
+                module.monotonic = original_monotonic
+
+            self.assertEqual(mock_sleep.call_args_list, [call(5), call(3.0)])
+            self.assertEqual(env.requests.post.call_count, 3)
+            self.assertEqual(ctx.exception.poll_count, 3)
+            self.assertEqual(ctx.exception.waited_seconds, 8.0)
+
     def test_run_solver_retries_after_draining_response_with_retry_after(self):
         with solverai_test_environment() as env:
             module = env.module("SolverAiClientCompute")
@@ -1288,6 +1534,386 @@ class SolverAiClientComputeTests(unittest.TestCase):
                 [call(60.0), call(5)],
             )
 
+    def test_run_solver_batch_returns_results_in_input_order(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+
+            def respond(url, headers, data, **kwargs):
+                index = json.loads(data)["inputs"]["x"]["Min"]
+                payload = build_solver_results_payload()
+                payload["X0"] = f"[{index}]"
+                return json_response(200, {"results": payload})
+
+            env.requests.post.side_effect = respond
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            compute_inputs = []
+            for index in range(20):
+                compute_input = input_module.SolverAiComputeInput("problem-1")
+                compute_input.addInput("x", float(index), float(index) + 1)
+                compute_inputs.append(compute_input)
+
+            results = client.runSolverBatch(compute_inputs, max_concurrency=4)
+
+            self.assertEqual(
+                [result.getX()[0][0] for result in results],
+                [float(index) for index in range(20)],
+            )
+
+    def test_run_solver_batch_returns_per_item_exceptions(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.side_effect = [
+                json_response(200, {"results": build_solver_results_payload()}),
+                json_response(400, {"detail": "solver failed"}),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+
+            results = client.runSolverBatch(
+                [input_module.SolverAiComputeInput("problem-1") for _ in range(3)],
+                max_concurrency=1,
+            )
+
+            self.assertEqual(results[0].getNumberOfResults(), 1)
+            self.assertIsInstance(results[1], Exception)
+            self.assertIn("solver failed", str(results[1]))
+            self.assertEqual(results[2].getNumberOfResults(), 1)
+
+    def test_run_solver_batch_bounds_concurrency(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            lock = threading.Lock()
+            in_flight = [0]
+            peak = [0]
+
+            def respond(*args, **kwargs):
+                with lock:
+                    in_flight[0] += 1
+                    peak[0] = max(peak[0], in_flight[0])
+                threading.Event().wait(0.01)
+                with lock:
+                    in_flight[0] -= 1
+                return json_response(200, {"results": build_solver_results_payload()})
+
+            env.requests.post.side_effect = respond
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+
+            results = client.runSolverBatch(
+                [input_module.SolverAiComputeInput("problem-1") for _ in range(12)],
+                max_concurrency=3,
+            )
+
+            self.assertEqual(len(results), 12)
+            self.assertLessEqual(peak[0], 3)
+            self.assertEqual(client.runSolverBatch([]), [])
+            with self.assertRaises(ValueError):
+                client.runSolverBatch(
+                    [input_module.SolverAiComputeInput("problem-1")],
+                    max_concurrency=0,
+                )
+
+    def test_run_solver_batch_applies_setup_wait_strategy(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            env.requests.post.side_effect = [
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            original_sleep = module.sleep
+            mock_sleep = Mock()
+            module.sleep = mock_sleep
+
+            try:
+                results = client.runSolverBatch(
+                    [input_module.SolverAiComputeInput("problem-1")],
+                    setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                        polling_strategy=polling_module.SolverAiFixedPolling(0.2),
+                    ),
+                )
+            finally:
+                module.sleep = original_sleep
+
+            self.assertEqual(results[0].getNumberOfResults(), 1)
+            mock_sleep.assert_called_once_with(0.2)
+
+    def test_run_solver_batch_shares_one_drain_retry_across_items(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            barrier = threading.Barrier(4)
+            lock = threading.Lock()
+            calls = [0]
+
+            def respond(*args, **kwargs):
+                with lock:
+                    calls[0] += 1
+                    call_number = calls[0]
+                if call_number <= 4:
+                    barrier.wait(timeout=5)
+                    return json_response(
+                        503,
+                        {"detail": "Draining"},
+                        headers={"Retry-After": "0.2"},
+                    )
+                return json_response(200, {"results": build_solver_results_payload()})
+
+            env.requests.post.side_effect = respond
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                drain_max_retries=1,
+            )
+
+            results = client.runSolverBatch(
+                [input_module.SolverAiComputeInput("problem-1") for _ in range(4)],
+                max_concurrency=4,
+            )
+
+            self.assertTrue(
+                all(result.getNumberOfResults() == 1 for result in results),
+                results,
+            )
+            self.assertEqual(env.requests.post.call_count, 8)
+
+    def test_run_solver_serves_identical_inputs_from_result_cache(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            cache_module = env.module("SolverAiResultCache")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                result_cache=cache_module.SolverAiResultCache(),
+            )
+
+            def build_input(upper):
+                compute_input = input_module.SolverAiComputeInput("problem-1")
+                compute_input.addInput("x", 0.0, upper)
+                return compute_input
+
+            first = client.runSolver(build_input(1.0))
+            second = client.runSolver(build_input(1.0))
+            client.runSolver(build_input(2.0))
+
+            self.assertEqual(env.requests.post.call_count, 2)
+            self.assertIsNot(first, second)
+            self.assertEqual(second.getX(), first.getX())
+            stats = client.getResultCacheStats()
+            self.assertEqual(stats.hits, 1)
+            self.assertEqual(stats.misses, 2)
+            self.assertEqual(stats.entries, 2)
+
+    def test_run_solver_parses_streamed_body_in_small_chunks(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            payload = build_solver_results_payload()
+            payload["Number Of Results"] = 3
+            for index in range(3):
+                payload[f"X{index}"] = f"[{index}.5]"
+                payload[f"Y{index}"] = f"[{index * 10}.25, -1e-05]"
+            body = json.dumps({"results": payload}).encode()
+            streamed = FakeStreamedResponse(200, body, chunk_size=5)
+            env.requests.post.return_value = streamed
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                stream_results=True,
+            )
+
+            results = client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+
+            self.assertEqual(results.getX(), [[0.5], [1.5], [2.5]])
+            self.assertEqual(
+                results.getY(),
+                [[0.25, -1e-05], [10.25, -1e-05], [20.25, -1e-05]],
+            )
+            self.assertTrue(streamed.closed)
+            self.assertEqual(client.getLastTransferStats().response_bytes, len(body))
+
+    def test_run_solver_can_read_whole_body_when_streaming_is_disabled(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.return_value = FakeStreamedResponse(
+                200,
+                json.dumps({"results": build_solver_results_payload()}).encode(),
+            )
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                stream_results=False,
+            )
+
+            results = client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+
+            self.assertEqual(results.getX(), [[1.0]])
+            self.assertEqual(results.getY(), [[2.0]])
+
+    def test_run_solver_reports_malformed_streamed_body(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.return_value = FakeStreamedResponse(
+                200,
+                b'{"results": {"Number Of Results": 1, "X0": "[1.0]"',
+            )
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                stream_results=True,
+            )
+
+            with self.assertRaisesRegex(Exception, "Failed retrieving data."):
+                client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+
+    def test_result_cache_is_invalidated_when_status_shows_update(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            cache_module = env.module("SolverAiResultCache")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            env.requests.get.return_value = json_response(202, "updating")
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                result_cache=cache_module.SolverAiResultCache(),
+            )
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+
+            client.runSolver(compute_input)
+            client.getProblemStatusInfo(require_not_updating=True)
+            client.runSolver(compute_input)
+
+            self.assertEqual(env.requests.post.call_count, 2)
+            self.assertEqual(client.getResultCacheStats().invalidations, 1)
+
+    def test_result_cache_is_not_shared_across_computers_or_tokens(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            cache_module = env.module("SolverAiResultCache")
+            cache = cache_module.SolverAiResultCache()
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+
+            for base_url, token in (
+                ("http://computer:8001", "token"),
+                ("http://other:8001", "token"),
+                ("http://computer:8001", "other-token"),
+                ("http://computer:8001", "token"),
+            ):
+                module.SolverAiClientCompute(
+                    base_url,
+                    token,
+                    "problem-1",
+                    result_cache=cache,
+                ).runSolver(compute_input)
+
+            self.assertEqual(env.requests.post.call_count, 3)
+            self.assertEqual(cache.getStats().hits, 1)
+
+    def test_result_cache_is_invalidated_when_problem_version_changes(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            cache_module = env.module("SolverAiResultCache")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            env.requests.get.side_effect = [
+                json_response(
+                    200,
+                    {"inputs": [], "outputs": []},
+                    headers={"ETag": f'"{version}"'},
+                )
+                for version in ("v1", "v1", "v2")
+            ]
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                result_cache=cache_module.SolverAiResultCache(),
+            )
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+
+            client.getInputsOutputs()
+            client.runSolver(compute_input)
+            client.getInputsOutputs()
+            client.runSolver(compute_input)
+            client.getInputsOutputs()
+            client.runSolver(compute_input)
+
+            self.assertEqual(env.requests.post.call_count, 2)
+            self.assertEqual(client.getResultCacheStats().invalidations, 1)
+
+    def test_result_cache_is_invalidated_on_setup_in_execution(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            cache_module = env.module("SolverAiResultCache")
+            cache = cache_module.SolverAiResultCache()
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                result_cache=cache,
+            )
+            cache.put("problem-1", "other-key", build_solver_results_payload())
+            env.requests.post.side_effect = [
+                FakeResponse(202, "{}"),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            original_sleep = module.sleep
+            module.sleep = Mock()
+
+            try:
+                client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+            finally:
+                module.sleep = original_sleep
+
+            self.assertIsNone(cache.get("problem-1", "other-key"))
+            self.assertEqual(cache.getStats().entries, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
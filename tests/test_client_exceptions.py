@@ -48,6 +48,52 @@ class ClientExceptionTests(unittest.TestCase):
             self.assertEqual(str(error), "custom draining message")
             self.assertEqual(error.retry_after_seconds, 15)
 
+    def test_wait_timeout_error_is_a_timeout_error_with_wait_stats(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientExceptions")
+
+            error = module.SolverAiWaitTimeoutError(poll_count=3, waited_seconds=1.5)
+
+            self.assertIsInstance(error, TimeoutError)
+            self.assertEqual(error.poll_count, 3)
+            self.assertEqual(error.waited_seconds, 1.5)
+            self.assertEqual(
+                str(error),
+                "Timed out waiting for the problem to become ready.",
+            )
+
+    def test_rate_limited_error_exposes_kind_and_retry_after(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientExceptions")
+
+            error = module.SolverAiRateLimitedError("solve", 0.25)
+
+            self.assertEqual(error.kind, "solve")
+            self.assertEqual(error.retry_after_seconds, 0.25)
+            self.assertEqual(
+                str(error),
+                "Rate limit for solve requests exceeded (retry after 0.250s)",
+            )
+
+    def test_circuit_open_error_exposes_retry_after(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientExceptions")
+
+            error = module.SolverAiCircuitOpenError()
+
+            self.assertIsNone(error.retry_after_seconds)
+            self.assertEqual(str(error), "Circuit breaker is open")
+
+    def test_deadline_exceeded_error_is_a_timeout_error(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientExceptions")
+
+            error = module.SolverAiDeadlineExceededError(2.5)
+
+            self.assertIsInstance(error, TimeoutError)
+            self.assertEqual(error.deadline_seconds, 2.5)
+            self.assertEqual(str(error), "Call deadline exceeded (2.500s)")
+
 
 if __name__ == "__main__":
     unittest.main()
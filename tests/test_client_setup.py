@@ -1,3 +1,4 @@
+import json
 import tempfile
 import unittest
 from unittest.mock import Mock
@@ -53,11 +54,13 @@ class SolverAiClientSetupTests(unittest.TestCase):
                 },
             )
             self.assertEqual(
-                kwargs["data"],
-                (
-                    '{"name": "eq", "equationString": "x+y", '
-                    '"variablesString": "x,y", "vectorizationIndices": "0"}'
-                ),
+                json.loads(kwargs["data"]),
+                {
+                    "name": "eq",
+                    "equationString": "x+y",
+                    "variablesString": "x,y",
+                    "vectorizationIndices": "0",
+                },
             )
 
     def test_patch_equation_includes_only_non_empty_fields(self):
@@ -69,7 +72,7 @@ class SolverAiClientSetupTests(unittest.TestCase):
             client.patchEquation("eq-1", name="updated")
 
             _, kwargs = env.requests.patch.call_args
-            self.assertEqual(kwargs["data"], '{"name": "updated"}')
+            self.assertEqual(json.loads(kwargs["data"]), {"name": "updated"})
 
     def test_post_code_uses_code_multipart_field(self):
         with solverai_test_environment() as env, tempfile.TemporaryDirectory() as tmp_dir:
@@ -102,7 +105,10 @@ class SolverAiClientSetupTests(unittest.TestCase):
                     "Content-Type": "application/json",
                 },
             )
-            self.assertEqual(kwargs["data"], '{"variablesStringOut": "y"}')
+            self.assertEqual(
+                json.loads(kwargs["data"]),
+                {"variablesStringOut": "y"},
+            )
 
     def test_post_hard_data_accepts_dataframe_input(self):
         with solverai_test_environment() as env:
@@ -135,7 +141,7 @@ class SolverAiClientSetupTests(unittest.TestCase):
                     "Content-Type": "application/json",
                 },
             )
-            self.assertEqual(kwargs["data"], '{"name": "renamed"}')
+            self.assertEqual(json.loads(kwargs["data"]), {"name": "renamed"})
 
     def test_patch_hard_data_accepts_dataframe_replacement(self):
         with solverai_test_environment() as env:
@@ -168,12 +174,15 @@ class SolverAiClientSetupTests(unittest.TestCase):
 
             _, kwargs = env.requests.post.call_args
             self.assertEqual(
-                kwargs["data"],
-                (
-                    '{"name": "problem", "equations": ["eq-1"], '
-                    '"codes": ["code-1"], "harddatas": ["hard-1"], '
-                    '"softdatas": ["soft-1"], "tags": []}'
-                ),
+                json.loads(kwargs["data"]),
+                {
+                    "name": "problem",
+                    "equations": ["eq-1"],
+                    "codes": ["code-1"],
+                    "harddatas": ["hard-1"],
+                    "softdatas": ["soft-1"],
+                    "tags": [],
+                },
             )
 
     def test_patch_soft_data_without_file_uses_metadata_only_patch(self):
@@ -192,7 +201,10 @@ class SolverAiClientSetupTests(unittest.TestCase):
                     "Content-Type": "application/json",
                 },
             )
-            self.assertEqual(kwargs["data"], '{"variablesStringOut": "y"}')
+            self.assertEqual(
+                json.loads(kwargs["data"]),
+                {"variablesStringOut": "y"},
+            )
 
     def test_patch_soft_data_accepts_dataframe_replacement(self):
         with solverai_test_environment() as env:
@@ -132,6 +132,36 @@ class SolverAiComputeInputTests(unittest.TestCase):
             )
             self.assertTrue(payload["isDebug"])
 
+    def test_get_fingerprint_ignores_insertion_order(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeInput")
+            first = module.SolverAiComputeInput("problem-1")
+            first.addInput("x", 1, 5)
+            first.addInput("y", 2, 3)
+            second = module.SolverAiComputeInput("problem-1")
+            second.addInput("y", 2, 3)
+            second.addInput("x", 1, 5)
+
+            self.assertEqual(first.getFingerprint(), second.getFingerprint())
+            self.assertEqual(len(first.getFingerprint()), 64)
+
+    def test_get_fingerprint_changes_with_payload(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeInput")
+            first = module.SolverAiComputeInput("problem-1")
+            first.addInput("x", 1, 5)
+            other_problem = module.SolverAiComputeInput("problem-2")
+            other_problem.addInput("x", 1, 5)
+            other_bounds = module.SolverAiComputeInput("problem-1")
+            other_bounds.addInput("x", 1, 6)
+
+            fingerprints = {
+                first.getFingerprint(),
+                other_problem.getFingerprint(),
+                other_bounds.getFingerprint(),
+            }
+            self.assertEqual(len(fingerprints), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -63,6 +63,208 @@ class SolverAiComputeResultsTests(unittest.TestCase):
             self.assertNotIn("y", results.getInputVariableNames()[:1])
             self.assertEqual(dataframe.columns.count("y"), 1)
 
+    def test_get_dataframe_returns_a_new_frame_on_every_call(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            results = module.SolverAiComputeResults(build_results_payload())
+
+            dataframe = results.getDataFrame()
+            dataframe.data[0][0] = 99.0
+            self.assertIsNot(results.getDataFrame(), dataframe)
+            self.assertEqual(results.getDataFrame().data[0][0], 1.0)
+
+            results.Y = [[30.0], [40.0]]
+            self.assertEqual(
+                results.getDataFrame().data,
+                [[1.0, 30.0], [3.0, 40.0]],
+            )
+
+    def test_get_dataframe_view_mode_matches_copy(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            results = module.SolverAiComputeResults(build_results_payload())
+
+            view = results.getDataFrame(copy=False)
+
+            self.assertEqual(view.columns, ["x", "y"])
+            self.assertEqual(view.data, results.getDataFrame().data)
+            self.assertIsNot(view, results.getDataFrame(copy=False))
+
+    def test_rows_are_decoded_on_first_access(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload()
+            payload["X1"] = "[3.0, "
+
+            results = module.SolverAiComputeResults(payload)
+
+            self.assertEqual(results.getNumberOfResults(), 2)
+            self.assertEqual(results.getInputVariableNames(), ["x", "y"])
+            self.assertEqual(results.getY(), [[10.0], [20.0]])
+            self.assertEqual(results.getXRow(0), [1.0, 2.0])
+            self.assertEqual(results.getXRows(0, 1), [[1.0, 2.0]])
+            with self.assertRaises(SyntaxError):
+                results.getX()
+
+    def test_row_access_matches_decoded_block(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            lazy = module.SolverAiComputeResults(build_results_payload())
+            decoded = module.SolverAiComputeResults(build_results_payload())
+            decoded.getX()
+            decoded.getY()
+
+            for results in (lazy, decoded):
+                with self.subTest(decoded=results is decoded):
+                    self.assertEqual(results.getXRow(-1), [3.0, 4.0])
+                    self.assertEqual(results.getYRows(1), [[20.0]])
+                    self.assertEqual(results.getXRows(), [[1.0, 2.0], [3.0, 4.0]])
+                    with self.assertRaises(IndexError):
+                        results.getYRow(2)
+
+    def test_decoded_block_is_kept_and_raw_rows_released(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            results = module.SolverAiComputeResults(build_results_payload())
+
+            X = results.getX()
+            X[0][0] = 9.0
+            X.append([5.0, 6.0])
+
+            self.assertIs(results.X, X)
+            self.assertEqual(results.getXRows(0, 1), [[9.0, 2.0]])
+            self.assertEqual(results.getXRow(-1), [5.0, 6.0])
+            texts = results._SolverAiComputeResults__texts
+            self.assertIsNone(texts["X"])
+            self.assertEqual(texts["Y"], ["[10.0]", "[20.0]"])
+
+            rows = [[5.0, 6.0]]
+            results.X = rows
+            self.assertIs(results.getX(), rows)
+            self.assertEqual(results.getXRow(0), [5.0, 6.0])
+
+    def test_numeric_blocks_are_packed_into_typed_storage(self):
+        with solverai_test_environment() as env:
+            if env.module("SolverAiNumericParser").np is None:
+                self.skipTest("numpy is not installed")
+            module = env.module("SolverAiComputeResults")
+            results = module.SolverAiComputeResults(build_results_payload())
+
+            results.compact()
+
+            self.assertFalse(hasattr(results, "__dict__"))
+            blocks = results._SolverAiComputeResults__blocks
+            for block in blocks.values():
+                self.assertNotIsInstance(block, list)
+            self.assertEqual(results.getXRows(1), [[3.0, 4.0]])
+            self.assertEqual(results.getY(), [[10.0], [20.0]])
+
+    def test_float32_results_round_values(self):
+        with solverai_test_environment() as env:
+            if env.module("SolverAiNumericParser").np is None:
+                self.skipTest("numpy is not installed")
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload()
+            payload["X0"] = "[0.1, 2.0]"
+            results = module.SolverAiComputeResults(payload, float32=True)
+
+            self.assertNotEqual(results.getXRow(0)[0], 0.1)
+            self.assertAlmostEqual(results.getXRow(0)[0], 0.1, places=6)
+
+            results = module.SolverAiComputeResults(payload).compact(float32=True)
+            self.assertAlmostEqual(results.getX()[0][0], 0.1, places=6)
+            self.assertEqual(results.getY(), [[10.0], [20.0]])
+
+    def test_non_numeric_rows_are_kept_as_lists(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload()
+            payload["X1"] = "[None, 4.0]"
+            payload["Y0"] = "[10.0, 11.0]"
+            results = module.SolverAiComputeResults(payload).compact()
+
+            self.assertEqual(results.getX(), [[1.0, 2.0], [None, 4.0]])
+            self.assertEqual(results.getY(), [[10.0, 11.0], [20.0]])
+
+    def test_integer_values_read_back_unchanged(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload()
+            payload["X0"] = "[1, 2.0]"
+            results = module.SolverAiComputeResults(payload).compact()
+
+            self.assertEqual(results.getXRow(0), [1, 2.0])
+            self.assertIsInstance(results.getX()[0][0], int)
+            self.assertEqual(results.getDataFrame().data, [[1, 10.0], [3.0, 20.0]])
+            self.assertIsInstance(results.getDataFrame().data[0][0], int)
+
+    def test_integer_columns_are_packed_and_read_back_as_integers(self):
+        with solverai_test_environment() as env:
+            np = env.module("SolverAiNumericParser").np
+            if np is None:
+                self.skipTest("numpy is not installed")
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload()
+            payload["X0"] = "[1, 2.0]"
+            payload["X1"] = "[3, 4.0]"
+
+            for results in (
+                module.SolverAiComputeResults(payload).compact(float32=True),
+                module.SolverAiComputeResults(payload, float32=True),
+            ):
+                X = results.getXArray()
+                self.assertEqual(X.dtype.name, "float32")
+                self.assertEqual(results.getXRow(1), [3, 4.0])
+                self.assertIsInstance(results.getXRow(1)[0], int)
+                for copy in (True, False):
+                    frame = results.getDataFrame(copy=copy)
+                    self.assertEqual(frame.data, [[1, 10.0], [3, 20.0]])
+                    self.assertIsInstance(frame.data[0][0], np.integer)
+                self.assertIs(results.getXArray(), X)
+                self.assertIsInstance(results.getX()[0][0], int)
+
+    def test_builder_matches_constructor_in_any_member_order(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload()
+            expected = module.SolverAiComputeResults(payload)
+            builder = module.SolverAiComputeResultsBuilder()
+
+            for key in reversed(list(payload)):
+                builder.add(key, payload[key])
+            results = builder.build()
+
+            self.assertEqual(results.getX(), expected.getX())
+            self.assertEqual(results.getY(), expected.getY())
+            self.assertEqual(
+                results.getInputVariableNames(),
+                expected.getInputVariableNames(),
+            )
+            self.assertIsNone(builder.raw)
+
+    def test_builder_keeps_raw_members_on_request(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            builder = module.SolverAiComputeResultsBuilder(keep_raw=True)
+
+            for key, value in build_results_payload().items():
+                builder.add(key, value)
+
+            self.assertEqual(builder.raw, build_results_payload())
+
+    def test_builder_raises_key_error_for_missing_rows(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            builder = module.SolverAiComputeResultsBuilder()
+            payload = build_results_payload()
+            del payload["Y1"]
+
+            for key, value in payload.items():
+                builder.add(key, value)
+
+            with self.assertRaises(KeyError):
+                builder.build()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,214 @@
+import asyncio
+import unittest
+
+from _solverai_test_support import (
+    FakeResponse,
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiDeadlineTests(unittest.TestCase):
+
+    def install_clock(self, env, module_name="SolverAiClientCompute"):
+        """Fake clock driving the deadline; the client's sleeps advance it."""
+        clock = [100.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        async def fake_async_sleep(seconds):
+            fake_sleep(seconds)
+
+        env.module("SolverAiDeadline").monotonic = lambda: clock[0]
+        module = env.module(module_name)
+        module.sleep = (
+            fake_async_sleep if module_name == "SolverAiAsyncClientCompute"
+            else fake_sleep
+        )
+        return clock, sleeps
+
+    def build_client(self, env, **kwargs):
+        module = env.module("SolverAiClientCompute")
+        return module.SolverAiClientCompute(
+            "http://computer:8001",
+            "token",
+            "problem-1",
+            **kwargs,
+        )
+
+    def test_timeouts_per_request_kind_are_lowered_to_the_deadline(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiDeadline")
+            timeouts = module.SolverAiTimeouts(
+                connect_seconds=3.0,
+                status_read_seconds=20.0,
+                solve_read_seconds=None,
+            )
+
+            self.assertEqual(timeouts.forRequest("status"), (3.0, 20.0))
+            self.assertEqual(timeouts.forRequest("solve"), (3.0, None))
+            self.assertEqual(timeouts.forRequest("solve", 2.0), (2.0, 2.0))
+            self.assertIsNone(
+                module.SolverAiTimeouts(None, None, None).forRequest("status")
+            )
+            with self.assertRaises(ValueError):
+                module.SolverAiTimeouts(connect_seconds=0)
+
+    def test_solves_have_no_read_timeout_by_default(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiDeadline")
+
+            self.assertEqual(module.SolverAiTimeouts().forRequest("solve"), (10.0, None))
+            self.assertEqual(module.SolverAiTimeouts().forRequest("status"), (10.0, 60.0))
+
+    def test_solve_request_uses_solve_timeouts(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            deadline_module = env.module("SolverAiDeadline")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            client = self.build_client(
+                env,
+                timeouts=deadline_module.SolverAiTimeouts(
+                    connect_seconds=2.0,
+                    solve_read_seconds=120.0,
+                ),
+            )
+
+            client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+
+            self.assertEqual(
+                env.requests.post.call_args.kwargs["timeout"],
+                (2.0, 120.0),
+            )
+
+    def test_drain_wait_beyond_the_deadline_fails_without_sleeping(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.post.return_value = json_response(
+                503,
+                {"detail": "Draining"},
+                headers={"Retry-After": "60"},
+            )
+            _, sleeps = self.install_clock(env)
+            client = self.build_client(env)
+
+            with self.assertRaises(exceptions.SolverAiDeadlineExceededError) as raised:
+                client.runSolver(
+                    input_module.SolverAiComputeInput("problem-1"),
+                    deadline_seconds=5.0,
+                )
+
+            self.assertEqual(raised.exception.deadline_seconds, 5.0)
+            self.assertIsInstance(
+                raised.exception.__context__,
+                exceptions.SolverAiDrainingException,
+            )
+            self.assertEqual(sleeps, [])
+            self.assertEqual(env.requests.post.call_count, 1)
+            self.assertEqual(
+                env.requests.post.call_args.kwargs["timeout"],
+                (5.0, 5.0),
+            )
+
+    def test_deadline_covers_setup_retries_and_status_polls(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            polling_module = env.module("SolverAiPollingStrategy")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.post.return_value = FakeResponse(202, "{}")
+            env.requests.get.return_value = json_response(202, "setup in execution")
+            clock, sleeps = self.install_clock(env)
+            client = self.build_client(env)
+
+            with self.assertRaises(exceptions.SolverAiDeadlineExceededError):
+                client.runSolver(
+                    input_module.SolverAiComputeInput("problem-1"),
+                    setup_wait_strategy=polling_module.SolverAiSetupWaitStrategy(
+                        polling_strategy=polling_module.SolverAiFixedPolling(1.0),
+                        poll_status=True,
+                    ),
+                    deadline_seconds=2.5,
+                )
+
+            self.assertEqual(sleeps, [1.0, 1.0])
+            self.assertEqual(env.requests.get.call_count, 3)
+            read_timeouts = [
+                request.kwargs["timeout"][1]
+                for request in env.requests.get.call_args_list
+            ]
+            self.assertEqual(read_timeouts, [2.5, 1.5, 0.5])
+            self.assertLess(clock[0], 102.5)
+
+    def test_nested_deadline_keeps_the_earlier_one(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiDeadline")
+            clock = [0.0]
+            module.monotonic = lambda: clock[0]
+
+            with module.deadline_scope(2.0):
+                with module.deadline_scope(10.0):
+                    self.assertEqual(module.check_deadline(), 2.0)
+                with module.deadline_scope(1.0):
+                    self.assertEqual(module.check_deadline(), 1.0)
+                self.assertEqual(module.check_deadline(), 2.0)
+            self.assertIsNone(module.check_deadline())
+
+    def test_request_failing_past_the_deadline_reports_the_deadline(self):
+        with solverai_test_environment() as env:
+            exceptions = env.module("SolverAiClientExceptions")
+            clock, _ = self.install_clock(env)
+
+            def stuck_read(url, **kwargs):
+                clock[0] += kwargs["timeout"][1]
+                raise OSError("read timed out")
+
+            env.requests.get.side_effect = stuck_read
+            client = self.build_client(env)
+
+            with self.assertRaises(exceptions.SolverAiDeadlineExceededError) as raised:
+                client.getInputsOutputs(deadline_seconds=3.0)
+
+            self.assertIsInstance(raised.exception.__cause__, OSError)
+            self.assertEqual(env.requests.get.call_count, 1)
+
+    def test_async_client_honors_the_deadline(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.get.return_value = json_response(202, "setup in execution")
+            _, sleeps = self.install_clock(env, "SolverAiAsyncClientCompute")
+            client = async_module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+
+            async def scenario():
+                try:
+                    await client.waitForProblemReady(
+                        poll_interval_seconds=2.0,
+                        deadline_seconds=5.0,
+                    )
+                finally:
+                    await client.close()
+
+            with self.assertRaises(exceptions.SolverAiDeadlineExceededError):
+                asyncio.run(scenario())
+
+            self.assertEqual(sleeps, [2.0, 2.0])
+            self.assertEqual(
+                env.requests.get.call_args.kwargs["timeout"],
+                (1.0, 1.0),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
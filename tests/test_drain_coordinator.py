@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from _solverai_test_support import (
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiDrainCoordinatorTests(unittest.TestCase):
+
+    def build_coordinator(self, env, **kwargs):
+        module = env.module("SolverAiDrainCoordinator")
+        clock = [50.0]
+        module.monotonic = lambda: clock[0]
+        return module.SolverAiDrainCoordinator(**kwargs), clock
+
+    def test_idle_coordinator_never_delays(self):
+        with solverai_test_environment() as env:
+            coordinator, _ = self.build_coordinator(env)
+
+            self.assertEqual(coordinator.schedule(), (0.0, None))
+            self.assertFalse(coordinator.draining)
+
+    def test_one_probe_then_staggered_release_in_arrival_order(self):
+        with solverai_test_environment() as env:
+            coordinator, clock = self.build_coordinator(
+                env,
+                release_spread_seconds=1.0,
+                probe_poll_seconds=0.1,
+            )
+
+            first = coordinator.noteDrain(10)
+            delay, second = coordinator.schedule()
+            self.assertEqual(delay, 10)
+            clock[0] += 4
+            delay, third = coordinator.schedule()
+            self.assertEqual(delay, 6)
+
+            clock[0] += 6
+            delay, first = coordinator.schedule(first)
+            self.assertEqual(delay, 0)
+            self.assertTrue(first.probe)
+            self.assertEqual(coordinator.schedule(second)[0], 0.1)
+            self.assertEqual(coordinator.schedule(third)[0], 0.1)
+
+            coordinator.noteAnswer(first)
+            self.assertFalse(coordinator.draining)
+            delay, second = coordinator.schedule(second)
+            self.assertAlmostEqual(delay, 1 / 3)
+            delay, third = coordinator.schedule(third)
+            self.assertAlmostEqual(delay, 2 / 3)
+            self.assertEqual(coordinator.schedule(second), (0.0, None))
+            self.assertEqual(coordinator.schedule(third), (0.0, None))
+            self.assertEqual(coordinator.getStats()["probes"], 1)
+
+    def test_drained_probe_starts_a_new_round_for_everyone(self):
+        with solverai_test_environment() as env:
+            coordinator, clock = self.build_coordinator(env)
+
+            first = coordinator.noteDrain(10)
+            _, second = coordinator.schedule()
+            clock[0] += 10
+            _, first = coordinator.schedule(first)
+            self.assertTrue(first.probe)
+
+            first = coordinator.noteDrain(5, first)
+            self.assertFalse(first.probe)
+            self.assertEqual(coordinator.schedule(second)[0], 5)
+            self.assertEqual(coordinator.getStats()["episodes"], 1)
+
+    def test_abandoned_probe_hands_over_and_timeout_releases(self):
+        with solverai_test_environment() as env:
+            coordinator, clock = self.build_coordinator(env, probe_timeout_seconds=3)
+
+            first = coordinator.noteDrain(1)
+            _, second = coordinator.schedule()
+            clock[0] += 1
+            _, first = coordinator.schedule(first)
+            coordinator.abandon(first)
+
+            delay, second = coordinator.schedule(second)
+            self.assertEqual(delay, 0)
+            self.assertTrue(second.probe)
+
+            _, third = coordinator.schedule()
+            clock[0] += 3
+            delay, third = coordinator.schedule(third)
+            self.assertFalse(coordinator.draining)
+            # Released third of three waiters, after the timed-out probe
+            self.assertAlmostEqual(delay, 2 / 3)
+
+    def test_rejects_invalid_settings(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiDrainCoordinator")
+
+            with self.assertRaises(ValueError):
+                module.SolverAiDrainCoordinator(release_spread_seconds=-1)
+            with self.assertRaises(ValueError):
+                module.SolverAiDrainCoordinator(probe_poll_seconds=0)
+
+    def test_concurrent_callers_send_one_probe_after_a_published_drain(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            coordinator_module = env.module("SolverAiDrainCoordinator")
+            exceptions = env.module("SolverAiClientExceptions")
+            lock = threading.Lock()
+            in_flight = [0]
+            max_in_flight_during_probe = [0]
+            calls = []
+
+            def respond(*args, **kwargs):
+                with lock:
+                    calls.append(time.monotonic())
+                    call_number = len(calls)
+                    in_flight[0] += 1
+                if call_number == 1:
+                    response = json_response(
+                        503,
+                        {"detail": "Draining"},
+                        headers={"Retry-After": "0.2"},
+                    )
+                elif call_number == 2:
+                    time.sleep(0.1)
+                    with lock:
+                        max_in_flight_during_probe[0] = in_flight[0]
+                    response = json_response(200, {"results": build_solver_results_payload()})
+                else:
+                    response = json_response(200, {"results": build_solver_results_payload()})
+                with lock:
+                    in_flight[0] -= 1
+                return response
+
+            env.requests.post.side_effect = respond
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                drain_max_retries=0,
+                drain_coordinator=coordinator_module.SolverAiDrainCoordinator(
+                    release_spread_seconds=0.1,
+                    probe_poll_seconds=0.01,
+                ),
+            )
+
+            with self.assertRaises(exceptions.SolverAiDrainingException):
+                client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+            results = client.runSolverBatch(
+                [input_module.SolverAiComputeInput("problem-1") for _ in range(6)],
+                max_concurrency=6,
+            )
+
+            self.assertTrue(
+                all(result.getNumberOfResults() == 1 for result in results),
+                results,
+            )
+            self.assertEqual(len(calls), 7)
+            self.assertEqual(max_in_flight_during_probe[0], 1)
+            self.assertGreaterEqual(calls[1] - calls[0], 0.19)
+            self.assertEqual(client.drain_coordinator.getStats()["probes"], 1)
+
+    def test_async_callers_share_the_drain_round(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiAsyncClientCompute")
+            coordinator_module = env.module("SolverAiDrainCoordinator")
+            env.requests.get.side_effect = [
+                json_response(503, {"detail": "Draining"}, headers={"Retry-After": "0.05"}),
+            ] + [
+                json_response(200, {"inputs": ["x"], "outputs": ["y"]})
+                for _ in range(4)
+            ]
+            coordinator = coordinator_module.SolverAiDrainCoordinator(
+                release_spread_seconds=0.02,
+                probe_poll_seconds=0.01,
+            )
+            client = module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                drain_coordinator=coordinator,
+            )
+
+            async def run():
+                async with client:
+                    first = asyncio.ensure_future(client.getInputsOutputs())
+                    while not coordinator.draining:
+                        await asyncio.sleep(0.001)
+                    rest = [client.getInputsOutputs() for _ in range(3)]
+                    return await asyncio.gather(first, *rest)
+
+            results = asyncio.run(run())
+
+            self.assertEqual(results, [(["x"], ["y"])] * 4)
+            self.assertEqual(env.requests.get.call_count, 5)
+            self.assertEqual(coordinator.getStats()["probes"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
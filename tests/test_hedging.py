@@ -0,0 +1,183 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from _solverai_test_support import json_response, solverai_test_environment
+
+
+SETUP_PAYLOAD = {"inputs": ["x"], "outputs": ["y"]}
+
+
+def slow_then_fast(responses, slow_seconds):
+    """``requests.get`` side effect: the first call stalls, later ones don't."""
+    calls = []
+    lock = threading.Lock()
+
+    def get(url, **kwargs):
+        with lock:
+            index = len(calls)
+            calls.append(url)
+        if index == 0:
+            time.sleep(slow_seconds)
+        return responses[index]
+
+    return get
+
+
+class SolverAiHedgingTests(unittest.TestCase):
+
+    def build_client(self, env, policy):
+        module = env.module("SolverAiClientCompute")
+        return module.SolverAiClientCompute(
+            "http://computer:8001",
+            "token",
+            "problem-1",
+            hedging_policy=policy,
+        )
+
+    def test_fast_reads_are_not_hedged(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiHedging")
+            policy = module.SolverAiHedgingPolicy(initial_delay_seconds=1.0)
+            env.requests.get.return_value = json_response(200, "ready")
+            client = self.build_client(env, policy)
+
+            for _ in range(3):
+                self.assertTrue(client.getProblemStatusInfo().is_ready)
+
+            stats = client.getHedgingStats()
+            self.assertEqual((stats.requests, stats.hedged), (3, 0))
+            self.assertEqual(stats.hedge_rate, 0.0)
+            self.assertEqual(env.requests.get.call_count, 3)
+            policy.close()
+
+    def test_slow_read_is_hedged_and_loser_response_closed(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiHedging")
+            policy = module.SolverAiHedgingPolicy(initial_delay_seconds=0.02)
+            slow = json_response(200, SETUP_PAYLOAD)
+            slow.close = Mock()
+            fast = json_response(200, SETUP_PAYLOAD)
+            env.requests.get.side_effect = slow_then_fast([slow, fast], 0.3)
+            client = self.build_client(env, policy)
+
+            started = time.monotonic()
+            self.assertEqual(client.getInputsOutputs(), (["x"], ["y"]))
+
+            self.assertLess(time.monotonic() - started, 0.25)
+            self.assertEqual(env.requests.get.call_count, 2)
+            stats = client.getHedgingStats()
+            self.assertEqual(
+                (stats.requests, stats.hedged, stats.hedge_wins),
+                (1, 1, 1),
+            )
+            self.assertEqual((stats.hedge_rate, stats.win_rate), (1.0, 1.0))
+            policy.close()
+            deadline = time.monotonic() + 2
+            while not slow.close.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            slow.close.assert_called_once_with()
+
+    def test_failed_attempt_falls_back_to_the_other(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiHedging")
+            policy = module.SolverAiHedgingPolicy(initial_delay_seconds=0.01)
+            lock = threading.Lock()
+            calls = []
+
+            def get(url, **kwargs):
+                with lock:
+                    calls.append(url)
+                    index = len(calls)
+                if index == 1:
+                    time.sleep(0.1)
+                    return json_response(200, "ready")
+                raise ConnectionError("reset")
+
+            env.requests.get.side_effect = get
+            client = self.build_client(env, policy)
+
+            self.assertTrue(client.getProblemStatusInfo().is_ready)
+            stats = client.getHedgingStats()
+            self.assertEqual((stats.hedged, stats.hedge_wins), (1, 0))
+            self.assertEqual(stats.win_rate, 0.0)
+
+            env.requests.get.side_effect = ConnectionError("down")
+            with self.assertRaises(ConnectionError):
+                client.getProblemStatusInfo()
+            policy.close()
+
+    def test_hedge_delay_tracks_the_latency_percentile(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiHedging")
+            clock = [0.0]
+            module.monotonic = lambda: clock[0]
+            policy = module.SolverAiHedgingPolicy(
+                percentile=0.9,
+                initial_delay_seconds=0.5,
+                min_delay_seconds=0.01,
+                max_delay_seconds=1.0,
+                min_samples=10,
+                window_size=10,
+            )
+            self.assertEqual(policy.hedgeDelaySeconds(), 0.5)
+
+            def attempt(seconds):
+                def run():
+                    clock[0] += seconds
+                    return seconds
+                return run
+
+            for latency in [0.02] * 9 + [0.2]:
+                policy.run(attempt(latency))
+            self.assertAlmostEqual(policy.hedgeDelaySeconds(), 0.2)
+
+            for latency in [5.0] * 10:
+                policy.run(attempt(latency))
+            self.assertEqual(policy.hedgeDelaySeconds(), 1.0)
+
+            for latency in [0.0] * 10:
+                policy.run(attempt(latency))
+            self.assertEqual(policy.hedgeDelaySeconds(), 0.01)
+            policy.close()
+
+    def test_rejects_invalid_policies(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiHedging")
+
+            with self.assertRaises(ValueError):
+                module.SolverAiHedgingPolicy(percentile=1.0)
+            with self.assertRaises(ValueError):
+                module.SolverAiHedgingPolicy(min_samples=20, window_size=10)
+
+    def test_async_client_hedges_reads(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiHedging")
+            async_module = env.module("SolverAiAsyncClientCompute")
+            policy = module.SolverAiHedgingPolicy(initial_delay_seconds=0.02)
+            env.requests.get.side_effect = slow_then_fast(
+                [json_response(200, "ready"), json_response(200, "ready")],
+                0.3,
+            )
+
+            async def scenario():
+                async with async_module.SolverAiAsyncClientCompute(
+                    "http://computer:8001",
+                    "token",
+                    "problem-1",
+                    hedging_policy=policy,
+                ) as client:
+                    info = await client.getProblemStatusInfo()
+                    return info, client.getHedgingStats()
+
+            info, stats = asyncio.run(scenario())
+
+            self.assertTrue(info.is_ready)
+            self.assertEqual((stats.hedged, stats.hedge_wins), (1, 1))
+            policy.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import asyncio
+import unittest
+
+from _solverai_test_support import FakeResponse, json_response, solverai_test_environment
+
+
+SETUP_PAYLOAD = {"inputs": ["x"], "outputs": ["y"]}
+
+
+class SolverAiInputsOutputsCacheTests(unittest.TestCase):
+
+    def build_client(self, env, ttl_seconds=60.0, problem_id="problem-1"):
+        module = env.module("SolverAiClientCompute")
+        cache_module = env.module("SolverAiInputsOutputsCache")
+        cache = cache_module.SolverAiInputsOutputsCache(ttl_seconds=ttl_seconds)
+        client = module.SolverAiClientCompute(
+            "http://computer:8001",
+            "token",
+            problem_id,
+            inputs_outputs_cache=cache,
+        )
+        return client, cache
+
+    def test_serves_fresh_entries_without_a_request(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(200, SETUP_PAYLOAD)
+            client, _ = self.build_client(env)
+
+            first = client.getInputsOutputs()
+            first[0].append("mutated")
+            second = client.getInputsOutputs()
+
+            self.assertEqual(second, (["x"], ["y"]))
+            self.assertEqual(env.requests.get.call_count, 1)
+            stats = client.getInputsOutputsCacheStats()
+            self.assertEqual((stats.fetches, stats.hits, stats.entries), (1, 1, 1))
+
+    def test_revalidates_stale_entries_with_conditional_headers(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(
+                    200,
+                    SETUP_PAYLOAD,
+                    headers={
+                        "ETag": '"v1"',
+                        "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT",
+                    },
+                ),
+                FakeResponse(304, ""),
+            ]
+            client, _ = self.build_client(env, ttl_seconds=0)
+
+            client.getInputsOutputs()
+            inputs, outputs = client.getInputsOutputs()
+
+            self.assertEqual((inputs, outputs), (["x"], ["y"]))
+            first_headers = env.requests.get.call_args_list[0].kwargs["headers"]
+            second_headers = env.requests.get.call_args_list[1].kwargs["headers"]
+            self.assertNotIn("If-None-Match", first_headers)
+            self.assertEqual(second_headers["If-None-Match"], '"v1"')
+            self.assertEqual(
+                second_headers["If-Modified-Since"],
+                "Wed, 21 Oct 2026 07:28:00 GMT",
+            )
+            self.assertEqual(second_headers["Authorization"], "Token token")
+            self.assertEqual(client.getInputsOutputsCacheStats().revalidations, 1)
+
+    def test_stale_entry_without_validators_is_fetched_in_full(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(200, SETUP_PAYLOAD),
+                json_response(200, {"inputs": ["x", "z"], "outputs": ["y"]}),
+            ]
+            client, _ = self.build_client(env, ttl_seconds=0)
+
+            client.getInputsOutputs()
+            inputs, _ = client.getInputsOutputs()
+
+            self.assertEqual(inputs, ["x", "z"])
+            second_headers = env.requests.get.call_args_list[1].kwargs["headers"]
+            self.assertNotIn("If-None-Match", second_headers)
+            self.assertNotIn("If-Modified-Since", second_headers)
+            self.assertEqual(client.getInputsOutputsCacheStats().fetches, 2)
+
+    def test_updating_status_forces_revalidation(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(200, SETUP_PAYLOAD, headers={"ETag": '"v1"'}),
+                json_response(202, "updating"),
+                json_response(200, {"inputs": ["x2"], "outputs": ["y"]}, headers={"ETag": '"v2"'}),
+            ]
+            client, _ = self.build_client(env)
+
+            client.getInputsOutputs()
+            client.getProblemStatusInfo()
+            inputs, _ = client.getInputsOutputs()
+
+            self.assertEqual(inputs, ["x2"])
+            third_headers = env.requests.get.call_args_list[2].kwargs["headers"]
+            self.assertEqual(third_headers["If-None-Match"], '"v1"')
+            self.assertEqual(client.getInputsOutputsCacheStats().expirations, 1)
+
+    def test_status_change_expires_entry_but_steady_status_does_not(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(200, "ready"),
+                json_response(200, SETUP_PAYLOAD),
+                json_response(200, "ready"),
+                json_response(400, "NOT_READY: rebuilding"),
+                json_response(200, SETUP_PAYLOAD),
+            ]
+            client, _ = self.build_client(env)
+
+            client.getProblemStatusInfo()
+            client.getInputsOutputs()
+            client.getProblemStatusInfo()
+            client.getInputsOutputs()
+            self.assertEqual(env.requests.get.call_count, 3)
+
+            client.getProblemStatusInfo()
+            client.getInputsOutputs()
+            self.assertEqual(env.requests.get.call_count, 5)
+
+    def test_entries_are_scoped_per_problem(self):
+        with solverai_test_environment() as env:
+            multi_module = env.module("SolverAiMultiProblemClientCompute")
+            cache_module = env.module("SolverAiInputsOutputsCache")
+            env.requests.get.side_effect = [
+                json_response(200, {"inputs": ["a"], "outputs": ["y"]}),
+                json_response(200, {"inputs": ["b"], "outputs": ["y"]}),
+            ]
+            client = multi_module.SolverAiMultiProblemClientCompute(
+                "http://computer:8001",
+                "token",
+                inputs_outputs_cache=cache_module.SolverAiInputsOutputsCache(),
+            )
+
+            for _ in range(2):
+                self.assertEqual(client.getInputsOutputs("problem-1")[0], ["a"])
+                self.assertEqual(client.getInputsOutputs("problem-2")[0], ["b"])
+
+            self.assertEqual(env.requests.get.call_count, 2)
+
+    def test_async_client_serves_fresh_entries(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiAsyncClientCompute")
+            cache_module = env.module("SolverAiInputsOutputsCache")
+            env.requests.get.return_value = json_response(200, SETUP_PAYLOAD)
+            client = module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                inputs_outputs_cache=cache_module.SolverAiInputsOutputsCache(),
+            )
+
+            async def run():
+                async with client:
+                    await client.getInputsOutputs()
+                    return await client.getInputsOutputs()
+
+            self.assertEqual(asyncio.run(run()), (["x"], ["y"]))
+            self.assertEqual(env.requests.get.call_count, 1)
+
+    def test_rejects_negative_ttl(self):
+        with solverai_test_environment() as env:
+            cache_module = env.module("SolverAiInputsOutputsCache")
+
+            with self.assertRaises(ValueError):
+                cache_module.SolverAiInputsOutputsCache(ttl_seconds=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
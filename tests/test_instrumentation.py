@@ -0,0 +1,257 @@
+import asyncio
+import threading
+import unittest
+import warnings
+from unittest.mock import Mock
+
+from _solverai_test_support import (
+    FakeResponse,
+    FakeStreamedResponse,
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiInstrumentationTests(unittest.TestCase):
+
+    def build_compute_client(self, env, **kwargs):
+        module = env.module("SolverAiClientCompute")
+        instrumentation_module = env.module("SolverAiInstrumentation")
+        instrumentation = instrumentation_module.SolverAiInstrumentation()
+        timings = []
+        instrumentation.addObserver(timings.append)
+        client = module.SolverAiClientCompute(
+            "http://computer:8001",
+            "token",
+            "problem-1",
+            instrumentation=instrumentation,
+            **kwargs,
+        )
+        return module, client, instrumentation, timings
+
+    def test_histogram_summarizes_log_buckets(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiInstrumentation")
+            histogram = module.SolverAiHistogram()
+
+            for seconds in [0.001] * 90 + [0.5] * 9 + [200.0]:
+                histogram.add(seconds)
+
+            summary = histogram.summary()
+            self.assertEqual(summary["count"], 100)
+            self.assertEqual(summary["min"], 0.001)
+            self.assertEqual(summary["max"], 200.0)
+            self.assertAlmostEqual(summary["p50"], 0.0016, places=6)
+            self.assertAlmostEqual(summary["p90"], 0.0016, places=6)
+            self.assertAlmostEqual(summary["p99"], 0.8192, places=6)
+            self.assertAlmostEqual(histogram.percentile(1.0), 200.0)
+
+    def test_concurrent_recording_loses_no_counts(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiInstrumentation")
+            recorder = module.SolverAiCallRecorder("compute", "runSolver")
+            histogram = module.SolverAiHistogram()
+
+            def record():
+                for _ in range(2000):
+                    recorder.addPhase("transfer", 0.001)
+                    recorder.addTransfer(response_bytes=1)
+                    recorder.addAttempt(200)
+                    histogram.add(0.001)
+
+            threads = [threading.Thread(target=record) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            timing = recorder.finish()
+            self.assertEqual(timing.attempts, 16000)
+            self.assertEqual(timing.response_bytes, 16000)
+            self.assertAlmostEqual(timing.phases["transfer"], 16.0, places=6)
+            self.assertEqual(histogram.summary()["count"], 16000)
+            self.assertEqual(sum(histogram.counts), 16000)
+
+    def test_run_solver_reports_phases_sizes_and_retries(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.side_effect = [
+                json_response(503, {"detail": "Draining"}, headers={"Retry-After": "1"}),
+                FakeResponse(202, "{}"),
+                FakeStreamedResponse(
+                    200,
+                    b'{"results": {"Number Of Results": 1, '
+                    b'"Objective Variable Names": "[\'objective\']", '
+                    b'"Constraint Variable Names": "[]", '
+                    b'"Input Variable Names": "[\'x\']", '
+                    b'"Output Variable Names": "[\'y\']", '
+                    b'"X0": "[1.0]", "Y0": "[2.0]"}}',
+                ),
+            ]
+            module, client, _, timings = self.build_compute_client(env)
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+            compute_input.addInput("x", 0.0, 1.0)
+            original_sleep = module.sleep
+            module.sleep = Mock()
+            try:
+                client.runSolver(compute_input)
+            finally:
+                module.sleep = original_sleep
+
+            self.assertEqual(len(timings), 1)
+            timing = timings[0]
+            self.assertEqual((timing.client, timing.operation), ("compute", "runSolver"))
+            self.assertEqual(timing.attempts, 3)
+            self.assertEqual(timing.retries, 2)
+            self.assertEqual(timing.drain_retries, 1)
+            self.assertEqual(timing.setup_retries, 1)
+            self.assertEqual(timing.status_code, 200)
+            self.assertIsNone(timing.error)
+            self.assertEqual(
+                timing.request_bytes,
+                3 * len(compute_input.getJsonBytes()),
+            )
+            self.assertGreater(timing.response_bytes, 0)
+            self.assertEqual(
+                set(timing.phases),
+                {"serialize", "ttfb", "transfer", "decode", "parse"},
+            )
+            self.assertLessEqual(sum(timing.phases.values()), timing.total_seconds)
+
+    def test_wait_for_problem_ready_is_one_call_with_poll_count(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(202, "setup in execution"),
+                json_response(200, "ready"),
+            ]
+            module, client, instrumentation, timings = self.build_compute_client(env)
+            original_sleep = module.sleep
+            module.sleep = Mock()
+            try:
+                client.waitForProblemReady()
+            finally:
+                module.sleep = original_sleep
+
+            self.assertEqual([timing.operation for timing in timings], ["waitForProblemReady"])
+            self.assertEqual(timings[0].status_polls, 2)
+            self.assertEqual(timings[0].attempts, 2)
+            snapshot = instrumentation.snapshot()
+            self.assertEqual(
+                list(snapshot["operations"]),
+                ["compute.waitForProblemReady"],
+            )
+
+    def test_failed_call_is_recorded_with_error_name(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(500, {"detail": "boom"})
+            _, client, instrumentation, timings = self.build_compute_client(env)
+
+            with self.assertRaises(Exception):
+                client.getInputsOutputs()
+
+            self.assertEqual(timings[0].error, "Exception")
+            stats = instrumentation.snapshot()["operations"]["compute.getInputsOutputs"]
+            self.assertEqual(stats["calls"], 1)
+            self.assertEqual(stats["errors"], 1)
+
+    def test_observer_failure_warns_without_failing_the_call(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(200, "ready")
+            _, client, instrumentation, _ = self.build_compute_client(env)
+            instrumentation.addObserver(Mock(side_effect=ValueError("bad observer")))
+
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                status_info = client.getProblemStatusInfo()
+
+            self.assertTrue(status_info.is_ready)
+            self.assertTrue(
+                any(issubclass(item.category, RuntimeWarning) for item in caught)
+            )
+
+    def test_snapshot_reset_and_report(self):
+        with solverai_test_environment() as env:
+            env.requests.get.return_value = json_response(200, "ready")
+            _, client, instrumentation, _ = self.build_compute_client(env)
+
+            client.getProblemStatusInfo()
+            client.getProblemStatusInfo()
+            report = instrumentation.report(reset=True)
+
+            self.assertIn("compute.getProblemStatusInfo calls=2", report)
+            self.assertIn("ttfb", report)
+            self.assertEqual(instrumentation.snapshot()["operations"], {})
+
+    def test_disabled_instrumentation_is_a_shared_no_op(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiInstrumentation")
+
+            first = module.instrumented_call(None, "compute", "runSolver")
+            second = module.instrumented_call(None, "setup", "GET problems")
+
+            self.assertIs(first, second)
+            with first:
+                self.assertIsNone(module.active_recorder())
+
+    def test_setup_client_records_one_call_per_request(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientSetup")
+            instrumentation_module = env.module("SolverAiInstrumentation")
+            instrumentation = instrumentation_module.SolverAiInstrumentation()
+            timings = []
+            instrumentation.addObserver(timings.append)
+            env.requests.post.return_value = json_response(201, {"id": "eq-1"})
+            client = module.SolverAiClientSetup(
+                "http://datamanagerapi:8000",
+                "token",
+                instrumentation=instrumentation,
+            )
+
+            client.postEquation("eq", "x+y", "x,y")
+
+            self.assertEqual(len(timings), 1)
+            timing = timings[0]
+            self.assertEqual((timing.client, timing.operation), ("setup", "POST equations"))
+            self.assertEqual(timing.attempts, 1)
+            self.assertEqual(timing.status_code, 201)
+            self.assertGreater(timing.request_bytes, 0)
+            self.assertTrue({"serialize", "ttfb", "decode"} <= set(timing.phases))
+
+    def test_async_client_reports_executor_side_phases(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiAsyncClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            instrumentation_module = env.module("SolverAiInstrumentation")
+            instrumentation = instrumentation_module.SolverAiInstrumentation()
+            timings = []
+            instrumentation.addObserver(timings.append)
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            client = module.SolverAiAsyncClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                instrumentation=instrumentation,
+            )
+
+            async def run():
+                async with client:
+                    return await asyncio.gather(*[
+                        client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+                        for _ in range(3)
+                    ])
+
+            asyncio.run(run())
+
+            self.assertEqual(len(timings), 3)
+            for timing in timings:
+                self.assertEqual(timing.attempts, 1)
+                self.assertIn("ttfb", timing.phases)
+                self.assertIn("parse", timing.phases)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import math
+import unittest
+
+from _solverai_test_support import FakeResponse, solverai_test_environment
+
+
+def orjson_installed():
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class SolverAiJsonCodecTests(unittest.TestCase):
+
+    def test_stdlib_codec_round_trips_bytes_and_str(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+            codec = module.new_json_codec("json")
+            payload = {"id": "problem-1", "inputs": {"x": {"Min": 0.5}}}
+
+            encoded = codec.dumps(payload)
+
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(encoded, json.dumps(payload).encode())
+            self.assertEqual(codec.loads(encoded), payload)
+            self.assertEqual(codec.loads(encoded.decode()), payload)
+            self.assertEqual(codec.loads(memoryview(encoded)), payload)
+
+    def test_every_available_codec_agrees_with_stdlib(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+            payload = {
+                "results": {"Y0": "[1.0, 2.5]", "Number Of Results": 1},
+                "name": "café",
+                "values": [1, 0.1, -3e-12, True, None],
+            }
+
+            for name in module.available_json_codecs():
+                codec = module.new_json_codec(name)
+                with self.subTest(codec=name):
+                    self.assertEqual(json.loads(codec.dumps(payload)), payload)
+                    self.assertEqual(
+                        codec.loads(json.dumps(payload).encode()),
+                        payload,
+                    )
+
+    def test_fast_codecs_fall_back_to_stdlib_for_rejected_input(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+
+            for name in module.available_json_codecs():
+                codec = module.new_json_codec(name)
+                with self.subTest(codec=name):
+                    self.assertTrue(math.isnan(codec.loads(b'{"value": NaN}')["value"]))
+                    self.assertEqual(
+                        json.loads(codec.dumps({"big": 2 ** 70})),
+                        {"big": 2 ** 70},
+                    )
+                    with self.assertRaises(ValueError):
+                        codec.loads(b"{not json")
+
+    def test_wide_integers_are_decoded_like_stdlib(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+            payload = {"id": 2 ** 70, "count": -(2 ** 64), "ratio": 0.5, "name": "1" * 20}
+
+            for name in module.available_json_codecs():
+                codec = module.new_json_codec(name)
+                with self.subTest(codec=name):
+                    encoded = json.dumps(payload)
+                    self.assertEqual(codec.loads(encoded.encode()), payload)
+                    self.assertEqual(codec.loads(encoded), payload)
+                    self.assertIsInstance(codec.loads(encoded)["id"], int)
+
+    def test_non_finite_floats_are_encoded_like_stdlib(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+            payload = {
+                "inputs": {"x": {"Min": float("-inf"), "Max": float("inf")}},
+                "values": [float("nan"), None, 1.5],
+            }
+
+            for name in module.available_json_codecs():
+                codec = module.new_json_codec(name)
+                with self.subTest(codec=name):
+                    encoded = codec.dumps(payload)
+                    self.assertEqual(encoded, json.dumps(payload).encode())
+                    decoded = codec.loads(encoded)
+                    self.assertEqual(decoded["inputs"]["x"]["Max"], math.inf)
+                    self.assertTrue(math.isnan(decoded["values"][0]))
+                    self.assertIsNone(decoded["values"][1])
+
+    def test_set_json_codec_by_name_and_reset(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+
+            self.assertEqual(module.set_json_codec("json").name, "json")
+            self.assertEqual(module.get_json_codec().name, "json")
+
+            restored = module.set_json_codec()
+            self.assertEqual(restored.name, module.available_json_codecs()[0])
+
+    def test_unknown_codec_name_raises_value_error(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+
+            with self.assertRaises(ValueError):
+                module.set_json_codec("yaml")
+
+    @unittest.skipUnless(orjson_installed(), "orjson is not installed")
+    def test_orjson_is_preferred_when_installed(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+
+            self.assertEqual(module.get_json_codec().name, "orjson")
+
+    def test_loads_response_prefers_raw_bytes(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+            response = FakeResponse(200, "ignored")
+            response.content = b'{"id": "eq-1"}'
+
+            self.assertEqual(module.loads_response(response), {"id": "eq-1"})
+            self.assertEqual(
+                module.loads_response(FakeResponse(200, '{"id": "eq-2"}')),
+                {"id": "eq-2"},
+            )
+
+    def test_compute_input_json_uses_active_codec_but_fingerprint_does_not(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonCodec")
+            input_module = env.module("SolverAiComputeInput")
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+            compute_input.addInput("x", 0.0, 1.0)
+
+            fingerprints = set()
+            for name in module.available_json_codecs():
+                module.set_json_codec(name)
+                self.assertEqual(
+                    json.loads(compute_input.getJsonBytes()),
+                    json.loads(compute_input.getJson()),
+                )
+                fingerprints.add(compute_input.getFingerprint())
+
+            self.assertEqual(len(fingerprints), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import unittest
+
+from _solverai_test_support import solverai_test_environment
+
+
+def split_bytes(body, size):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+class SolverAiJsonStreamTests(unittest.TestCase):
+
+    def test_members_match_json_loads_for_every_chunk_size(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonStream")
+            document = {
+                "results": {
+                    "Number Of Results": 12345,
+                    "X0": "[1.0, -2.5e-08]",
+                    "name": "café ✓",
+                    "nested": {"a": [1, 2, {"b": None}]},
+                    "flag": True,
+                },
+                "detail": "ok",
+                "count": 3.25,
+            }
+            body = json.dumps(document, indent=2, ensure_ascii=False).encode()
+
+            for size in (1, 2, 3, 7, 64, len(body)):
+                with self.subTest(size=size):
+                    members = list(module.iter_json_members(split_bytes(body, size)))
+                    self.assertEqual(
+                        {key: value for parent, key, value in members if parent == "results"},
+                        document["results"],
+                    )
+                    self.assertEqual(
+                        [(key, value) for parent, key, value in members if parent is None],
+                        [("detail", "ok"), ("count", 3.25)],
+                    )
+
+    def test_non_object_expanded_member_is_yielded_whole(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonStream")
+
+            members = list(module.iter_json_members([b'{"results": [1, 2]}']))
+
+            self.assertEqual(members, [(None, "results", [1, 2])])
+
+    def test_empty_object_yields_nothing(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonStream")
+
+            self.assertEqual(list(module.iter_json_members([b" { } "])), [])
+            self.assertEqual(
+                list(module.iter_json_members([b'{"results": {}}'])),
+                [],
+            )
+
+    def test_malformed_and_truncated_bodies_raise_decode_errors(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiJsonStream")
+            bodies = [
+                b"",
+                b"[1, 2]",
+                b'{"results": {"X0": "[1.0]"',
+                b'{"results": {"X0": "[1.0]", }}',
+                b'{"results": 12',
+                b'{"a": 1} trailing',
+            ]
+
+            for body in bodies:
+                with self.subTest(body=body):
+                    with self.assertRaises(json.JSONDecodeError):
+                        list(module.iter_json_members(split_bytes(body, 3) or [b""]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import Mock
+
+from _solverai_test_support import (
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiMultiProblemClientComputeTests(unittest.TestCase):
+
+    def build_client(self, env, **kwargs):
+        module = env.module("SolverAiMultiProblemClientCompute")
+        return module.SolverAiMultiProblemClientCompute(
+            "http://computer:8001",
+            "token",
+            **kwargs,
+        )
+
+    def test_problems_share_one_session_and_pass_id_per_call(self):
+        with solverai_test_environment() as env:
+            env.requests.get.side_effect = [
+                json_response(200, "ready"),
+                json_response(200, {"inputs": ["x"], "outputs": ["y"]}),
+            ]
+            client = self.build_client(env)
+
+            status_info = client.getProblemStatusInfo("problem-1")
+            inputs, outputs = client.getInputsOutputs("problem-2")
+
+            self.assertTrue(status_info.is_ready)
+            self.assertEqual((inputs, outputs), (["x"], ["y"]))
+            urls = [call.args[0] for call in env.requests.get.call_args_list]
+            self.assertEqual(
+                urls,
+                [
+                    "http://computer:8001/check_problem_status/problem-1",
+                    "http://computer:8001/problem_setup/problem-2",
+                ],
+            )
+            for call in env.requests.get.call_args_list:
+                self.assertEqual(
+                    call.kwargs["headers"]["Authorization"],
+                    "Token token",
+                )
+            env.requests.Session.assert_called_once_with()
+            self.assertEqual(client.problemIds, ["problem-1", "problem-2"])
+
+    def test_for_problem_reuses_one_view_sharing_collaborators(self):
+        with solverai_test_environment() as env:
+            client = self.build_client(env)
+
+            first = client.forProblem("problem-1")
+            second = client.forProblem("problem-2")
+
+            self.assertIs(client.forProblem("problem-1"), first)
+            self.assertEqual(first.problemId, "problem-1")
+            self.assertEqual(second.problemId, "problem-2")
+            self.assertIs(first.transport, client.transport)
+            self.assertIs(second.drain_coordinator, client.drain_coordinator)
+
+            first.close()
+            self.assertFalse(client.transport.session.closed)
+            client.forgetProblem("problem-1")
+            self.assertEqual(client.problemIds, ["problem-2"])
+            client.close()
+            self.assertTrue(client.transport.session.closed)
+
+    def test_run_solver_rejects_input_for_another_problem(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            client = self.build_client(env)
+
+            with self.assertRaises(ValueError):
+                client.runSolver(
+                    "problem-1",
+                    input_module.SolverAiComputeInput("problem-2"),
+                )
+
+            env.requests.post.assert_not_called()
+
+    def test_drain_seen_by_one_problem_holds_back_the_others(self):
+        with solverai_test_environment() as env:
+            compute_module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.post.side_effect = [
+                json_response(503, {"detail": "Draining"}, headers={"Retry-After": "30"}),
+                json_response(200, {"results": build_solver_results_payload()}),
+            ]
+            client = self.build_client(env, drain_max_retries=0)
+            original_sleep = compute_module.sleep
+            mock_sleep = Mock()
+            compute_module.sleep = mock_sleep
+            try:
+                with self.assertRaises(exceptions.SolverAiDrainingException):
+                    client.runSolver(
+                        "problem-1",
+                        input_module.SolverAiComputeInput("problem-1"),
+                    )
+                client.runSolver("problem-2", input_module.SolverAiComputeInput("problem-2"))
+            finally:
+                compute_module.sleep = original_sleep
+
+            self.assertEqual(env.requests.post.call_count, 2)
+            # The second problem waits out the announced drain before probing
+            self.assertEqual(mock_sleep.call_count, 1)
+            self.assertGreater(mock_sleep.call_args.args[0], 29.0)
+            self.assertLessEqual(mock_sleep.call_args.args[0], 30.0)
+            self.assertFalse(client.drain_coordinator.draining)
+
+    def test_problems_share_one_instrumentation_registry(self):
+        with solverai_test_environment() as env:
+            instrumentation_module = env.module("SolverAiInstrumentation")
+            instrumentation = instrumentation_module.SolverAiInstrumentation()
+            env.requests.get.return_value = json_response(200, "ready")
+            client = self.build_client(env, instrumentation=instrumentation)
+
+            for problem_id in ("problem-1", "problem-2", "problem-3"):
+                client.getProblemStatusInfo(problem_id)
+
+            stats = instrumentation.snapshot()["operations"]
+            self.assertEqual(stats["compute.getProblemStatusInfo"]["calls"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import math
+import unittest
+from ast import literal_eval
+
+from _solverai_test_support import solverai_test_environment
+
+
+def build_results_payload(count):
+    payload = {
+        "Number Of Results": count,
+        "Objective Variable Names": "['y']",
+        "Constraint Variable Names": "[]",
+        "Input Variable Names": "['x', 'k']",
+        "Output Variable Names": "['y']",
+    }
+    for index in range(count):
+        payload[f"X{index}"] = f"[{index / 4}, {index}]"
+        payload[f"Y{index}"] = f"[{-index * 1.5e-08}]"
+    return payload
+
+
+class SolverAiNumericParserTests(unittest.TestCase):
+
+    def test_parse_rows_matches_literal_eval(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiNumericParser")
+            numeric = ["[1, 2.5]", "[-2.5e-08, 3e+20]", "[]"]
+            mixed = numeric + ["(3, 4)", "[None, 1.0]"]
+
+            for texts in (numeric, mixed):
+                with self.subTest(texts=texts):
+                    self.assertEqual(
+                        module.parse_rows(texts),
+                        [list(literal_eval(text)) for text in texts],
+                    )
+            self.assertIsInstance(module.parse_rows(numeric)[0][0], int)
+            self.assertEqual(module.parse_rows([]), [])
+
+    def test_parse_rows_does_not_merge_unbalanced_rows(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiNumericParser")
+
+            with self.assertRaises(SyntaxError):
+                module.parse_rows(["[1.0, 2.0", "3.0]"])
+
+    def test_wide_integer_rows_match_literal_eval_on_every_codec(self):
+        with solverai_test_environment() as env:
+            codec_module = env.module("SolverAiJsonCodec")
+            module = env.module("SolverAiNumericParser")
+            texts = [f"[{2 ** 63}, 0.5]", f"[{-(2 ** 70)}, 1.5]", "[1, 2.5]"]
+
+            for name in codec_module.available_json_codecs():
+                codec_module.set_json_codec(name)
+                with self.subTest(codec=name):
+                    self.assertEqual(
+                        module.parse_rows(texts),
+                        [list(literal_eval(text)) for text in texts],
+                    )
+                    self.assertIsInstance(module.parse_rows(texts)[1][0], int)
+
+    def test_builder_matches_constructor_for_out_of_order_rows(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            payload = build_results_payload(1031)
+            expected = module.SolverAiComputeResults(payload)
+            builder = module.SolverAiComputeResultsBuilder()
+
+            for key in reversed(list(payload)):
+                builder.add(key, payload[key])
+            results = builder.build()
+
+            self.assertEqual(results.getX(), expected.getX())
+            self.assertEqual(results.getY(), expected.getY())
+            self.assertEqual(results.getX()[3], [0.75, 3])
+
+    def test_builder_parses_rows_in_blocks_as_they_arrive(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            count = module.BUILDER_CHUNK_ROWS * 2 + 7
+            payload = build_results_payload(count)
+            payload["Y5"] = "[None]"
+            expected = module.SolverAiComputeResults(payload)
+            builder = module.SolverAiComputeResultsBuilder()
+
+            for key, value in payload.items():
+                builder.add(key, value)
+                pending = builder._SolverAiComputeResultsBuilder__pending
+                self.assertLess(len(pending["X"]), module.BUILDER_CHUNK_ROWS)
+                self.assertLess(len(pending["Y"]), module.BUILDER_CHUNK_ROWS)
+            results = builder.build()
+
+            self.assertEqual(results.getX(), expected.getX())
+            self.assertEqual(results.getY(), expected.getY())
+            self.assertIsInstance(results.getXRow(-1)[1], int)
+            self.assertIsNone(results.getYRow(5)[0])
+
+
+class SolverAiNumericArrayTests(unittest.TestCase):
+
+    def setUp(self):
+        with solverai_test_environment() as env:
+            if env.module("SolverAiNumericParser").np is None:
+                self.skipTest("numpy is not installed")
+
+    def test_results_expose_contiguous_float_arrays(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            results = module.SolverAiComputeResults(build_results_payload(3))
+
+            X = results.getXArray()
+
+            self.assertEqual(X.shape, (3, 2))
+            self.assertEqual(X.dtype.name, "float64")
+            self.assertTrue(X.flags["C_CONTIGUOUS"])
+            self.assertIs(results.getXArray(), X)
+            self.assertEqual(X.tolist(), results.getX())
+            self.assertEqual(results.getYArray().shape, (3, 1))
+
+    def test_empty_results_keep_their_width(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiComputeResults")
+            results = module.SolverAiComputeResults(build_results_payload(0))
+
+            self.assertEqual(results.getXArray().shape, (0, 2))
+            self.assertEqual(results.getYArray().shape, (0, 1))
+
+    def test_malformed_rows_are_named(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiNumericParser")
+
+            with self.assertRaisesRegex(ValueError, "Y1 row: expected 2 values, got 3"):
+                module.parse_numeric_array(
+                    ["[1.0, 2.0]", "[1.0, 2.0, 3.0]"],
+                    prefix="Y",
+                )
+            with self.assertRaisesRegex(ValueError, "X2 row"):
+                module.parse_numeric_array(["[1.0]", "[2.0]", "['a']"])
+            self.assertTrue(
+                math.isnan(module.parse_numeric_array(["[None]"])[0, 0])
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import itertools
+import math
+import random
+import unittest
+
+from _solverai_test_support import solverai_test_environment
+
+
+def brute_force_ranks(points):
+    def dominates(a, b):
+        return all(x <= y for x, y in zip(a, b)) and a != b
+
+    ranks = [None] * len(points)
+    remaining = set(range(len(points)))
+    rank = 0
+    while remaining:
+        front = {
+            i for i in remaining
+            if not any(dominates(points[j], points[i]) for j in remaining)
+        }
+        for i in front:
+            ranks[i] = rank
+        remaining -= front
+        rank += 1
+    return ranks
+
+
+def grid_hypervolume(points, reference):
+    """Counts the unit cells below ``reference`` dominated by integer points."""
+    return sum(
+        any(all(p <= c + 0.5 for p, c in zip(point, cell)) for point in points)
+        for cell in itertools.product(*(range(int(r)) for r in reference))
+    )
+
+
+def build_results_payload(rows):
+    payload = {
+        "Number Of Results": len(rows),
+        "Objective Variable Names": "['cost', 'speed']",
+        "Constraint Variable Names": "[]",
+        "Input Variable Names": "['x']",
+        "Output Variable Names": "['cost', 'speed']",
+    }
+    for index, row in enumerate(rows):
+        payload[f"X{index}"] = f"[{index}]"
+        payload[f"Y{index}"] = str(list(row))
+    return payload
+
+
+class SolverAiParetoTests(unittest.TestCase):
+
+    def setUp(self):
+        with solverai_test_environment() as env:
+            if env.module("SolverAiNumericParser").np is None:
+                self.skipTest("numpy is not installed")
+
+    def test_ranks_match_brute_force(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPareto")
+            rng = random.Random(3)
+
+            for objectives in (1, 2, 3, 4):
+                for _ in range(25):
+                    points = [
+                        tuple(float(rng.randint(0, 5)) for _ in range(objectives))
+                        for _ in range(rng.randint(1, 40))
+                    ]
+                    with self.subTest(objectives=objectives, points=points):
+                        self.assertEqual(
+                            module.non_dominated_ranks(points).tolist(),
+                            brute_force_ranks(points),
+                        )
+
+    def test_hypervolume_matches_counted_cells(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPareto")
+            rng = random.Random(5)
+
+            self.assertEqual(
+                module.hypervolume([[1, 3], [2, 2], [3, 1], [3, 3]], [4, 4]),
+                6.0,
+            )
+            self.assertEqual(
+                module.hypervolume([[0, 0, 1], [1, 1, 0], [2, 0, 0]], [2, 2, 2]),
+                5.0,
+            )
+            for objectives in (2, 3):
+                for _ in range(20):
+                    points = [
+                        [rng.randint(0, 7) for _ in range(objectives)]
+                        for _ in range(rng.randint(1, 20))
+                    ]
+                    reference = [6] * objectives
+                    with self.subTest(points=points):
+                        self.assertEqual(
+                            module.hypervolume(points, reference),
+                            grid_hypervolume(points, reference),
+                        )
+            with self.assertRaisesRegex(ValueError, "2 and 3 objectives"):
+                module.hypervolume([[0, 0, 0, 0]], [1, 1, 1, 1])
+
+    def test_crowding_distances_per_front(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPareto")
+            points = [[0, 3], [1, 2], [2, 1], [3, 0], [5, 5]]
+
+            distances = module.crowding_distances(
+                points,
+                module.non_dominated_ranks(points),
+            )
+
+            self.assertEqual(distances[[0, 3, 4]].tolist(), [math.inf] * 3)
+            self.assertAlmostEqual(distances[1], 4 / 3)
+            self.assertAlmostEqual(distances[2], 4 / 3)
+
+    def test_analysis_follows_objective_senses_of_the_input(self):
+        with solverai_test_environment() as env:
+            results_module = env.module("SolverAiComputeResults")
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiPareto")
+            results = results_module.SolverAiComputeResults(
+                build_results_payload([(1.0, 1.0), (2.0, 3.0), (3.0, 2.0)])
+            )
+            compute_input = input_module.SolverAiComputeInput("problem")
+            compute_input.addObjective("cost", input_module.OBJECTIVE.MINIMIZE)
+            compute_input.addObjective("speed", input_module.OBJECTIVE.MAXIMIZE)
+
+            analysis = module.SolverAiParetoAnalysis(results, compute_input)
+
+            self.assertEqual(analysis.getRanks().tolist(), [0, 0, 1])
+            self.assertEqual(analysis.getParetoFront().tolist(), [0, 1])
+            self.assertEqual(
+                analysis.getSenses()["speed"],
+                input_module.OBJECTIVE.MAXIMIZE,
+            )
+            self.assertEqual(analysis.getHypervolume([4.0, 0.0]), 7.0)
+
+            minimized = module.SolverAiParetoAnalysis(
+                results,
+                compute_input,
+                senses={"speed": "minimize"},
+            )
+            self.assertEqual(minimized.getRanks().tolist(), [0, 1, 1])
+            self.assertEqual(minimized.getHypervolume(), 4.0)
+
+    def test_analysis_rejects_unknown_objectives(self):
+        with solverai_test_environment() as env:
+            results_module = env.module("SolverAiComputeResults")
+            module = env.module("SolverAiPareto")
+            payload = build_results_payload([(1.0, 1.0)])
+            payload["Objective Variable Names"] = "['weight']"
+
+            with self.assertRaisesRegex(ValueError, "weight"):
+                module.SolverAiParetoAnalysis(
+                    results_module.SolverAiComputeResults(payload)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock
+
+from _solverai_test_support import solverai_test_environment
+
+
+class SolverAiPollingStrategyTests(unittest.TestCase):
+
+    def test_fixed_polling_returns_constant_interval(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPollingStrategy")
+            strategy = module.SolverAiFixedPolling(2.5)
+
+            self.assertEqual(
+                [strategy.interval(poll) for poll in range(1, 4)],
+                [2.5, 2.5, 2.5],
+            )
+
+    def test_backoff_has_fast_phase_then_grows_to_max(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPollingStrategy")
+            strategy = module.SolverAiBackoffPolling(
+                min_interval_seconds=0.5,
+                max_interval_seconds=3.0,
+                multiplier=2.0,
+                jitter=0.0,
+                fast_polls=2,
+                fast_interval_seconds=0.1,
+            )
+
+            self.assertEqual(
+                [strategy.interval(poll) for poll in range(1, 8)],
+                [0.1, 0.1, 0.5, 1.0, 2.0, 3.0, 3.0],
+            )
+            self.assertEqual(strategy.interval(10_000), 3.0)
+
+    def test_backoff_jitter_scales_interval_down(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPollingStrategy")
+            strategy = module.SolverAiBackoffPolling(
+                min_interval_seconds=1.0,
+                max_interval_seconds=8.0,
+                jitter=0.5,
+                fast_polls=0,
+            )
+            original_random = module.random.random
+            module.random.random = Mock(side_effect=[0.0, 1.0, 0.5])
+
+            try:
+                intervals = [strategy.interval(3) for _ in range(3)]
+            finally:
+                module.random.random = original_random
+
+            self.assertEqual(intervals, [4.0, 2.0, 3.0])
+
+    def test_backoff_fast_interval_defaults_to_min_interval(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPollingStrategy")
+            strategy = module.SolverAiBackoffPolling(
+                min_interval_seconds=0.25,
+                fast_interval_seconds=None,
+                jitter=0.0,
+            )
+
+            self.assertEqual(strategy.interval(1), 0.25)
+
+    def test_backoff_rejects_invalid_bounds(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiPollingStrategy")
+
+            with self.assertRaises(ValueError):
+                module.SolverAiBackoffPolling(
+                    min_interval_seconds=2.0,
+                    max_interval_seconds=1.0,
+                )
+            with self.assertRaises(ValueError):
+                module.SolverAiBackoffPolling(jitter=1.5)
+            with self.assertRaises(ValueError):
+                module.SolverAiBackoffPolling(multiplier=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
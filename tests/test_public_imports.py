@@ -13,13 +13,52 @@ class PublicImportTests(unittest.TestCase):
                 "validate_token",
                 "IdsDataManager",
                 "SolverAiClientCompute",
+                "SolverAiAsyncClientCompute",
+                "SolverAiMultiProblemClientCompute",
                 "SolverAiProblemStatusInfo",
                 "SetupInExecutionException",
                 "SolverAiDrainingException",
+                "SolverAiWaitTimeoutError",
+                "SolverAiRateLimitedError",
+                "SolverAiCircuitOpenError",
+                "SolverAiDeadlineExceededError",
                 "SolverAiClientSetup",
                 "SolverAiComputeInput",
                 "SolverAiComputeResults",
+                "SolverAiComputeResultsBuilder",
+                "SolverAiPollingStrategy",
+                "SolverAiFixedPolling",
+                "SolverAiBackoffPolling",
+                "SolverAiSetupWaitStrategy",
+                "SolverAiResultCache",
+                "SolverAiInputsOutputsCache",
                 "SolverAiResultsWriter",
+                "SolverAiTransport",
+                "SolverAiTransferStats",
+                "SolverAiJsonCodec",
+                "available_json_codecs",
+                "get_json_codec",
+                "set_json_codec",
+                "SolverAiInstrumentation",
+                "SolverAiCallTiming",
+                "SolverAiHistogram",
+                "SolverAiDrainCoordinator",
+                "SolverAiRateLimiter",
+                "get_rate_limiter",
+                "set_rate_limiter",
+                "SolverAiCircuitBreaker",
+                "get_circuit_breaker",
+                "set_circuit_breaker",
+                "SolverAiHedgingPolicy",
+                "SolverAiHedgingStats",
+                "SolverAiTimeouts",
+                "SolverAiSweep",
+                "SolverAiSweepParameter",
+                "SolverAiSweepResults",
+                "SolverAiSingleFlight",
+                "SolverAiSingleFlightStats",
+                "SolverAiResultsParserPool",
+                "SolverAiParetoAnalysis",
             }
 
             self.assertEqual(set(package.__all__), expected_names)
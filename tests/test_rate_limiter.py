@@ -0,0 +1,112 @@
+import unittest
+
+from _solverai_test_support import (
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiRateLimiterTests(unittest.TestCase):
+
+    def test_token_bucket_refills_at_its_rate_up_to_burst(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiRateLimiter")
+            clock = [100.0]
+            module.monotonic = lambda: clock[0]
+            bucket = module.SolverAiTokenBucket(rate_per_second=2, burst=2)
+
+            self.assertEqual(bucket.tryAcquire(), 0.0)
+            self.assertEqual(bucket.tryAcquire(), 0.0)
+            self.assertAlmostEqual(bucket.tryAcquire(), 0.5)
+
+            clock[0] += 0.5
+            self.assertEqual(bucket.tryAcquire(), 0.0)
+            clock[0] += 60
+            self.assertEqual(bucket.tryAcquire(), 0.0)
+            self.assertEqual(bucket.tryAcquire(), 0.0)
+            self.assertGreater(bucket.tryAcquire(), 0.0)
+
+    def test_rejects_invalid_buckets_and_kinds(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiRateLimiter")
+
+            with self.assertRaises(ValueError):
+                module.SolverAiTokenBucket(rate_per_second=0)
+            with self.assertRaises(ValueError):
+                module.SolverAiTokenBucket(rate_per_second=1, burst=0.5)
+            with self.assertRaises(ValueError):
+                module.SolverAiRateLimiter().acquire("upload")
+
+    def test_status_budget_rejects_locally_without_touching_solves(self):
+        with solverai_test_environment() as env:
+            compute_module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiRateLimiter")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.get.return_value = json_response(200, "ready")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            limiter = module.SolverAiRateLimiter(
+                status_per_second=0.001,
+                status_burst=1,
+            )
+            client = compute_module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                rate_limiter=limiter,
+            )
+
+            client.getProblemStatusInfo()
+            with self.assertRaises(exceptions.SolverAiRateLimitedError) as ctx:
+                client.getProblemStatusInfo()
+            for _ in range(3):
+                client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+
+            self.assertEqual(ctx.exception.kind, "status")
+            self.assertGreater(ctx.exception.retry_after_seconds, 0)
+            self.assertEqual(env.requests.get.call_count, 1)
+            self.assertEqual(env.requests.post.call_count, 3)
+            self.assertEqual(
+                limiter.getStats(),
+                {
+                    "solve": {"admitted": 3, "rejected": 0},
+                    "status": {"admitted": 1, "rejected": 1},
+                },
+            )
+
+    def test_process_wide_limiter_is_shared_by_all_clients(self):
+        with solverai_test_environment() as env:
+            compute_module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiRateLimiter")
+            exceptions = env.module("SolverAiClientExceptions")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            limiter = env.package.set_rate_limiter(
+                module.SolverAiRateLimiter(solve_per_second=0.001, solve_burst=1)
+            )
+            first = compute_module.SolverAiClientCompute(
+                "http://computer:8001", "token", "problem-1",
+            )
+            second = compute_module.SolverAiClientCompute(
+                "http://computer:8001", "token", "problem-2",
+            )
+
+            first.runSolver(input_module.SolverAiComputeInput("problem-1"))
+            with self.assertRaises(exceptions.SolverAiRateLimitedError):
+                second.runSolver(input_module.SolverAiComputeInput("problem-2"))
+
+            self.assertIs(second.rate_limiter, limiter)
+            self.assertEqual(env.requests.post.call_count, 1)
+            env.package.set_rate_limiter(None)
+            self.assertIsNone(first.rate_limiter)
+
+
+if __name__ == "__main__":
+    unittest.main()
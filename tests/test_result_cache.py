@@ -0,0 +1,191 @@
+import os
+import tempfile
+import unittest
+
+from _solverai_test_support import solverai_test_environment
+
+
+def build_results(label, padding=0):
+    return {
+        "Number Of Results": 1,
+        "Objective Variable Names": "['objective']",
+        "Constraint Variable Names": "[]",
+        "Input Variable Names": "['x']",
+        "Output Variable Names": "['y']",
+        "X0": "[1.0]",
+        "Y0": "[2.0]",
+        "label": label + ("-" * padding),
+    }
+
+
+class SolverAiResultCacheTests(unittest.TestCase):
+
+    def test_memory_hit_returns_stored_results_and_counts_it(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultCache")
+            cache = module.SolverAiResultCache()
+
+            self.assertIsNone(cache.get("problem-1", "key-1"))
+            cache.put("problem-1", "key-1", build_results("a"))
+            cached = cache.get("problem-1", "key-1")
+
+            self.assertEqual(cached, build_results("a"))
+            stats = cache.getStats()
+            self.assertEqual(stats.hits, 1)
+            self.assertEqual(stats.misses, 1)
+            self.assertEqual(stats.memory_hits, 1)
+            self.assertEqual(stats.hit_rate, 0.5)
+            self.assertEqual(stats.entries, 1)
+            self.assertGreater(stats.bytes_used, 0)
+
+    def test_lru_eviction_respects_byte_budget(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultCache")
+            probe = module.SolverAiResultCache()
+            probe.put("problem-1", "probe", build_results("a", padding=100))
+            entry_size = probe.getStats().bytes_used
+            cache = module.SolverAiResultCache(max_bytes=entry_size * 2)
+
+            cache.put("problem-1", "key-a", build_results("a", padding=100))
+            cache.put("problem-1", "key-b", build_results("b", padding=100))
+            cache.get("problem-1", "key-a")
+            cache.put("problem-1", "key-c", build_results("c", padding=100))
+
+            self.assertIsNotNone(cache.get("problem-1", "key-a"))
+            self.assertIsNone(cache.get("problem-1", "key-b"))
+            self.assertIsNotNone(cache.get("problem-1", "key-c"))
+            stats = cache.getStats()
+            self.assertEqual(stats.evictions, 1)
+            self.assertLessEqual(stats.bytes_used, entry_size * 2)
+
+    def test_entries_larger_than_budget_are_not_kept_in_memory(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultCache")
+            cache = module.SolverAiResultCache(max_bytes=10)
+
+            cache.put("problem-1", "key-1", build_results("a"))
+
+            self.assertEqual(cache.getStats().entries, 0)
+            self.assertIsNone(cache.get("problem-1", "key-1"))
+
+    def test_invalidate_problem_drops_only_that_problem(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultCache")
+            cache = module.SolverAiResultCache()
+            cache.put("problem-1", "key-1", build_results("a"))
+            cache.put("problem-2", "key-2", build_results("b"))
+
+            cache.invalidateProblem("problem-1")
+
+            self.assertIsNone(cache.get("problem-1", "key-1"))
+            self.assertIsNotNone(cache.get("problem-2", "key-2"))
+            self.assertEqual(cache.getStats().invalidations, 1)
+
+    def test_disk_tier_survives_new_instance_and_promotes_hits(self):
+        with solverai_test_environment() as env, tempfile.TemporaryDirectory() as tmp_dir:
+            module = env.module("SolverAiResultCache")
+            first = module.SolverAiResultCache(disk_dir=tmp_dir)
+            first.put("problem-1", "key-1", build_results("a"))
+
+            second = module.SolverAiResultCache(disk_dir=tmp_dir)
+            self.assertEqual(second.getStats().disk_entries, 1)
+            self.assertEqual(second.get("problem-1", "key-1"), build_results("a"))
+            self.assertEqual(second.get("problem-1", "key-1"), build_results("a"))
+
+            stats = second.getStats()
+            self.assertEqual(stats.disk_hits, 1)
+            self.assertEqual(stats.memory_hits, 1)
+            self.assertEqual(stats.entries, 1)
+
+    def test_disk_tier_is_invalidated_per_problem(self):
+        with solverai_test_environment() as env, tempfile.TemporaryDirectory() as tmp_dir:
+            module = env.module("SolverAiResultCache")
+            cache = module.SolverAiResultCache(disk_dir=tmp_dir)
+            cache.put("problem-1", "key-1", build_results("a"))
+
+            module.SolverAiResultCache(disk_dir=tmp_dir).invalidateProblem(
+                "problem-1"
+            )
+
+            reopened = module.SolverAiResultCache(disk_dir=tmp_dir)
+            self.assertIsNone(reopened.get("problem-1", "key-1"))
+            self.assertEqual(reopened.getStats().disk_bytes_used, 0)
+
+    def test_new_problem_version_invalidates_entries_across_instances(self):
+        with solverai_test_environment() as env, tempfile.TemporaryDirectory() as tmp_dir:
+            module = env.module("SolverAiResultCache")
+            cache = module.SolverAiResultCache(disk_dir=tmp_dir)
+            cache.observeProblemVersion("problem-1", '"v1"')
+            cache.put("problem-1", "key-1", build_results("a"))
+            cache.observeProblemVersion("problem-1", '"v1"')
+
+            self.assertEqual(cache.get("problem-1", "key-1"), build_results("a"))
+
+            reopened = module.SolverAiResultCache(disk_dir=tmp_dir)
+            reopened.observeProblemVersion("problem-1", '"v2"')
+
+            self.assertIsNone(reopened.get("problem-1", "key-1"))
+            self.assertEqual(reopened.getStats().invalidations, 1)
+            self.assertEqual(reopened.getStats().disk_entries, 0)
+
+    def test_keys_differ_per_computer_and_credential(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultCache")
+            key = module.result_cache_key("http://computer:8001", "a", "fingerprint")
+
+            self.assertEqual(
+                key,
+                module.result_cache_key("http://computer:8001", "a", "fingerprint"),
+            )
+            self.assertNotEqual(
+                key,
+                module.result_cache_key("http://other:8001", "a", "fingerprint"),
+            )
+            self.assertNotEqual(
+                key,
+                module.result_cache_key("http://computer:8001", "b", "fingerprint"),
+            )
+
+    def test_disk_tier_evicts_oldest_files_over_budget(self):
+        with solverai_test_environment() as env, tempfile.TemporaryDirectory() as tmp_dir:
+            module = env.module("SolverAiResultCache")
+            probe = module.SolverAiResultCache()
+            probe.put("problem-1", "probe", build_results("a", padding=50))
+            entry_size = probe.getStats().bytes_used
+            cache = module.SolverAiResultCache(
+                max_bytes=0,
+                disk_dir=tmp_dir,
+                disk_max_bytes=entry_size,
+            )
+
+            cache.put("problem-1", "key-a", build_results("a", padding=50))
+            oldest = [
+                os.path.join(root, name)
+                for root, _, names in os.walk(tmp_dir)
+                for name in names
+            ][0]
+            os.utime(oldest, (1, 1))
+            cache.put("problem-1", "key-b", build_results("b", padding=50))
+
+            self.assertIsNone(cache.get("problem-1", "key-a"))
+            self.assertIsNotNone(cache.get("problem-1", "key-b"))
+            self.assertEqual(cache.getStats().disk_entries, 1)
+
+    def test_ttl_expires_memory_entries(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultCache")
+            cache = module.SolverAiResultCache(ttl_seconds=10)
+            original_monotonic = module.monotonic
+            module.monotonic = lambda: 100.0
+            try:
+                cache.put("problem-1", "key-1", build_results("a"))
+                module.monotonic = lambda: 105.0
+                self.assertIsNotNone(cache.get("problem-1", "key-1"))
+                module.monotonic = lambda: 111.0
+                self.assertIsNone(cache.get("problem-1", "key-1"))
+            finally:
+                module.monotonic = original_monotonic
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import multiprocessing
+import unittest
+
+from _solverai_test_support import json_response, solverai_test_environment
+
+
+def build_solver_results_payload(count=3):
+    payload = {
+        "Number Of Results": count,
+        "Objective Variable Names": "['objective']",
+        "Constraint Variable Names": "['constraint']",
+        "Input Variable Names": "['x', 'k']",
+        "Output Variable Names": "['y']",
+    }
+    for index in range(count):
+        payload[f"X{index}"] = f"[{index / 2}, {index}]"
+        payload[f"Y{index}"] = f"[{index * 1.5}]"
+    return payload
+
+
+def solve_body(payload):
+    return json.dumps({"results": payload}).encode("utf-8")
+
+
+@unittest.skipUnless(
+    "fork" in multiprocessing.get_all_start_methods(),
+    "worker processes must inherit the test modules",
+)
+class SolverAiResultsParserTests(unittest.TestCase):
+
+    def build_pool(self, env, **kwargs):
+        module = env.module("SolverAiResultsParser")
+        return module.SolverAiResultsParserPool(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("fork"),
+            **kwargs,
+        )
+
+    def test_workers_are_never_forked_by_default(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultsParser")
+
+            context = module.default_mp_context()
+
+            self.assertIn(context.get_start_method(), ("forkserver", "spawn"))
+
+    def test_numeric_rows_are_packed_into_flat_arrays(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultsParser")
+
+            payload = module.parse_results(build_solver_results_payload())
+
+            kind, flat, width, count = payload["Y"]
+            self.assertEqual((kind, width, count), ("array", 1, 3))
+            self.assertEqual(flat.typecode, "d")
+            self.assertEqual(list(flat), [0.0, 1.5, 3.0])
+            self.assertEqual(payload["X"], ("rows", [[0.0, 0], [0.5, 1], [1.0, 2]]))
+            self.assertNotIn("X0", payload["fields"])
+            self.assertIsNone(payload["raw"])
+
+            results = module.results_from_payload(payload)
+            self.assertEqual(results.getX(), [[0.0, 0], [0.5, 1], [1.0, 2]])
+            self.assertIsInstance(results.getXRow(1)[1], int)
+            self.assertEqual(results.getY(), [[0.0], [1.5], [3.0]])
+            self.assertEqual(results.getInputVariableNames(), ["x", "k"])
+
+    def test_non_numeric_and_ragged_rows_stay_lists(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiResultsParser")
+            results = build_solver_results_payload(2)
+            results["X1"] = "[0.5, None]"
+            results["Y1"] = "[1.5, 2.5]"
+
+            payload = module.parse_results(results, keep_raw=True)
+
+            self.assertEqual(payload["X"], ("rows", [[0.0, 0], [0.5, None]]))
+            self.assertEqual(payload["Y"], ("rows", [[0.0], [1.5, 2.5]]))
+            self.assertIs(payload["raw"], results)
+
+    def test_worker_process_parses_raw_body(self):
+        with solverai_test_environment() as env:
+            with self.build_pool(env, min_body_bytes=0) as pool:
+                results = pool.parse(solve_body(build_solver_results_payload()))
+
+                self.assertEqual(results.getNumberOfResults(), 3)
+                self.assertEqual(results.getY(), [[0.0], [1.5], [3.0]])
+                with self.assertRaisesRegex(Exception, "Failed retrieving data"):
+                    pool.parse(b"{not json")
+                with self.assertRaises(KeyError):
+                    pool.parse(b'{"detail": "none"}')
+
+    def test_client_hands_solve_bodies_to_the_pool(self):
+        with solverai_test_environment() as env:
+            compute_module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            cache_module = env.module("SolverAiResultCache")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            cache = cache_module.SolverAiResultCache()
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+            compute_input.addInput("x", 0.0, 1.0)
+
+            with self.build_pool(env) as pool:
+                client = compute_module.SolverAiClientCompute(
+                    "http://computer:8001",
+                    "token",
+                    "problem-1",
+                    result_cache=cache,
+                    results_parser=pool,
+                )
+                results = client.runSolver(compute_input)
+                cached = client.runSolver(compute_input)
+
+            self.assertIs(client.results_parser, pool)
+            self.assertEqual(results.getX(), [[0.0, 0], [0.5, 1], [1.0, 2]])
+            self.assertEqual(cached.getX(), [[0.0, 0], [0.5, 1], [1.0, 2]])
+            self.assertEqual(env.requests.post.call_count, 1)
+
+    def test_async_client_awaits_worker_parse(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.post.return_value = json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+            compute_input.addInput("x", 0.0, 1.0)
+
+            async def scenario(pool):
+                async with async_module.SolverAiAsyncClientCompute(
+                    "http://computer:8001",
+                    "token",
+                    "problem-1",
+                    results_parser=pool,
+                ) as client:
+                    return await client.runSolver(compute_input)
+
+            with self.build_pool(env, min_body_bytes=0) as pool:
+                results = asyncio.run(scenario(pool))
+
+            self.assertEqual(results.getY(), [[0.0], [1.5], [3.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
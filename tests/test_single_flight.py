@@ -0,0 +1,265 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from _solverai_test_support import (
+    build_solver_results_payload,
+    json_response,
+    solverai_test_environment,
+)
+
+
+def wait_until(condition, timeout_seconds=2.0):
+    deadline = time.monotonic() + timeout_seconds
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.001)
+
+
+class SolverAiSingleFlightTests(unittest.TestCase):
+
+    def build_client(self, env, **kwargs):
+        module = env.module("SolverAiClientCompute")
+        single_flight_module = env.module("SolverAiSingleFlight")
+        single_flight = single_flight_module.SolverAiSingleFlight()
+        client = module.SolverAiClientCompute(
+            "http://computer:8001",
+            "token",
+            "problem-1",
+            single_flight=single_flight,
+            **kwargs,
+        )
+        return client, single_flight
+
+    def build_input(self, env, x_max=1.0):
+        input_module = env.module("SolverAiComputeInput")
+        compute_input = input_module.SolverAiComputeInput("problem-1")
+        compute_input.addInput("x", 0.0, x_max)
+        return compute_input
+
+    def blocking_solve(self, release, response=None):
+        def post(url, **kwargs):
+            release.wait(2)
+            if response is not None:
+                return response
+            return json_response(200, {"results": build_solver_results_payload()})
+        return post
+
+    def test_concurrent_identical_solves_share_one_request(self):
+        with solverai_test_environment() as env:
+            release = threading.Event()
+            env.requests.post.side_effect = self.blocking_solve(release)
+            client, single_flight = self.build_client(env)
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(client.runSolver, self.build_input(env))
+                    for _ in range(4)
+                ]
+                wait_until(lambda: single_flight.getStats().coalesced == 3)
+                release.set()
+                results = [future.result() for future in futures]
+
+            self.assertEqual(env.requests.post.call_count, 1)
+            self.assertTrue(all(result is results[0] for result in results))
+            stats = client.getSingleFlightStats()
+            self.assertEqual(
+                (stats.leaders, stats.coalesced, stats.in_flight),
+                (1, 3, 0),
+            )
+
+    def test_different_payloads_and_later_calls_are_not_coalesced(self):
+        with solverai_test_environment() as env:
+            env.requests.post.side_effect = lambda url, **kwargs: json_response(
+                200,
+                {"results": build_solver_results_payload()},
+            )
+            client, _ = self.build_client(env)
+
+            client.runSolver(self.build_input(env, 1.0))
+            client.runSolver(self.build_input(env, 1.0))
+            client.runSolver(self.build_input(env, 2.0))
+
+            self.assertEqual(env.requests.post.call_count, 3)
+            self.assertEqual(client.getSingleFlightStats().coalesced, 0)
+
+    def test_leader_error_is_raised_by_every_coalesced_call(self):
+        with solverai_test_environment() as env:
+            release = threading.Event()
+            env.requests.post.side_effect = self.blocking_solve(
+                release,
+                json_response(500, "boom"),
+            )
+            client, single_flight = self.build_client(env)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(client.runSolver, self.build_input(env))
+                    for _ in range(3)
+                ]
+                wait_until(lambda: single_flight.getStats().coalesced == 2)
+                release.set()
+                errors = [future.exception() for future in futures]
+
+            self.assertEqual(env.requests.post.call_count, 1)
+            self.assertTrue(all(error is errors[0] for error in errors))
+            self.assertIn("boom", str(errors[0]))
+
+    def test_waiting_call_honours_its_own_deadline(self):
+        with solverai_test_environment() as env:
+            exceptions = env.module("SolverAiClientExceptions")
+            release = threading.Event()
+            env.requests.post.side_effect = self.blocking_solve(release)
+            client, single_flight = self.build_client(env)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                leader = executor.submit(client.runSolver, self.build_input(env))
+                wait_until(lambda: env.requests.post.call_count == 1)
+
+                with self.assertRaises(exceptions.SolverAiDeadlineExceededError):
+                    client.runSolver(self.build_input(env), deadline_seconds=0.05)
+
+                release.set()
+                self.assertEqual(leader.result().getNumberOfResults(), 1)
+
+            self.assertEqual(single_flight.getStats().coalesced, 1)
+
+    def test_waiting_calls_rerun_when_the_leader_deadline_expires(self):
+        with solverai_test_environment() as env:
+            exceptions = env.module("SolverAiClientExceptions")
+            release = threading.Event()
+            solve = self.blocking_solve(release)
+            env.requests.post.side_effect = lambda url, **kwargs: (
+                solve(url, **kwargs) if env.requests.post.call_count == 1
+                else json_response(200, {"results": build_solver_results_payload()})
+            )
+            # The streamed body read is where the late response meets the deadline
+            client, single_flight = self.build_client(env, stream_results=True)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                leader = executor.submit(
+                    client.runSolver,
+                    self.build_input(env),
+                    deadline_seconds=0.05,
+                )
+                wait_until(lambda: env.requests.post.call_count == 1)
+                followers = [
+                    executor.submit(client.runSolver, self.build_input(env))
+                    for _ in range(2)
+                ]
+                wait_until(lambda: single_flight.getStats().coalesced == 2)
+                time.sleep(0.1)
+                release.set()
+
+                with self.assertRaises(exceptions.SolverAiDeadlineExceededError):
+                    leader.result()
+                results = [follower.result() for follower in followers]
+
+            self.assertEqual([result.getNumberOfResults() for result in results], [1, 1])
+            self.assertGreaterEqual(env.requests.post.call_count, 2)
+
+    def test_clients_with_different_tokens_do_not_share_solves(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            release = threading.Event()
+            env.requests.post.side_effect = self.blocking_solve(release)
+            client, single_flight = self.build_client(env)
+            other = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "other-token",
+                "problem-1",
+                single_flight=single_flight,
+            )
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(solver.runSolver, self.build_input(env))
+                    for solver in (client, other, client)
+                ]
+                wait_until(lambda: single_flight.getStats().coalesced == 1)
+                self.assertEqual(single_flight.getStats().leaders, 2)
+                release.set()
+                for future in futures:
+                    future.result()
+
+            self.assertEqual(env.requests.post.call_count, 2)
+
+    def test_async_client_coalesces_identical_solves(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            single_flight_module = env.module("SolverAiSingleFlight")
+            release = threading.Event()
+            env.requests.post.side_effect = self.blocking_solve(release)
+            single_flight = single_flight_module.SolverAiSingleFlight()
+
+            async def scenario():
+                async with async_module.SolverAiAsyncClientCompute(
+                    "http://computer:8001",
+                    "token",
+                    "problem-1",
+                    single_flight=single_flight,
+                ) as client:
+                    solves = [
+                        asyncio.ensure_future(
+                            client.runSolver(self.build_input(env))
+                        )
+                        for _ in range(3)
+                    ]
+                    while single_flight.getStats().coalesced < 2:
+                        await asyncio.sleep(0.001)
+                    # A caller going away does not cancel the shared solve
+                    solves[0].cancel()
+                    release.set()
+                    return await asyncio.gather(*solves[1:])
+
+            results = asyncio.run(scenario())
+
+            self.assertEqual(env.requests.post.call_count, 1)
+            self.assertIs(results[0], results[1])
+            self.assertEqual(single_flight.getStats().in_flight, 0)
+
+    def test_async_waiting_calls_rerun_when_the_leader_deadline_expires(self):
+        with solverai_test_environment() as env:
+            async_module = env.module("SolverAiAsyncClientCompute")
+            exceptions = env.module("SolverAiClientExceptions")
+            single_flight_module = env.module("SolverAiSingleFlight")
+            release = threading.Event()
+            solve = self.blocking_solve(release)
+            env.requests.post.side_effect = lambda url, **kwargs: (
+                solve(url, **kwargs) if env.requests.post.call_count == 1
+                else json_response(200, {"results": build_solver_results_payload()})
+            )
+            single_flight = single_flight_module.SolverAiSingleFlight()
+
+            async def scenario():
+                async with async_module.SolverAiAsyncClientCompute(
+                    "http://computer:8001",
+                    "token",
+                    "problem-1",
+                    single_flight=single_flight,
+                    stream_results=True,
+                ) as client:
+                    leader = asyncio.ensure_future(
+                        client.runSolver(self.build_input(env), deadline_seconds=0.05)
+                    )
+                    while env.requests.post.call_count < 1:
+                        await asyncio.sleep(0.001)
+                    follower = asyncio.ensure_future(
+                        client.runSolver(self.build_input(env))
+                    )
+                    await asyncio.sleep(0.1)
+                    release.set()
+                    return await asyncio.gather(leader, follower, return_exceptions=True)
+
+            leader, follower = asyncio.run(scenario())
+
+            self.assertIsInstance(leader, exceptions.SolverAiDeadlineExceededError)
+            self.assertEqual(follower.getNumberOfResults(), 1)
+            self.assertEqual(env.requests.post.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
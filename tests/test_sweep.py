@@ -0,0 +1,277 @@
+import json
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from _solverai_test_support import json_response, solverai_test_environment
+
+
+def build_base_input(input_module):
+    compute_input = input_module.SolverAiComputeInput("problem-1")
+    compute_input.addInput("x", 0.0, 1.0)
+    compute_input.addInput("k", 3, 3, is_integer=True)
+    compute_input.addConstraint("c", input_module.CONSTRAINT.SMALLER_THAN, 10.0)
+    return compute_input
+
+
+def results_payload(x_max, constraint):
+    return {
+        "Number Of Results": 2,
+        "Objective Variable Names": "['y']",
+        "Constraint Variable Names": "['c']",
+        "Input Variable Names": "['x', 'k']",
+        "Output Variable Names": "['y']",
+        "X0": f"[{x_max}, 1]",
+        "Y0": f"[{constraint}]",
+        "X1": f"[{x_max / 2}, 2]",
+        "Y1": f"[{constraint / 2}]",
+    }
+
+
+class SolverAiSweepTests(unittest.TestCase):
+
+    def test_grid_sweeps_every_level_combination_lazily(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiSweep")
+            Parameter = module.SolverAiSweepParameter
+            base = build_base_input(input_module)
+            base_json = base.getJson()
+            sweep = module.SolverAiSweep(
+                base,
+                [
+                    Parameter.forInput("x", "Max", 1.0, 2.0),
+                    Parameter.forConstraint("c", levels=[5.0, 20.0]),
+                ],
+                grid_levels=3,
+            )
+
+            self.assertEqual(len(sweep), 6)
+            self.assertEqual(sweep.coordinateColumns, ["x.Max", "c.Value1"])
+            points = list(sweep.points())
+            self.assertEqual(points[:3], [(1.0, 5.0), (1.0, 20.0), (1.5, 5.0)])
+
+            point, coordinates, variant = next(iter(sweep.variants()))
+            self.assertEqual((point, coordinates), (0, (1.0, 5.0)))
+            self.assertEqual(variant.inputs["x"]["Max"], 1.0)
+            self.assertEqual(variant.constraints["c"]["Value1"], 5.0)
+            self.assertIs(variant.inputs["k"], base.inputs["k"])
+            self.assertEqual(base.getJson(), base_json)
+
+    def test_value_field_makes_an_input_constant(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiSweep")
+            sweep = module.SolverAiSweep(
+                build_base_input(input_module),
+                [module.SolverAiSweepParameter.forInput(
+                    "x", "Value", levels=[0.25],
+                )],
+            )
+
+            _, _, variant = next(sweep.variants())
+
+            self.assertEqual(
+                variant.inputs["x"],
+                {"Min": 0.25, "Max": 0.25, "Constant": True, "Integer": False},
+            )
+
+    def test_latin_hypercube_covers_every_stratum_once(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiSweep")
+            Parameter = module.SolverAiSweepParameter
+            sweep = module.SolverAiSweep(
+                build_base_input(input_module),
+                [
+                    Parameter.forInput("x", "Max", 0.0, 10.0),
+                    Parameter.forConstraint("c", 100.0, 200.0),
+                ],
+                design="lhs",
+                samples=50,
+                seed=7,
+            )
+
+            points = list(sweep.points())
+
+            self.assertEqual(len(points), 50)
+            self.assertEqual(points, list(sweep.points()))
+            self.assertEqual(
+                sorted(int(x // 0.2) for x, _ in points),
+                list(range(50)),
+            )
+            self.assertEqual(
+                sorted(int((c - 100.0) // 2.0) for _, c in points),
+                list(range(50)),
+            )
+
+    def test_random_design_respects_bounds_and_integer_parameters(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiSweep")
+            sweep = module.SolverAiSweep(
+                build_base_input(input_module),
+                [module.SolverAiSweepParameter.forInput(
+                    "k", "Value", 1, 4, integer=True,
+                )],
+                design="random",
+                samples=200,
+            )
+
+            values = {value for (value,) in sweep.points()}
+
+            self.assertTrue(values <= {1, 2, 3, 4})
+            self.assertTrue(all(isinstance(value, int) for value in values))
+
+    def test_rejects_invalid_sweeps(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            module = env.module("SolverAiSweep")
+            Parameter = module.SolverAiSweepParameter
+            base = build_base_input(input_module)
+
+            with self.assertRaises(ValueError):
+                Parameter.forInput("x", "Value1", 0, 1)
+            with self.assertRaises(ValueError):
+                Parameter.forConstraint("c", 2, 1)
+            with self.assertRaises(ValueError):
+                module.SolverAiSweep(base, [Parameter.forInput("z", "Max", 0, 1)])
+            with self.assertRaises(ValueError):
+                module.SolverAiSweep(
+                    base,
+                    [Parameter.forInput("x", "Max", 0, 1)],
+                    design="lhs",
+                )
+
+    def test_run_collects_results_into_one_tagged_table(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            compute_module = env.module("SolverAiClientCompute")
+            module = env.module("SolverAiSweep")
+            Parameter = module.SolverAiSweepParameter
+
+            def solve(url, **kwargs):
+                payload = json.loads(kwargs["data"])
+                x_max = payload["inputs"]["x"]["Max"]
+                constraint = payload["constraints"]["c"]["Value1"]
+                if x_max == 3.0:
+                    return json_response(500, "boom")
+                return json_response(
+                    200,
+                    {"results": results_payload(x_max, constraint)},
+                )
+
+            env.requests.post.side_effect = solve
+            client = compute_module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+            sweep = module.SolverAiSweep(
+                build_base_input(input_module),
+                [
+                    Parameter.forInput("x", "Max", levels=[2.0, 3.0, 4.0]),
+                    Parameter.forConstraint("c", levels=[8.0]),
+                ],
+            )
+
+            results = sweep.run(client, max_concurrency=2)
+
+            self.assertEqual(results.numberOfPoints, 3)
+            self.assertEqual(list(results.getFailedPoints()), [1])
+            self.assertEqual(results.getFailedPoints()[1][0], (3.0, 8.0))
+            self.assertEqual(len(results), 4)
+            self.assertEqual(
+                results.columns,
+                ["point", "result", "x.Max", "c.Value1", "x", "k", "y"],
+            )
+            rows = sorted(zip(*(results.column(name) for name in results.columns)))
+            self.assertEqual(
+                rows,
+                [
+                    (0, 0, 2.0, 8.0, 2.0, 1.0, 8.0),
+                    (0, 1, 2.0, 8.0, 1.0, 2.0, 4.0),
+                    (2, 0, 4.0, 8.0, 4.0, 1.0, 8.0),
+                    (2, 1, 4.0, 8.0, 2.0, 2.0, 4.0),
+                ],
+            )
+            self.assertEqual(results.getDataFrame().columns, results.columns)
+
+    def test_results_are_added_without_unpacking_their_arrays(self):
+        with solverai_test_environment() as env:
+            np = env.module("SolverAiNumericParser").np
+            if np is None:
+                self.skipTest("numpy is not installed")
+            results_module = env.module("SolverAiComputeResults")
+            module = env.module("SolverAiSweep")
+            results = results_module.SolverAiComputeResults(
+                results_payload(2.0, 8.0),
+            ).compact()
+            table = module.SolverAiSweepResults(["x.Max"])
+
+            table.add(0, (2.0,), results)
+
+            self.assertEqual(list(table.column("x")), [2.0, 1.0])
+            self.assertEqual(list(table.column("k")), [1.0, 2.0])
+            self.assertEqual(list(table.column("y")), [8.0, 4.0])
+            self.assertEqual(list(table.column("result")), [0, 1])
+            blocks = results._SolverAiComputeResults__blocks
+            for block in blocks.values():
+                self.assertIsInstance(block, np.ndarray)
+
+    def test_run_keeps_in_flight_points_bounded(self):
+        with solverai_test_environment() as env:
+            input_module = env.module("SolverAiComputeInput")
+            results_module = env.module("SolverAiComputeResults")
+            module = env.module("SolverAiSweep")
+            lock = threading.Lock()
+            state = {"in_flight": 0, "max_in_flight": 0, "completed": 0}
+
+            def run_solver(input, **kwargs):
+                with lock:
+                    state["in_flight"] += 1
+                    state["max_in_flight"] = max(
+                        state["max_in_flight"],
+                        state["in_flight"],
+                    )
+                time.sleep(0.001)
+                with lock:
+                    state["in_flight"] -= 1
+                    state["completed"] += 1
+                return results_module.SolverAiComputeResults(
+                    results_payload(input.inputs["x"]["Max"], 1.0)
+                )
+
+            client = SimpleNamespace(
+                runSolver=run_solver,
+                transport=SimpleNamespace(pool_maxsize=4),
+            )
+            sweep = module.SolverAiSweep(
+                build_base_input(input_module),
+                [module.SolverAiSweepParameter.forInput("x", "Max", 1.0, 2.0)],
+                design="random",
+                samples=300,
+                seed=1,
+            )
+            variants = sweep.variants
+            ahead = []
+
+            def counting_variants():
+                for generated, item in enumerate(variants(), start=1):
+                    with lock:
+                        ahead.append(generated - state["completed"])
+                    yield item
+
+            sweep.variants = counting_variants
+            results = sweep.run(client)
+
+            self.assertEqual(results.numberOfPoints, 300)
+            self.assertEqual(len(results), 600)
+            self.assertLessEqual(state["max_in_flight"], 4)
+            self.assertLessEqual(max(ahead), 4)
+            self.assertEqual(sorted(set(results.column("point"))), list(range(300)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,297 @@
+import gzip
+import json
+import unittest
+import zlib
+from unittest.mock import Mock
+
+from _solverai_test_support import (
+    FakeStreamedResponse,
+    json_response,
+    solverai_test_environment,
+)
+
+
+class SolverAiTransportTests(unittest.TestCase):
+
+    def test_default_transport_mounts_pooled_adapter_for_both_schemes(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+
+            transport = module.SolverAiTransport(
+                pool_connections=4,
+                pool_maxsize=32,
+                pool_block=True,
+            )
+
+            session = transport.session
+            self.assertEqual(set(session.adapters), {"http://", "https://"})
+            adapter = session.adapters["https://"]
+            self.assertIs(session.adapters["http://"], adapter)
+            self.assertEqual(adapter.pool_connections, 4)
+            self.assertEqual(adapter.pool_maxsize, 32)
+            self.assertTrue(adapter.pool_block)
+
+    def test_rejects_empty_pools(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+
+            with self.assertRaises(ValueError):
+                module.SolverAiTransport(pool_maxsize=0)
+            with self.assertRaises(ValueError):
+                module.SolverAiTransport(pool_connections=0)
+
+    def test_injected_session_is_used_and_not_closed(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+            session = Mock()
+            session.request.return_value = json_response(200, "ready")
+
+            with module.SolverAiTransport(session=session) as transport:
+                response = transport.get("http://computer:8001/x", params=None)
+
+            self.assertEqual(response.status_code, 200)
+            session.request.assert_called_once_with(
+                "GET",
+                "http://computer:8001/x",
+                params=None,
+            )
+            session.mount.assert_not_called()
+            session.close.assert_not_called()
+            env.requests.Session.assert_not_called()
+
+    def test_owned_session_is_closed(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+
+            transport = module.SolverAiTransport()
+            transport.close()
+
+            self.assertTrue(transport.session.closed)
+
+    def test_compute_client_reuses_one_session_for_all_endpoints(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            input_module = env.module("SolverAiComputeInput")
+            env.requests.get.side_effect = [
+                json_response(200, "ready"),
+                json_response(200, {"inputs": ["x"], "outputs": ["y"]}),
+            ]
+            env.requests.post.return_value = json_response(
+                200,
+                {
+                    "results": {
+                        "Number Of Results": 0,
+                        "Objective Variable Names": "[]",
+                        "Constraint Variable Names": "[]",
+                        "Input Variable Names": "['x']",
+                        "Output Variable Names": "['y']",
+                    },
+                },
+            )
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+            )
+
+            client.getProblemStatusInfo()
+            client.getInputsOutputs()
+            client.runSolver(input_module.SolverAiComputeInput("problem-1"))
+
+            env.requests.Session.assert_called_once_with()
+            self.assertEqual(env.requests.get.call_count, 2)
+            self.assertEqual(env.requests.post.call_count, 1)
+
+    def test_compute_clients_can_share_an_injected_transport(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            transport_module = env.module("SolverAiTransport")
+            env.requests.get.return_value = json_response(200, "ready")
+            transport = transport_module.SolverAiTransport()
+
+            first = module.SolverAiClientCompute(
+                "http://computer:8001", "token", "problem-1",
+                transport=transport,
+            )
+            second = module.SolverAiClientCompute(
+                "http://computer:8001", "token", "problem-2",
+                transport=transport,
+            )
+            first.getProblemStatusInfo()
+            second.getProblemStatusInfo()
+            first.close()
+
+            self.assertIs(first.transport, second.transport)
+            env.requests.Session.assert_called_once_with()
+            self.assertFalse(transport.session.closed)
+
+    def test_exchange_compresses_request_bodies_above_threshold(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+            env.requests.post.return_value = json_response(200, {"ok": True})
+            transport = module.SolverAiTransport(
+                request_compression="gzip",
+                request_compression_min_bytes=100,
+            )
+            body = json.dumps({"inputs": {f"x{i}": i for i in range(200)}})
+
+            response = transport.exchange(
+                "POST",
+                "http://computer:8001/solvejson/",
+                headers={"Content-Type": "application/json"},
+                data=body,
+            )
+
+            _, kwargs = env.requests.post.call_args
+            self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+            self.assertEqual(kwargs["headers"]["Accept-Encoding"], "gzip, deflate")
+            self.assertTrue(kwargs["stream"])
+            self.assertEqual(gzip.decompress(kwargs["data"]).decode(), body)
+            stats = response.transfer_stats
+            self.assertEqual(stats.request_bytes, len(body))
+            self.assertEqual(stats.request_wire_bytes, len(kwargs["data"]))
+            self.assertLess(stats.request_wire_bytes, stats.request_bytes)
+            self.assertEqual(stats.request_encoding, "gzip")
+            self.assertEqual(response.json(), {"ok": True})
+
+    def test_exchange_leaves_small_bodies_uncompressed(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+            env.requests.post.return_value = json_response(200, {"ok": True})
+            transport = module.SolverAiTransport(
+                request_compression="deflate",
+                request_compression_min_bytes=1024,
+            )
+
+            response = transport.exchange(
+                "POST",
+                "http://computer:8001/solvejson/",
+                data='{"id": "problem-1"}',
+            )
+
+            _, kwargs = env.requests.post.call_args
+            self.assertNotIn("Content-Encoding", kwargs["headers"])
+            self.assertEqual(kwargs["data"], b'{"id": "problem-1"}')
+            self.assertIsNone(response.transfer_stats.request_encoding)
+            self.assertEqual(
+                response.transfer_stats.request_bytes,
+                response.transfer_stats.request_wire_bytes,
+            )
+
+    def test_exchange_supports_deflate_request_bodies(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+            env.requests.post.return_value = json_response(200, {})
+            transport = module.SolverAiTransport(
+                request_compression="deflate",
+                request_compression_min_bytes=0,
+            )
+
+            transport.exchange("POST", "http://computer:8001/solvejson/", data="x" * 500)
+
+            _, kwargs = env.requests.post.call_args
+            self.assertEqual(kwargs["headers"]["Content-Encoding"], "deflate")
+            self.assertEqual(zlib.decompress(kwargs["data"]), b"x" * 500)
+
+    def test_rejects_unknown_request_compression(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+
+            with self.assertRaises(ValueError):
+                module.SolverAiTransport(request_compression="br")
+
+    def test_exchange_streams_and_decodes_gzip_responses(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+            payload = json.dumps({"results": {f"Y{i}": "[1.0, 2.0]" for i in range(100)}})
+            compressed = gzip.compress(payload.encode())
+            streamed = FakeStreamedResponse(
+                200,
+                compressed,
+                headers={"Content-Encoding": "gzip"},
+                chunk_size=16,
+            )
+            env.requests.get.return_value = streamed
+            transport = module.SolverAiTransport()
+
+            response = transport.exchange("GET", "http://computer:8001/x")
+
+            self.assertEqual(response.text, payload)
+            self.assertEqual(streamed.raw.decode_content_flags, [False])
+            self.assertTrue(streamed.closed)
+            stats = response.transfer_stats
+            self.assertEqual(stats.response_wire_bytes, len(compressed))
+            self.assertEqual(stats.response_bytes, len(payload))
+            self.assertEqual(stats.response_encoding, "gzip")
+
+    def test_exchange_decodes_zlib_and_raw_deflate_responses(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiTransport")
+            payload = b'{"detail": "ok"}' * 20
+            raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            raw_body = raw_deflate.compress(payload) + raw_deflate.flush()
+            env.requests.get.side_effect = [
+                FakeStreamedResponse(
+                    200,
+                    zlib.compress(payload),
+                    headers={"Content-Encoding": "deflate"},
+                ),
+                FakeStreamedResponse(
+                    200,
+                    raw_body,
+                    headers={"Content-Encoding": "deflate"},
+                ),
+            ]
+            transport = module.SolverAiTransport()
+
+            wrapped = transport.exchange("GET", "http://computer:8001/x")
+            raw = transport.exchange("GET", "http://computer:8001/x")
+
+            self.assertEqual(wrapped.content, payload)
+            self.assertEqual(raw.content, payload)
+
+    def test_run_solver_reports_transfer_stats_for_compressed_exchange(self):
+        with solverai_test_environment() as env:
+            module = env.module("SolverAiClientCompute")
+            transport_module = env.module("SolverAiTransport")
+            input_module = env.module("SolverAiComputeInput")
+            payload = json.dumps({
+                "results": {
+                    "Number Of Results": 1,
+                    "Objective Variable Names": "['objective']",
+                    "Constraint Variable Names": "[]",
+                    "Input Variable Names": "['x']",
+                    "Output Variable Names": "['y']",
+                    "X0": "[1.0]",
+                    "Y0": "[2.0]",
+                },
+            }).encode()
+            env.requests.post.return_value = FakeStreamedResponse(
+                200,
+                gzip.compress(payload),
+                headers={"Content-Encoding": "gzip"},
+            )
+            client = module.SolverAiClientCompute(
+                "http://computer:8001",
+                "token",
+                "problem-1",
+                transport=transport_module.SolverAiTransport(
+                    request_compression="gzip",
+                    request_compression_min_bytes=0,
+                ),
+            )
+            compute_input = input_module.SolverAiComputeInput("problem-1")
+            compute_input.addInput("x", 0.0, 1.0)
+
+            results = client.runSolver(compute_input)
+
+            self.assertEqual(results.getY(), [[2.0]])
+            stats = client.getLastTransferStats()
+            self.assertEqual(stats.request_bytes, len(compute_input.getJson()))
+            self.assertEqual(stats.request_encoding, "gzip")
+            self.assertEqual(stats.response_bytes, len(payload))
+            self.assertEqual(stats.response_encoding, "gzip")
+
+
+if __name__ == "__main__":
+    unittest.main()